@@ -21,8 +21,12 @@ from rest_framework_simplejwt.views import (
     TokenBlacklistView,
 )
 from rest_framework_simplejwt.serializers import TokenBlacklistSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import UntypedToken
 from rest_framework.exceptions import AuthenticationFailed
 
+from quiz_app.api.permissions import invalidate_cached_user
+
 from .serializers import RegistrationSerializer
 
 class RegistrationAPIView(APIView):
@@ -165,9 +169,12 @@ class LogoutTokenBlacklistView(TokenBlacklistView):
     def post(self, request, *args, **kwargs):
         """Blacklist the refresh token and clear auth cookies.
 
-        Returns a 200 response with a confirmation message.
+        Returns a 200 response with a confirmation message. The user is
+        also evicted from the authentication user cache.
         """
         response = super().post(request, *args, **kwargs)
+        refresh_token = UntypedToken(request.COOKIES['refresh_token'])
+        invalidate_cached_user(refresh_token[api_settings.USER_ID_CLAIM])
         response.delete_cookie('access_token')
         response.delete_cookie('refresh_token')
         response.data = {'detail': "Log-Out successfully! All Tokens will be deleted. Refresh token is now invalid."}
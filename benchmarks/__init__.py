@@ -0,0 +1,9 @@
+"""End-to-end benchmarks of the quiz generation pipeline.
+
+Run them with ``python manage.py run_benchmarks`` (see
+``quiz_app/management/commands/run_benchmarks.py``). The suite drives
+``generate_quiz_json_from_url`` and ``CreateQuizAPIView`` with synthetic
+fixture audio of several lengths against a local stand-in for the
+Gemini API, and records per-stage wall time, CPU time, peak RSS and
+throughput per concurrency level as JSON so runs can be compared.
+"""
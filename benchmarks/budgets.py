@@ -0,0 +1,23 @@
+"""SQL query budgets of the read endpoints.
+
+Budgets are the maximum number of queries one request may run (JWT
+authentication included) with :data:`BUDGET_QUIZZES` quizzes of ten
+questions in the requesting user's account and empty response and user
+caches.
+``quiz_app.tests.test_query_budgets``
+fails when an endpoint exceeds its budget and the read benchmark
+reports every endpoint against it.
+"""
+
+BUDGET_QUIZZES = 25
+
+QUERY_BUDGETS = {
+    # User lookup, the response cache version, the ETag aggregate, the
+    # quizzes and the prefetched questions of all of them (a response cache
+    # hit needs the first two, a 304 on a cache miss the first three; a
+    # cached user saves the first).
+    'quizzes-list': 5,
+    # User lookup, the response cache version, the ETag aggregate, the
+    # quiz and its questions.
+    'quizzes-detail': 5,
+}
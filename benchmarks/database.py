@@ -0,0 +1,31 @@
+"""Throwaway database for benchmark runs."""
+
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.db import connections
+from django.test.runner import DiscoverRunner
+
+
+@contextmanager
+def throwaway_database(directory):
+    """Run the enclosed block against a fresh, migrated database.
+
+    A SQLite file in ``directory`` is used instead of SQLite's in-memory
+    default for tests, so concurrent requests behave like they do against
+    the real database. The test environment (e.g. ``testserver`` in
+    ``ALLOWED_HOSTS``) is set up as well.
+    """
+    test_settings = connections['default'].settings_dict.setdefault('TEST', {})
+    test_name = test_settings.get('NAME')
+    test_settings['NAME'] = str(Path(directory) / 'benchmark.sqlite3')
+
+    runner = DiscoverRunner(verbosity=0, interactive=False)
+    runner.setup_test_environment()
+    old_config = runner.setup_databases()
+    try:
+        yield
+    finally:
+        runner.teardown_databases(old_config)
+        runner.teardown_test_environment()
+        test_settings['NAME'] = test_name
@@ -0,0 +1,60 @@
+"""Synthetic audio fixtures for the benchmarks.
+
+The fixtures imitate the structure of a lecture rather than its content:
+"sentences" of syllable-rate modulated harmonic tones separated by short
+pauses, longer silent gaps now and then, and a low noise floor. That is
+enough for decoding, silence trimming, chunking and Whisper's compute
+cost to behave like they do on real recordings.
+"""
+
+import wave
+from pathlib import Path
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+# Every GAP_EVERY sentences the speaker pauses for GAP_SECONDS.
+SENTENCE_SECONDS = 3.0
+PAUSE_SECONDS = 0.4
+GAP_EVERY = 8
+GAP_SECONDS = 2.0
+
+
+def synthesize_lecture(seconds, seed=0):
+    """Return ``seconds`` of speech-like 16 kHz mono float32 audio."""
+    rng = np.random.default_rng(seed)
+    total = int(seconds * SAMPLE_RATE)
+    audio = rng.normal(0, 0.002, total).astype(np.float32)
+
+    position, sentence = 0, 0
+    while position < total:
+        length = min(int(SENTENCE_SECONDS * SAMPLE_RATE), total - position)
+        t = np.arange(length) / SAMPLE_RATE
+        pitch = rng.uniform(100, 220)
+        voice = sum(np.sin(2 * np.pi * pitch * harmonic * t) / harmonic for harmonic in range(1, 5))
+        syllables = 0.5 * (1 + np.sin(2 * np.pi * rng.uniform(3, 5) * t)) ** 2
+        audio[position:position + length] += (0.1 * voice * syllables).astype(np.float32)
+
+        sentence += 1
+        pause = GAP_SECONDS if sentence % GAP_EVERY == 0 else PAUSE_SECONDS
+        position += length + int(pause * SAMPLE_RATE)
+    return audio
+
+
+def write_wav(path, audio):
+    """Write float32 samples in [-1, 1] to a 16-bit WAV file."""
+    pcm = (np.clip(audio, -1, 1) * 32767).astype('<i2')
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(pcm.tobytes())
+
+
+def write_fixture(directory, seconds):
+    """Write (or reuse) the fixture of ``seconds`` and return its path."""
+    path = Path(directory) / f"lecture-{int(seconds)}s.wav"
+    if not path.exists():
+        write_wav(path, synthesize_lecture(seconds, seed=int(seconds)))
+    return path
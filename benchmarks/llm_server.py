@@ -0,0 +1,151 @@
+"""Local stand-in for the Gemini ``generateContent`` API.
+
+Quiz generation in the benchmarks goes through the real client code in
+:mod:`quiz_app.api.llm` (connection pool, token budgeting, schema
+validation), only the model is replaced: the server answers after a
+configurable delay with a valid quiz, replacement questions or key
+facts, depending on the prompt. The client tests in
+``quiz_app/tests/test_llm.py`` use the same server; they queue exact
+replies in ``replies`` and inspect the recorded ``requests``.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from quiz_app.api.schema import QUESTION_COUNT
+
+
+def make_questions(count, prefix="Question"):
+    return [
+        {
+            "question_title": f"{prefix} {index + 1} about the lecture?",
+            "question_options": ["Cell", "Atom", "Organ", "Tissue"],
+            "answer": "Cell",
+        }
+        for index in range(count)
+    ]
+
+
+QUESTIONS = make_questions(QUESTION_COUNT)
+QUIZ = {
+    "title": "Benchmark lecture",
+    "description": "A synthetic lecture used by the benchmarks.",
+    "questions": QUESTIONS,
+}
+QUIZ_RESPONSE = json.dumps(QUIZ)
+KEY_FACTS_RESPONSE = "\n".join(f"- Fact {index} of the lecture." for index in range(20))
+
+
+class StandInGeminiHandler(BaseHTTPRequestHandler):
+    """Answer ``generateContent`` calls like the Gemini API would.
+
+    Queued ``server.replies`` are sent first, in order; otherwise the
+    reply is chosen by the prompt.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        prompt = body['contents'][0]['parts'][0]['text']
+        time.sleep(self.server.latency)
+
+        with self.server.lock:
+            self.server.request_count += 1
+            if self.server.record_requests:
+                self.server.requests.append((self.path, self.client_address, body))
+            reply = self.server.replies.pop(0) if self.server.replies else None
+
+        if reply is not None:
+            text = reply
+        elif 'key facts' in prompt:
+            text = KEY_FACTS_RESPONSE
+        elif 'new quiz question' in prompt:
+            text = json.dumps(make_questions(QUESTION_COUNT, prefix="Replacement"))
+        else:
+            text = QUIZ_RESPONSE
+
+        usage = self.server.usage or {
+            "promptTokenCount": len(prompt) // 4,
+            "candidatesTokenCount": len(text) // 4,
+        }
+        payload = json.dumps({
+            "candidates": [{"content": {"role": "model", "parts": [{"text": text}]}, "finishReason": "STOP"}],
+            "usageMetadata": dict(usage, totalTokenCount=usage["promptTokenCount"] + usage["candidatesTokenCount"]),
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInGeminiServer:
+    """Run :class:`StandInGeminiHandler` on a free local port.
+
+    Use as a context manager (or call :meth:`start` / :meth:`stop`);
+    ``base_url`` is the value for ``GEMINI_BASE_URL``.
+
+    Args:
+        latency (float): Seconds each reply is delayed.
+        usage (dict, optional): Fixed ``promptTokenCount`` and
+            ``candidatesTokenCount`` reported for every request; by
+            default they are estimated from the prompt and reply length.
+        record_requests (bool): Keep ``(path, client_address, body)`` of
+            every request in ``requests``. Off for benchmarks, where the
+            bodies would inflate the measured memory.
+    """
+
+    def __init__(self, latency=0.0, usage=None, record_requests=False):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInGeminiHandler)
+        self.server.daemon_threads = True
+        self.server.latency = latency
+        self.server.usage = usage
+        self.server.record_requests = record_requests
+        self.server.lock = threading.Lock()
+        self.server.request_count = 0
+        self.server.requests = []
+        self.server.replies = []
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_port}/"
+
+    @property
+    def request_count(self):
+        return self.server.request_count
+
+    @property
+    def requests(self):
+        return self.server.requests
+
+    @property
+    def replies(self):
+        return self.server.replies
+
+    def reset(self):
+        """Forget recorded requests and queued replies."""
+        with self.server.lock:
+            self.server.request_count = 0
+            self.server.requests.clear()
+            self.server.replies.clear()
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,109 @@
+"""Wall time, CPU time and memory measurement for benchmark scenarios.
+
+CPU time and RSS include the child processes of the benchmark (the
+chunked transcription pool), read from ``/proc`` on Linux. Elsewhere
+only the benchmark process itself is measured and peak RSS falls back
+to ``getrusage``.
+"""
+
+import multiprocessing
+import os
+import resource
+import sys
+import threading
+import time
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+
+def process_rss(pid):
+    """Return the resident set size of ``pid`` in bytes, or ``None``."""
+    try:
+        with open(f'/proc/{pid}/statm') as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        return None
+
+
+def process_cpu(pid):
+    """Return user + system CPU seconds of a live process ``pid``, or 0."""
+    try:
+        with open(f'/proc/{pid}/stat') as stat:
+            fields = stat.read().rsplit(')', 1)[1].split()
+    except OSError:
+        return 0.0
+    # utime and stime are fields 14 and 15 of /proc/<pid>/stat.
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+def child_pids():
+    return [child.pid for child in multiprocessing.active_children()]
+
+
+def cpu_seconds():
+    """Return CPU seconds used by this process and its children so far."""
+    times = os.times()
+    total = times.user + times.system + times.children_user + times.children_system
+    return total + sum(process_cpu(pid) for pid in child_pids())
+
+
+def total_rss():
+    """Return the RSS of this process and its live children in bytes."""
+    own = process_rss(os.getpid())
+    if own is None:
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+        return maxrss if sys.platform == 'darwin' else maxrss * 1024
+    return own + sum(process_rss(pid) or 0 for pid in child_pids())
+
+
+class ResourceMonitor:
+    """Measure wall time, CPU time and peak RSS of the enclosed block.
+
+    RSS is sampled every ``interval`` seconds by a background thread.
+    """
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak_rss = 0
+        self.wall_seconds = None
+        self.cpu_seconds = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak_rss = max(self.peak_rss, total_rss())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._cpu_start = cpu_seconds()
+        self._wall_start = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak_rss = max(self.peak_rss, total_rss())
+        self.wall_seconds = time.perf_counter() - self._wall_start
+        self.cpu_seconds = cpu_seconds() - self._cpu_start
+
+
+def summarize(values):
+    """Return mean, median, p95 and max of ``values`` (seconds) in ms."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def percentile(fraction):
+        return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+    return {
+        'mean_ms': round(sum(ordered) / len(ordered) * 1000, 1),
+        'p50_ms': round(percentile(0.5) * 1000, 1),
+        'p95_ms': round(percentile(0.95) * 1000, 1),
+        'max_ms': round(ordered[-1] * 1000, 1),
+        'count': len(ordered),
+    }
@@ -0,0 +1,130 @@
+"""Load benchmark of the quiz read endpoints.
+
+Seeds a throwaway database (see :mod:`quiz_app.seeding`) and sends
+authenticated requests to ``/api/quizzes/`` and ``/api/quizzes/<pk>/``
+from several threads, recording latency percentiles, requests per
+second and SQL queries per request, the latter against
+:data:`benchmarks.budgets.QUERY_BUDGETS`.
+"""
+
+import itertools
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections, connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from quiz_app.models import Quiz
+from quiz_app.seeding import seed_quizzes
+
+from .budgets import QUERY_BUDGETS
+from .database import throwaway_database
+from .measure import ResourceMonitor
+
+ENDPOINTS = ('quizzes-list', 'quizzes-detail')
+
+
+def percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def build_targets(users):
+    """Return ``(auth header, {endpoint: [paths]})`` for every seeded user."""
+    targets = []
+    for user in users:
+        header = f"Bearer {AccessToken.for_user(user)}"
+        quiz_ids = Quiz.objects.filter(creator=user).values_list('id', flat=True)
+        targets.append((header, {
+            'quizzes-list': [reverse('quizzes-list')],
+            'quizzes-detail': [reverse('quizzes-detail', kwargs={'pk': pk}) for pk in quiz_ids],
+        }))
+    return targets
+
+
+def send_requests(endpoint, targets, requests, concurrency):
+    """Send ``requests`` GET requests to ``endpoint`` and return the result dict."""
+    plan = [
+        (header, paths[endpoint][index % len(paths[endpoint])])
+        for index, (header, paths) in zip(range(requests), itertools.cycle(targets))
+    ]
+
+    def get(item):
+        header, path = item
+        client = APIClient()
+        # The log is capped; start empty so long runs count correctly.
+        connection.queries_log.clear()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = client.get(path, HTTP_AUTHORIZATION=header)
+                elapsed = time.perf_counter() - started
+            return elapsed, len(queries), len(response.content), response.status_code
+        finally:
+            close_old_connections()
+
+    with ResourceMonitor() as monitor:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples = list(executor.map(get, plan))
+
+    latencies = sorted(sample[0] for sample in samples)
+    query_counts = [sample[1] for sample in samples]
+    budget = QUERY_BUDGETS.get(endpoint)
+    return {
+        'endpoint': endpoint,
+        'concurrency': concurrency,
+        'requests': len(samples),
+        'errors': sum(1 for sample in samples if sample[3] != 200),
+        'requests_per_second': round(len(samples) / monitor.wall_seconds, 1),
+        'p50_ms': round(percentile(latencies, 0.5) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'max_ms': round(latencies[-1] * 1000, 2),
+        'queries_per_request': round(sum(query_counts) / len(query_counts), 2),
+        'max_queries': max(query_counts),
+        'query_budget': budget,
+        'mean_response_bytes': round(sum(sample[2] for sample in samples) / len(samples)),
+        'cpu_seconds': round(monitor.cpu_seconds, 3),
+        'peak_rss_mb': round(monitor.peak_rss / 2 ** 20, 1),
+    }
+
+
+def run_read_benchmark(users=5, quizzes_per_user=100, requests=200, concurrency_levels=(1, 4),
+                       endpoints=ENDPOINTS, report=print):
+    """Seed a throwaway database and benchmark the read endpoints.
+
+    Note that per-user budgets in :data:`QUERY_BUDGETS` assume
+    :data:`~benchmarks.budgets.BUDGET_QUIZZES` quizzes per user; with
+    more quizzes, endpoints whose query count grows with the account
+    size show up over budget.
+
+    Returns:
+        dict: The seeding parameters and one result per endpoint and
+        concurrency level.
+    """
+    results = {
+        'seed': {'users': users, 'quizzes_per_user': quizzes_per_user, 'questions_per_quiz': 10},
+        'results': [],
+    }
+    with tempfile.TemporaryDirectory(prefix='quizly-read-bench-') as workdir, throwaway_database(workdir):
+        started = time.perf_counter()
+        seeded = seed_quizzes(users, quizzes_per_user, prefix='bench')
+        results['seed']['seconds'] = round(time.perf_counter() - started, 2)
+        targets = build_targets(seeded)
+
+        for endpoint in endpoints:
+            # One untimed request per endpoint warms up URL resolution and caches.
+            send_requests(endpoint, targets, 1, 1)
+            for concurrency in concurrency_levels:
+                result = send_requests(endpoint, targets, requests, concurrency)
+                results['results'].append(result)
+                over = result['max_queries'] > (result['query_budget'] or float('inf'))
+                report(
+                    f"{endpoint} x{concurrency}: {result['requests_per_second']} req/s, "
+                    f"p50 {result['p50_ms']} ms, p99 {result['p99_ms']} ms, "
+                    f"{result['queries_per_request']} queries/request"
+                    + (f" (over budget of {result['query_budget']})" if over else "")
+                )
+    return results
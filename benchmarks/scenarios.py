@@ -0,0 +1,149 @@
+"""Benchmark scenarios.
+
+Each scenario runs a number of quiz generations at a given concurrency
+inside a :class:`~benchmarks.measure.ResourceMonitor` and returns a
+result dict with totals, throughput and per-stage timing summaries.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import close_old_connections
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from quiz_app.api.backends import generate_quiz_json_from_url
+from quiz_app.api.metrics import track_run
+
+from .measure import ResourceMonitor, summarize
+
+BENCHMARK_USERNAME = 'benchmark'
+
+STARTUP_SCRIPT = """
+import json, resource, time
+started = time.perf_counter()
+import django
+django.setup()
+import core.urls
+print(json.dumps({
+    'seconds': time.perf_counter() - started,
+    'maxrss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}))
+"""
+
+
+def video_urls(count, offset=0):
+    """Return ``count`` distinct YouTube URLs so no run hits a cache."""
+    return [f"https://www.youtube.com/watch?v=bench{offset + index:06d}" for index in range(count)]
+
+
+def run_concurrently(task, urls, concurrency):
+    """Run ``task(url)`` for every url on ``concurrency`` threads.
+
+    Returns:
+        tuple[list, list, ResourceMonitor]: The stage timings (dicts of
+        seconds) of the successful runs, the errors of the failed runs
+        and the monitor.
+    """
+    def guarded(url):
+        try:
+            return task(url)
+        except Exception as exc:
+            return exc
+        finally:
+            close_old_connections()
+
+    with ResourceMonitor() as monitor:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            outcomes = list(executor.map(guarded, urls))
+
+    stages = [outcome for outcome in outcomes if not isinstance(outcome, Exception)]
+    errors = [repr(outcome) for outcome in outcomes if isinstance(outcome, Exception)]
+    return stages, errors, monitor
+
+
+def build_result(name, concurrency, stages, errors, monitor, **extra):
+    """Return the JSON-serializable result of one scenario run."""
+    runs = len(stages) + len(errors)
+    stage_names = sorted({name for run in stages for name in run})
+    return {
+        'scenario': name,
+        'concurrency': concurrency,
+        'runs': runs,
+        'errors': errors,
+        'wall_seconds': round(monitor.wall_seconds, 3),
+        'cpu_seconds': round(monitor.cpu_seconds, 3),
+        'peak_rss_mb': round(monitor.peak_rss / 2 ** 20, 1),
+        'throughput_per_minute': round(len(stages) / monitor.wall_seconds * 60, 2) if monitor.wall_seconds else 0,
+        'stages': {
+            stage: summarize([run[stage] for run in stages if stage in run]) for stage in stage_names
+        },
+        **extra,
+    }
+
+
+def pipeline_run(url):
+    """Run ``generate_quiz_json_from_url`` once and return its stage timings."""
+    with track_run(video_url=url, benchmark=True) as run:
+        generate_quiz_json_from_url(url)
+    return {**run.stages, 'total': run.duration}
+
+
+def api_run(url):
+    """POST ``url`` to createQuiz and return the stages from ``Server-Timing``."""
+    client = APIClient()
+    client.force_authenticate(user=get_user_model().objects.get(username=BENCHMARK_USERNAME))
+    response = client.post(reverse('create-quiz'), {'url': url}, format='json')
+    if response.status_code != 201:
+        raise RuntimeError(f"createQuiz returned {response.status_code}: {response.content[:200]!r}")
+    return parse_server_timing(response['Server-Timing'])
+
+
+def parse_server_timing(header):
+    """Return ``{name: seconds}`` from a ``Server-Timing`` header value."""
+    stages = {}
+    for entry in header.split(','):
+        name, _, duration = entry.strip().partition(';dur=')
+        if name and duration:
+            stages[name] = float(duration) / 1000
+    return stages
+
+
+def run_pipeline_scenario(urls, concurrency, **extra):
+    stages, errors, monitor = run_concurrently(pipeline_run, urls, concurrency)
+    return build_result('pipeline', concurrency, stages, errors, monitor, **extra)
+
+
+def run_api_scenario(urls, concurrency, **extra):
+    get_user_model().objects.get_or_create(username=BENCHMARK_USERNAME)
+    stages, errors, monitor = run_concurrently(api_run, urls, concurrency)
+    return build_result('api', concurrency, stages, errors, monitor, **extra)
+
+
+def run_startup_scenario(repeats):
+    """Measure cold import time and RSS of the web application.
+
+    Each repeat imports Django and the URL configuration in a fresh
+    interpreter, which is what every new web worker pays.
+    """
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'core.settings'))
+    seconds, rss = [], []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, '-c', STARTUP_SCRIPT],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True
+        ).stdout
+        report = json.loads(output.strip().splitlines()[-1])
+        seconds.append(report['seconds'])
+        rss.append(report['maxrss_kb'])
+    return {
+        'scenario': 'startup',
+        'runs': repeats,
+        'import': summarize(seconds),
+        'peak_rss_mb': round(max(rss) / 1024, 1),
+    }
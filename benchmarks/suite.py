@@ -0,0 +1,136 @@
+"""Run the benchmark scenarios in an isolated environment.
+
+The suite runs against a throwaway SQLite database, a local stand-in
+Gemini server and fixture audio served by
+:class:`quiz_app.api.stubs.FixtureAudioFetcher`. The transcript cache
+and captions are disabled so every run goes through the full pipeline.
+Transcription uses Whisper unless the canned stub is selected.
+"""
+
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.test.utils import override_settings
+
+from quiz_app.api import llm
+
+from .database import throwaway_database
+from .fixtures import write_fixture
+from .llm_server import StandInGeminiServer
+from .scenarios import run_api_scenario, run_pipeline_scenario, run_startup_scenario, video_urls
+
+SCENARIOS = ('pipeline', 'api', 'startup')
+
+TRANSCRIBERS = {
+    'whisper': 'quiz_app.api.backends.WhisperTranscriber',
+    'stub': 'quiz_app.api.stubs.CannedTranscriber',
+}
+
+PIPELINE_SCENARIOS = {
+    'pipeline': run_pipeline_scenario,
+    'api': run_api_scenario,
+}
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def describe_environment(transcriber, llm_latency):
+    """Return the settings and machine details a result depends on."""
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'transcriber': transcriber,
+        'llm_latency_seconds': llm_latency,
+        'settings': {
+            name: getattr(settings, name) for name in (
+                'WHISPER_MODEL', 'WHISPER_USE_CUDA', 'WHISPER_VAD_ENABLED', 'WHISPER_CHUNKED_ENABLED',
+                'WHISPER_CHUNKED_MIN_SECONDS', 'WHISPER_CHUNK_WORKERS', 'QUIZ_PIPELINE_CONCURRENCY',
+                'QUIZ_TRANSCRIPT_TOKEN_BUDGET',
+            )
+        },
+    }
+
+
+def run_suite(scenarios=SCENARIOS, durations=(30, 120), concurrency_levels=(1, 4), runs=4,
+              transcriber='whisper', llm_latency=1.0, warmup=True, report=print):
+    """Run the selected scenarios and return all results as a dict.
+
+    Args:
+        scenarios (iterable[str]): Names from :data:`SCENARIOS`.
+        durations (iterable[float]): Fixture audio lengths in seconds.
+        concurrency_levels (iterable[int]): Parallel runs to measure.
+        runs (int): Quiz generations per concurrency level.
+        transcriber (str): ``'whisper'`` or ``'stub'``.
+        llm_latency (float): Seconds the stand-in LLM takes per request.
+        warmup (bool): Run one untimed generation per fixture first so
+            model loading and pool start-up are not measured.
+        report (callable): Called with a progress message per result.
+    """
+    results = {'environment': describe_environment(transcriber, llm_latency), 'results': []}
+
+    if 'startup' in scenarios:
+        result = run_startup_scenario(max(1, runs))
+        results['results'].append(result)
+        report(f"startup: import {result['import']['mean_ms']} ms, {result['peak_rss_mb']} MB")
+
+    selected = [name for name in scenarios if name in PIPELINE_SCENARIOS]
+    if not selected:
+        return results
+
+    with tempfile.TemporaryDirectory(prefix='quizly-bench-') as workdir, \
+            StandInGeminiServer(latency=llm_latency) as server:
+        overrides = override_settings(
+            GEMINI_BASE_URL=server.base_url,
+            GEMINI_API_KEY='benchmark',
+            QUIZ_FETCHER_BACKEND='quiz_app.api.stubs.FixtureAudioFetcher',
+            QUIZ_TRANSCRIBER_BACKEND=TRANSCRIBERS[transcriber],
+            QUIZ_GENERATOR_BACKEND='quiz_app.api.backends.GeminiGenerator',
+            QUIZ_CAPTIONS_ENABLED=False,
+            QUIZ_AUDIO_STREAMING=False,
+            TRANSCRIPT_CACHE_ENABLED=False,
+        )
+        with overrides, throwaway_database(workdir):
+            llm.reset_clients()
+            try:
+                offset = 0
+                for seconds in durations:
+                    fixture_dir = Path(workdir) / f"fixtures-{int(seconds)}"
+                    fixture_dir.mkdir()
+                    write_fixture(fixture_dir, seconds)
+                    with override_settings(QUIZ_STUB_AUDIO_DIR=str(fixture_dir)):
+                        for name in selected:
+                            if warmup:
+                                PIPELINE_SCENARIOS[name](video_urls(1, offset), 1)
+                                offset += 1
+                            for concurrency in concurrency_levels:
+                                urls = video_urls(runs, offset)
+                                offset += runs
+                                result = PIPELINE_SCENARIOS[name](urls, concurrency, audio_seconds=seconds)
+                                results['results'].append(result)
+                                report(
+                                    f"{name} {int(seconds)}s x{concurrency}: "
+                                    f"{result['throughput_per_minute']} quizzes/min, "
+                                    f"total p50 {result['stages'].get('total', {}).get('p50_ms')} ms, "
+                                    f"{result['peak_rss_mb']} MB, {len(result['errors'])} errors"
+                                )
+            finally:
+                llm.reset_clients()
+
+    results['environment']['llm_requests'] = server.request_count
+    return results
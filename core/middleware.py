@@ -0,0 +1,162 @@
+"""Project-wide middleware.
+
+:class:`CompressionMiddleware` compresses responses with Brotli or gzip,
+whichever the client prefers in ``Accept-Encoding`` (Brotli on ties).
+Only content types listed in ``RESPONSE_COMPRESSION_TYPES`` (JSON and
+plain text by default) are compressed: HTML pages carry CSRF tokens, and
+compressing them next to reflected input would expose them to BREACH.
+Bodies shorter than ``RESPONSE_COMPRESSION_MIN_BYTES`` are sent as is,
+since the framing overhead outweighs the savings.
+
+The same bytes are often served many times (cached quiz responses,
+unchanged lists), so compressed bodies are kept in a per-process LRU
+cache of ``RESPONSE_COMPRESSION_CACHE_BYTES`` keyed by a hash of the
+uncompressed body; a repeated payload costs a SHA-1 instead of a
+compression run.
+
+Strong ETags stay strong: the encoding is appended to the tag
+(``"abc"`` becomes ``"abc-br"``) and stripped again from incoming
+``If-None-Match`` / ``If-Match`` headers, so conditional requests and
+``If-Match`` updates keep working for clients that accept compression.
+A 304 answering an ``If-None-Match`` for a compressed representation
+gets that representation's suffixed ETag and ``Vary: Accept-Encoding``
+back, like the 200 it stands in for.
+"""
+
+import gzip
+import hashlib
+import re
+import threading
+
+import brotli
+from cachetools import LRUCache
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+ENCODINGS = ('br', 'gzip')
+ETAG_SUFFIX_RE = re.compile(r'-(br|gzip)"')
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_compressed_cache():
+    """Return the process-wide cache of compressed bodies (``None`` if disabled)."""
+    global _cache
+    if _cache is None and settings.RESPONSE_COMPRESSION_CACHE_BYTES > 0:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LRUCache(maxsize=settings.RESPONSE_COMPRESSION_CACHE_BYTES, getsizeof=len)
+    return _cache
+
+
+def reset_compressed_cache():
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+def negotiate_encoding(accept_encoding):
+    """Return the preferred of ``br``/``gzip`` in an Accept-Encoding value, or ``None``."""
+    qualities = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        match = re.search(r'q\s*=\s*([0-9.]+)', params)
+        if match:
+            try:
+                quality = float(match.group(1))
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+
+    best, best_quality = None, 0.0
+    for coding in ENCODINGS:
+        quality = qualities.get(coding, qualities.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compress(body, encoding):
+    """Return ``body`` compressed with ``encoding``, from the cache when possible."""
+    cache = get_compressed_cache()
+    if cache is None:
+        return _compress(body, encoding)
+
+    key = (encoding, hashlib.sha1(body).digest())
+    with _cache_lock:
+        compressed = cache.get(key)
+    if compressed is None:
+        compressed = _compress(body, encoding)
+        if len(compressed) <= cache.maxsize:
+            with _cache_lock:
+                cache[key] = compressed
+    return compressed
+
+
+def _compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=settings.RESPONSE_COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.RESPONSE_COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """Compress responses with Brotli or gzip (see the module docstring)."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        # Encodings of the representations the client holds.
+        cached_encodings = set(ETAG_SUFFIX_RE.findall(request.META.get('HTTP_IF_NONE_MATCH', '')))
+        for header in ('HTTP_IF_NONE_MATCH', 'HTTP_IF_MATCH'):
+            if header in request.META:
+                request.META[header] = ETAG_SUFFIX_RE.sub('"', request.META[header])
+
+        response = self.get_response(request)
+        if not settings.RESPONSE_COMPRESSION_ENABLED:
+            return response
+        if response.status_code == 304:
+            return self.process_not_modified(request, response, cached_encodings)
+        return self.process_response(request, response)
+
+    def process_not_modified(self, request, response, cached_encodings):
+        """Restore the encoding suffix of the ETag the client's copy carries."""
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        etag = response.get('ETag')
+        if encoding in cached_encodings and etag and etag.endswith('"'):
+            response['ETag'] = f'{etag[:-1]}-{encoding}"'
+        return response
+
+    def process_response(self, request, response):
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if not content_type.startswith(tuple(settings.RESPONSE_COMPRESSION_TYPES)):
+            return response
+
+        # The representation depends on Accept-Encoding even when this
+        # response is not compressed.
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if len(response.content) < settings.RESPONSE_COMPRESSION_MIN_BYTES:
+            return response
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        compressed = compress(response.content, encoding)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        etag = response.get('ETag')
+        if etag and etag.endswith('"'):
+            response['ETag'] = f'{etag[:-1]}-{encoding}"'
+        return response
@@ -31,6 +31,124 @@ DEBUG = env("DEBUG", default=False)
 
 GEMINI_API_KEY = env("GEMINI_API_KEY")
 
+# Gemini client, shared per process. GEMINI_BASE_URL points it at another
+# endpoint (e.g. a local stand-in server); GEMINI_TIMEOUT is in seconds.
+GEMINI_MODEL = env("GEMINI_MODEL", default="gemini-2.5-flash")
+GEMINI_BASE_URL = env("GEMINI_BASE_URL", default=None)
+GEMINI_TIMEOUT = env.float("GEMINI_TIMEOUT", default=120.0)
+GEMINI_MAX_CONNECTIONS = env.int("GEMINI_MAX_CONNECTIONS", default=10)
+GEMINI_KEEPALIVE_EXPIRY = env.float("GEMINI_KEEPALIVE_EXPIRY", default=60.0)
+
+# Transcripts over QUIZ_TRANSCRIPT_TOKEN_BUDGET tokens are split into
+# QUIZ_MAP_CHUNK_TOKENS chunks whose key facts are extracted in parallel
+# (QUIZ_MAP_CONCURRENCY requests at a time) before the quiz prompt runs.
+QUIZ_TOKEN_ENCODING = env("QUIZ_TOKEN_ENCODING", default="cl100k_base")
+QUIZ_TRANSCRIPT_TOKEN_BUDGET = env.int("QUIZ_TRANSCRIPT_TOKEN_BUDGET", default=24000)
+QUIZ_MAP_CHUNK_TOKENS = env.int("QUIZ_MAP_CHUNK_TOKENS", default=8000)
+QUIZ_MAP_CONCURRENCY = env.int("QUIZ_MAP_CONCURRENCY", default=4)
+QUIZ_MAP_SUMMARY_WORDS = env.int("QUIZ_MAP_SUMMARY_WORDS", default=400)
+QUIZ_MAP_MAX_ROUNDS = env.int("QUIZ_MAP_MAX_ROUNDS", default=3)
+
+# Follow-up LLM calls allowed to replace invalid questions (or an unusable
+# quiz) before quiz generation fails.
+QUIZ_REPAIR_ATTEMPTS = env.int("QUIZ_REPAIR_ATTEMPTS", default=2)
+
+# Whisper transcription. Models are loaded once per process and shared by
+# all requests; set WHISPER_PRELOAD to load (and warm up) WHISPER_MODELS
+# when the app registry is ready instead of on the first quiz request.
+WHISPER_MODEL = env("WHISPER_MODEL", default="tiny")
+WHISPER_MODELS = env.list("WHISPER_MODELS", default=[WHISPER_MODEL])
+WHISPER_USE_CUDA = env.bool("WHISPER_USE_CUDA", default=False)
+WHISPER_PRELOAD = env.bool("WHISPER_PRELOAD", default=False)
+WHISPER_WARMUP = env.bool("WHISPER_WARMUP", default=True)
+
+# Voice activity pre-pass: stretches of at least WHISPER_VAD_MIN_GAP
+# seconds quieter than WHISPER_VAD_THRESHOLD_DB dBFS are cut before
+# transcription. A positive WHISPER_VAD_MUSIC_MODULATION_DB also cuts
+# loud but steady audio (music beds) whose level varies less than that.
+WHISPER_VAD_ENABLED = env.bool("WHISPER_VAD_ENABLED", default=True)
+WHISPER_VAD_THRESHOLD_DB = env.float("WHISPER_VAD_THRESHOLD_DB", default=-45.0)
+WHISPER_VAD_MIN_GAP = env.float("WHISPER_VAD_MIN_GAP", default=1.0)
+WHISPER_VAD_PADDING = env.float("WHISPER_VAD_PADDING", default=0.25)
+WHISPER_VAD_MUSIC_MODULATION_DB = env.float("WHISPER_VAD_MUSIC_MODULATION_DB", default=0.0)
+
+# Audio longer than WHISPER_CHUNKED_MIN_SECONDS is split at silences into
+# ~WHISPER_CHUNK_SECONDS chunks (plus WHISPER_CHUNK_OVERLAP seconds of
+# context on both sides) that WHISPER_CHUNK_WORKERS processes transcribe
+# in parallel. Every worker loads its own copy of the model, so each one
+# adds that model's memory (about 1 GB for "base", 10 GB for "large") on
+# top of the serving process; raise it only where memory allows.
+WHISPER_CHUNKED_ENABLED = env.bool("WHISPER_CHUNKED_ENABLED", default=True)
+WHISPER_CHUNKED_MIN_SECONDS = env.int("WHISPER_CHUNKED_MIN_SECONDS", default=600)
+WHISPER_CHUNK_SECONDS = env.int("WHISPER_CHUNK_SECONDS", default=120)
+WHISPER_CHUNK_OVERLAP = env.float("WHISPER_CHUNK_OVERLAP", default=2.0)
+WHISPER_CHUNK_WORKERS = env.int("WHISPER_CHUNK_WORKERS", default=2)
+
+# Transcript cache, keyed by YouTube video id and Whisper model. Entries
+# expire after TRANSCRIPT_CACHE_MAX_AGE seconds; above
+# TRANSCRIPT_CACHE_MAX_BYTES (compressed) the least recently used go first.
+TRANSCRIPT_CACHE_ENABLED = env.bool("TRANSCRIPT_CACHE_ENABLED", default=True)
+TRANSCRIPT_CACHE_MAX_BYTES = env.int("TRANSCRIPT_CACHE_MAX_BYTES", default=256 * 1024 * 1024)
+TRANSCRIPT_CACHE_MAX_AGE = env.int("TRANSCRIPT_CACHE_MAX_AGE", default=30 * 24 * 3600)
+
+# Every pipeline run gets its own temporary workspace (on /dev/shm when
+# available unless QUIZ_WORKSPACE_DIR is set). QUIZ_PIPELINE_CONCURRENCY
+# limits how many runs download/transcribe at once in one process.
+QUIZ_WORKSPACE_DIR = env("QUIZ_WORKSPACE_DIR", default=None)
+QUIZ_PIPELINE_CONCURRENCY = env.int("QUIZ_PIPELINE_CONCURRENCY", default=2)
+
+# Use the video's own (or YouTube's automatic) captions in the listed
+# languages when available instead of transcribing the audio.
+QUIZ_CAPTIONS_ENABLED = env.bool("QUIZ_CAPTIONS_ENABLED", default=True)
+QUIZ_CAPTION_LANGUAGES = env.list("QUIZ_CAPTION_LANGUAGES", default=["en"])
+QUIZ_CAPTIONS_MIN_WORDS = env.int("QUIZ_CAPTIONS_MIN_WORDS", default=50)
+
+# Stream the audio straight from YouTube through ffmpeg into memory
+# instead of downloading a file first (falls back to the download).
+QUIZ_AUDIO_STREAMING = env.bool("QUIZ_AUDIO_STREAMING", default=True)
+# Seconds ffmpeg may take to decode one audio source (0 disables the limit).
+QUIZ_AUDIO_DECODE_TIMEOUT = env.int("QUIZ_AUDIO_DECODE_TIMEOUT", default=900)
+
+# Pipeline backends (dotted paths, see quiz_app/api/backends.py). The
+# offline stand-ins in quiz_app.api.stubs need neither network nor GPU;
+# QUIZ_STUB_* configure their fixture audio, canned transcript and
+# simulated latency (seconds).
+QUIZ_FETCHER_BACKEND = env("QUIZ_FETCHER_BACKEND", default="quiz_app.api.backends.YouTubeFetcher")
+QUIZ_TRANSCRIBER_BACKEND = env("QUIZ_TRANSCRIBER_BACKEND", default="quiz_app.api.backends.WhisperTranscriber")
+QUIZ_GENERATOR_BACKEND = env("QUIZ_GENERATOR_BACKEND", default="quiz_app.api.backends.GeminiGenerator")
+QUIZ_STUB_AUDIO_DIR = env("QUIZ_STUB_AUDIO_DIR", default=None)
+QUIZ_STUB_AUDIO_SECONDS = env.float("QUIZ_STUB_AUDIO_SECONDS", default=60.0)
+QUIZ_STUB_TRANSCRIPT = env("QUIZ_STUB_TRANSCRIPT", default=None)
+QUIZ_STUB_TRANSCRIBE_LATENCY = env.float("QUIZ_STUB_TRANSCRIBE_LATENCY", default=0.0)
+QUIZ_STUB_GENERATE_LATENCY = env.float("QUIZ_STUB_GENERATE_LATENCY", default=0.0)
+
+# Background quiz generation. When QUIZ_GENERATION_ASYNC is set (or the
+# client posts to createQuiz with ?async=1) the request only enqueues a
+# QuizGenerationJob and `manage.py run_quiz_workers` does the work.
+QUIZ_GENERATION_ASYNC = env.bool("QUIZ_GENERATION_ASYNC", default=False)
+QUIZ_WORKERS = env.int("QUIZ_WORKERS", default=2)
+QUIZ_JOB_POLL_INTERVAL = env.float("QUIZ_JOB_POLL_INTERVAL", default=1.0)
+QUIZ_JOB_STALE_AFTER = env.int("QUIZ_JOB_STALE_AFTER", default=3600)
+
+# Keyset pagination of the quiz list (used when a client passes page_size
+# or cursor): default and maximum quizzes per page.
+QUIZ_LIST_PAGE_SIZE = env.int("QUIZ_LIST_PAGE_SIZE", default=20)
+QUIZ_LIST_MAX_PAGE_SIZE = env.int("QUIZ_LIST_MAX_PAGE_SIZE", default=100)
+
+# How long (seconds) tombstones of deleted quizzes are kept for clients
+# syncing the quiz list with ?updated_since=. Older timestamps answer 410.
+QUIZ_SYNC_TOMBSTONE_MAX_AGE = env.int("QUIZ_SYNC_TOMBSTONE_MAX_AGE", default=30 * 24 * 3600)
+# Sync watermarks lag the poll by this many seconds, so writes that
+# commit after the poll but were stamped before it are not skipped. It
+# must exceed the longest quiz write transaction.
+QUIZ_SYNC_WATERMARK_LAG = env.int("QUIZ_SYNC_WATERMARK_LAG", default=30)
+
+# Cache of serialized quiz list/detail responses (see
+# quiz_app.api.response_cache). Entries are invalidated on every write and
+# expire after QUIZ_RESPONSE_CACHE_TIMEOUT seconds.
+QUIZ_RESPONSE_CACHE_ENABLED = env.bool("QUIZ_RESPONSE_CACHE_ENABLED", default=True)
+QUIZ_RESPONSE_CACHE_TIMEOUT = env.int("QUIZ_RESPONSE_CACHE_TIMEOUT", default=3600)
+
 ALLOWED_HOSTS = []
 
 
@@ -54,6 +172,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -93,6 +212,17 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Per-process memory by default; set CACHE_URL (e.g.
+# filecache:///var/tmp/quizly or rediscache://127.0.0.1:6379/1) to share
+# cached responses between processes.
+
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -135,18 +265,68 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
+# Logging: quiz_app logs one structured JSON line per pipeline run at INFO
+# on the `quiz_app.pipeline` logger (see quiz_app/api/metrics.py); set
+# QUIZ_LOG_LEVEL=INFO to print them.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'quiz_app': {
+            'handlers': ['console'],
+            'level': env("QUIZ_LOG_LEVEL", default="WARNING"),
+        },
+    },
+}
+
+# /api/metrics/ answers only requests with "Authorization: Bearer
+# <METRICS_TOKEN>"; without a token the endpoint is disabled.
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'quiz_app.api.permissions.CookieJWTAuthentication',
-    )
+    ),
+    # orjson when installed, DRF's JSON renderer otherwise (same output).
+    'DEFAULT_RENDERER_CLASSES': (
+        'quiz_app.api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 
+# Brotli/gzip compression of API responses (core.middleware). Only the
+# listed content types at least RESPONSE_COMPRESSION_MIN_BYTES long are
+# compressed; RESPONSE_COMPRESSION_CACHE_BYTES of compressed bodies are
+# kept per process for payloads served repeatedly (0 disables the cache).
+RESPONSE_COMPRESSION_ENABLED = env.bool("RESPONSE_COMPRESSION_ENABLED", default=True)
+RESPONSE_COMPRESSION_MIN_BYTES = env.int("RESPONSE_COMPRESSION_MIN_BYTES", default=512)
+RESPONSE_COMPRESSION_TYPES = env.list(
+    "RESPONSE_COMPRESSION_TYPES", default=['application/json', 'text/plain', 'text/csv']
+)
+RESPONSE_COMPRESSION_BROTLI_QUALITY = env.int("RESPONSE_COMPRESSION_BROTLI_QUALITY", default=5)
+RESPONSE_COMPRESSION_GZIP_LEVEL = env.int("RESPONSE_COMPRESSION_GZIP_LEVEL", default=6)
+RESPONSE_COMPRESSION_CACHE_BYTES = env.int("RESPONSE_COMPRESSION_CACHE_BYTES", default=16 * 1024 * 1024)
+
 
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=5),
-    'REFRESH_TOKEN_LIFETIME': timedelta(days=1)
+    'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
+    # Tokens carry a hash of the password: changing it revokes them.
+    'CHECK_REVOKE_TOKEN': True,
 }
 
+# Authenticated users are cached per process for AUTH_USER_CACHE_TTL
+# seconds (0 disables), saving the user query on every API request. A
+# user deactivated in another process is still accepted for up to the TTL.
+AUTH_USER_CACHE_TTL = env.int("AUTH_USER_CACHE_TTL", default=60)
+AUTH_USER_CACHE_SIZE = env.int("AUTH_USER_CACHE_SIZE", default=10000)
+
 CORS_TRUSTED_ORIGINS = [
     'http://127.0.0.1:5500',
     'http://localhost:5500',
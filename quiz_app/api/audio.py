@@ -0,0 +1,154 @@
+"""Audio decoding for the transcription stage.
+
+Whisper expects mono 16 kHz float32 samples. Instead of writing the
+downloaded audio to disk and letting Whisper start ffmpeg again to read
+it back, :func:`decode_audio` lets a single ffmpeg process read the
+source (a local file or a remote stream URL) and write raw PCM to a
+pipe, which is turned into a NumPy array without touching the disk.
+"""
+
+import subprocess
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+
+class AudioDecodeError(Exception):
+    """Raised when audio cannot be streamed or decoded."""
+
+
+def decode_audio(source, headers=None, sample_rate=SAMPLE_RATE, timeout=None):
+    """Decode ``source`` into a mono float32 array at ``sample_rate``.
+
+    Args:
+        source (str): Path or URL ffmpeg can read from.
+        headers (dict, optional): HTTP headers ffmpeg should send when
+            ``source`` is a URL (e.g. the ones yt-dlp resolved).
+        sample_rate (int): Target sample rate in Hz.
+        timeout (float, optional): Seconds after which ffmpeg is killed,
+            e.g. when a remote stream stalls. ``None`` waits forever.
+
+    Returns:
+        numpy.ndarray: Samples in ``[-1.0, 1.0)`` as ``float32``.
+
+    Raises:
+        AudioDecodeError: If ffmpeg is missing, fails or times out.
+    """
+    cmd = ["ffmpeg", "-nostdin", "-loglevel", "error", "-threads", "0"]
+    if headers:
+        cmd += ["-headers", "".join(f"{key}: {value}\r\n" for key, value in headers.items())]
+    cmd += ["-i", source, "-vn", "-f", "s16le", "-ac", "1", "-ar", str(sample_rate), "-"]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, check=True, timeout=timeout)
+    except FileNotFoundError as exc:
+        raise AudioDecodeError("ffmpeg is not installed or not on PATH") from exc
+    except subprocess.TimeoutExpired as exc:
+        raise AudioDecodeError(f"ffmpeg did not finish within {timeout} seconds") from exc
+    except subprocess.CalledProcessError as exc:
+        raise AudioDecodeError(exc.stderr.decode(errors="replace").strip() or "ffmpeg failed") from exc
+
+    if not result.stdout:
+        raise AudioDecodeError("ffmpeg produced no audio")
+
+    return pcm16_to_float32(result.stdout)
+
+
+def pcm16_to_float32(data):
+    """Convert little-endian signed 16-bit PCM bytes to float32 samples."""
+    return np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def frame_energy(audio, frame_length):
+    """Return the RMS energy of consecutive non-overlapping frames.
+
+    Trailing samples that do not fill a whole frame are ignored.
+
+    Args:
+        audio (numpy.ndarray): Mono float32 samples.
+        frame_length (int): Samples per frame.
+
+    Returns:
+        numpy.ndarray: One RMS value per frame.
+    """
+    frame_count = len(audio) // frame_length
+    if frame_count == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = audio[:frame_count * frame_length].reshape(frame_count, frame_length)
+    return np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+
+
+def trim_non_speech(audio, threshold_db=-45.0, min_gap=1.0, padding=0.25,
+                    music_modulation_db=0.0, frame_seconds=0.025, sample_rate=SAMPLE_RATE):
+    """Remove silence (and optionally steady music) from ``audio``.
+
+    Frames are classified by their RMS level: frames quieter than
+    ``threshold_db`` dBFS are non-speech. If ``music_modulation_db`` is
+    positive, frames whose level varies less than that (standard
+    deviation in dB over the surrounding second) are treated as music
+    too; speech rises and falls with every syllable, music beds rarely
+    do. Speech regions are widened by ``padding`` seconds and only
+    non-speech stretches of at least ``min_gap`` seconds are removed.
+
+    If no speech is found at all the audio is returned unchanged, so a
+    misconfigured threshold never produces an empty transcript.
+
+    Args:
+        audio (numpy.ndarray): Mono float32 samples.
+        threshold_db (float): Level below which a frame is silence.
+        min_gap (float): Shortest non-speech stretch (seconds) to cut.
+        padding (float): Seconds kept around detected speech.
+        music_modulation_db (float): Minimum level variation of speech;
+            ``0`` disables music detection.
+        frame_seconds (float): Analysis frame length.
+        sample_rate (int): Sample rate of ``audio``.
+
+    Returns:
+        tuple[numpy.ndarray, dict]: The trimmed samples and statistics
+        (``original_seconds``, ``kept_seconds``, ``dropped_seconds``,
+        ``dropped_ratio``).
+    """
+    frame = int(frame_seconds * sample_rate)
+    level_db = 20 * np.log10(frame_energy(audio, frame) + 1e-10)
+    speech = level_db > threshold_db
+
+    if music_modulation_db > 0 and len(level_db):
+        window = max(1, int(round(1.0 / frame_seconds)))
+        kernel = np.ones(window) / window
+        mean = np.convolve(level_db, kernel, mode='same')
+        variance = np.convolve(np.square(level_db), kernel, mode='same') - np.square(mean)
+        speech &= np.sqrt(np.maximum(variance, 0.0)) >= music_modulation_db
+
+    original_seconds = len(audio) / sample_rate
+    if not speech.any():
+        return audio, _trim_stats(original_seconds, original_seconds)
+
+    pad = int(round(padding / frame_seconds))
+    if pad:
+        speech = np.convolve(speech, np.ones(2 * pad + 1), mode='same') > 0
+
+    # Keep non-speech runs that are too short to be worth cutting.
+    keep = speech.copy()
+    edges = np.flatnonzero(np.diff(np.concatenate(([1], speech.astype(np.int8), [1]))))
+    min_frames = int(round(min_gap / frame_seconds))
+    for start, end in zip(edges[::2], edges[1::2]):
+        if end - start < min_frames:
+            keep[start:end] = True
+
+    mask = np.repeat(keep, frame)
+    # The trailing partial frame follows the decision for the last full frame.
+    mask = np.concatenate((mask, np.full(len(audio) - len(mask), keep[-1])))
+    trimmed = audio[mask]
+    return trimmed, _trim_stats(original_seconds, len(trimmed) / sample_rate)
+
+
+def _trim_stats(original_seconds, kept_seconds):
+    """Return the statistics dict reported by :func:`trim_non_speech`."""
+    dropped = original_seconds - kept_seconds
+    return {
+        'original_seconds': round(original_seconds, 3),
+        'kept_seconds': round(kept_seconds, 3),
+        'dropped_seconds': round(dropped, 3),
+        'dropped_ratio': round(dropped / original_seconds, 4) if original_seconds else 0.0,
+    }
@@ -0,0 +1,162 @@
+"""Pluggable backends of the quiz generation pipeline.
+
+The pipeline (:mod:`quiz_app.api.utils`) does not talk to YouTube,
+Whisper or Gemini directly but to three backends selected by dotted path
+in settings:
+
+- ``QUIZ_FETCHER_BACKEND`` gets captions and audio for a video URL,
+- ``QUIZ_TRANSCRIBER_BACKEND`` turns audio into transcript text,
+- ``QUIZ_GENERATOR_BACKEND`` turns a transcript into a quiz dict.
+
+The defaults below are the production implementations. Deterministic
+offline stand-ins for benchmarks and load tests live in
+:mod:`quiz_app.api.stubs`.
+
+The production backends import the pipeline modules, and with them
+Whisper (and torch), yt-dlp, google-genai and tiktoken, only when they
+are first used. Views, workers and management commands call the
+pipeline through :func:`generate_quiz_json_from_url` in this module, so
+those libraries are only loaded by a process once it actually generates
+a quiz; serving the read endpoints or running unrelated commands never
+pays for them.
+"""
+
+import abc
+import logging
+import threading
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+class Fetcher(abc.ABC):
+    """Get the captions and the audio of a video."""
+
+    def fetch_captions(self, url):
+        """Return usable caption text for ``url`` or ``None``."""
+        return None
+
+    @abc.abstractmethod
+    def load_audio(self, url, workspace):
+        """Return the audio of ``url`` as a file path or float32 samples.
+
+        Files must be written into ``workspace``, which is deleted after
+        the pipeline run.
+        """
+
+
+class Transcriber(abc.ABC):
+    """Turn audio into transcript text.
+
+    ``source`` is stored as the ``transcript_source`` of quizzes made
+    from its transcripts; it is empty unless the backend is one of the
+    sources listed in ``Quiz.TRANSCRIPT_SOURCE_CHOICES``.
+    """
+
+    source = ''
+
+    @abc.abstractmethod
+    def get_cache_key(self):
+        """Return the key transcripts of this transcriber are cached under."""
+
+    @abc.abstractmethod
+    def transcribe(self, audio):
+        """Return the transcript text of ``audio``."""
+
+
+class Generator(abc.ABC):
+    """Turn a transcript into a quiz dict."""
+
+    @abc.abstractmethod
+    def generate(self, transcript_text):
+        """Return a quiz dict with ``title``, ``description`` and ``questions``."""
+
+
+class YouTubeFetcher(Fetcher):
+    """Captions and audio from YouTube via yt-dlp and ffmpeg."""
+
+    def fetch_captions(self, url):
+        import xml.etree.ElementTree as ET
+
+        import yt_dlp
+
+        from . import utils
+
+        try:
+            return utils.fetch_captions(
+                url, settings.QUIZ_CAPTION_LANGUAGES, min_words=settings.QUIZ_CAPTIONS_MIN_WORDS
+            )
+        except (yt_dlp.utils.DownloadError, OSError, ET.ParseError) as exc:
+            logger.warning("Fetching captions for %s failed, transcribing instead: %s", url, exc)
+            return None
+
+    def load_audio(self, url, workspace):
+        from . import utils
+
+        return utils.load_audio(url, workspace)
+
+
+class WhisperTranscriber(Transcriber):
+    """Local Whisper transcription (see :func:`quiz_app.api.utils.transcribe_audio`)."""
+
+    source = 'whisper'
+
+    def get_cache_key(self):
+        return settings.WHISPER_MODEL
+
+    def transcribe(self, audio):
+        from . import utils
+
+        return utils.transcribe_audio(audio)
+
+
+class GeminiGenerator(Generator):
+    """Quiz generation with Gemini (see :func:`quiz_app.api.llm.generate_quiz_json`)."""
+
+    def generate(self, transcript_text):
+        from . import utils
+
+        return utils.generate_quiz_json(transcript_text)
+
+
+def get_backend(setting_name):
+    """Return the backend instance configured in ``settings.<setting_name>``.
+
+    Instances are created once per dotted path and shared by all runs in
+    the process, so backends must be thread-safe.
+    """
+    path = getattr(settings, setting_name)
+    backend = _backends.get(path)
+    if backend is None:
+        with _backends_lock:
+            backend = _backends.get(path)
+            if backend is None:
+                backend = _backends[path] = import_string(path)()
+    return backend
+
+
+def get_fetcher():
+    return get_backend('QUIZ_FETCHER_BACKEND')
+
+
+def get_transcriber():
+    return get_backend('QUIZ_TRANSCRIBER_BACKEND')
+
+
+def get_generator():
+    return get_backend('QUIZ_GENERATOR_BACKEND')
+
+
+def generate_quiz_json_from_url(url):
+    """Run the quiz generation pipeline for ``url``.
+
+    See :func:`quiz_app.api.utils.generate_quiz_json_from_url`.
+    """
+    from . import utils
+
+    return utils.generate_quiz_json_from_url(url)
@@ -0,0 +1,123 @@
+"""Use existing YouTube captions instead of transcribing audio.
+
+Many videos already come with creator-uploaded subtitles or YouTube's
+automatic captions. Fetching and parsing those takes seconds, while a
+Whisper transcription takes minutes of CPU time, so the pipeline asks
+for captions first and only falls back to Whisper when none usable are
+available.
+
+Creator-uploaded subtitles are preferred over automatic captions, and
+within each kind the languages are tried in the configured order.
+WebVTT and YouTube's XML ``srv1``/``srv2``/``srv3`` formats are
+supported.
+"""
+
+import html
+import logging
+import re
+import xml.etree.ElementTree as ET
+
+import yt_dlp
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_FORMATS = ("vtt", "srv3", "srv1", "srv2")
+
+TAG_PATTERN = re.compile(r"<[^>]+>")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def fetch_captions(url, languages, min_words=0):
+    """Return the caption text for ``url`` or ``None`` if none is usable.
+
+    Args:
+        url (str): The YouTube video URL.
+        languages (list[str]): Preferred language codes, e.g. ``["en"]``.
+            Regional variants such as ``en-US`` match ``en``.
+        min_words (int): Captions with fewer words are ignored.
+
+    Returns:
+        str | None: Plain transcript text.
+    """
+    ydl_opts = {
+        "quiet": True,
+        "noplaylist": True,
+        "skip_download": True,
+    }
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+
+        for tracks in (info.get("subtitles") or {}, info.get("automatic_captions") or {}):
+            track = select_track(tracks, languages)
+            if track is None:
+                continue
+            raw = ydl.urlopen(track["url"]).read().decode("utf-8", errors="replace")
+            text = parse_captions(raw, track["ext"])
+            if text and len(text.split()) >= min_words:
+                return text
+
+    return None
+
+
+def select_track(tracks, languages):
+    """Pick the best supported caption format in the first matching language.
+
+    Args:
+        tracks (dict): yt-dlp mapping of language code to format list.
+        languages (list[str]): Preferred language codes in order.
+
+    Returns:
+        dict | None: The chosen yt-dlp format dict (with ``url``/``ext``).
+    """
+    for language in languages:
+        for code, formats in tracks.items():
+            if code != language and not code.startswith(f"{language}-"):
+                continue
+            by_ext = {fmt.get("ext"): fmt for fmt in formats if fmt.get("url")}
+            for ext in SUPPORTED_FORMATS:
+                if ext in by_ext:
+                    return by_ext[ext]
+    return None
+
+
+def parse_captions(raw, ext):
+    """Convert caption file contents in format ``ext`` into plain text."""
+    if ext == "vtt":
+        return parse_vtt(raw)
+    return parse_srv(raw)
+
+
+def parse_vtt(raw):
+    """Extract the spoken text from a WebVTT document.
+
+    Cue timings, identifiers, ``NOTE``/``STYLE`` blocks and inline tags
+    are dropped. Lines repeated from the previous cue (typical for
+    YouTube's rolling automatic captions) are only kept once.
+    """
+    lines = []
+    for block in re.split(r"\r?\n\r?\n", raw.strip()):
+        block_lines = block.splitlines()
+        if not block_lines or block_lines[0].startswith(("WEBVTT", "NOTE", "STYLE", "REGION")):
+            continue
+        timing_index = next((i for i, line in enumerate(block_lines) if "-->" in line), None)
+        if timing_index is None:
+            continue
+        lines.extend(block_lines[timing_index + 1:])
+    return _join_lines(lines)
+
+
+def parse_srv(raw):
+    """Extract the spoken text from YouTube's XML (srv1/srv2/srv3) captions."""
+    root = ET.fromstring(raw)
+    lines = ["".join(node.itertext()) for node in root.iter() if node.tag in ("text", "p")]
+    return _join_lines(lines)
+
+
+def _join_lines(lines):
+    """Clean caption lines, drop consecutive duplicates and join them."""
+    cleaned = []
+    for line in lines:
+        line = WHITESPACE_PATTERN.sub(" ", html.unescape(TAG_PATTERN.sub("", line))).strip()
+        if line and (not cleaned or cleaned[-1] != line):
+            cleaned.append(line)
+    return " ".join(cleaned)
@@ -0,0 +1,107 @@
+"""Conditional requests (ETag / Last-Modified) for the quiz endpoints.
+
+The validators of a quiz are derived from its own and its questions'
+``updated_at`` and its question count; those of a user's quiz list from
+the quiz count, the newest ``updated_at`` of the quizzes and their
+questions and the newest deletion tombstone. Each is computed with one
+aggregate query (:func:`quiz_state` / :func:`list_state`), so
+``If-None-Match`` / ``If-Modified-Since`` requests are answered with 304
+without loading or serializing any quiz. Both queries are restricted to
+the requester's own quizzes: for anyone else they find nothing, no
+conditional processing happens and the view answers 403/404 as usual.
+
+ETags are strong and also cover the request URL and the response
+format, because ``fields``, pagination and the renderer all change the
+bytes of the representation.
+"""
+
+import hashlib
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Max, Subquery
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from quiz_app.models import Question, Quiz, QuizDeletion
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "The quiz was changed since its preconditions were checked; reload it and retry."
+    default_code = 'precondition_failed'
+
+
+def quiz_state(user_id, quiz_pk):
+    """Return the validator state of ``user_id``'s quiz ``quiz_pk`` or ``None``."""
+    row = (
+        Quiz.objects.filter(pk=quiz_pk, creator_id=user_id)
+        .annotate(questions_updated=Max('questions__updated_at'), question_count=Count('questions'))
+        .values('updated_at', 'questions_updated', 'question_count')
+        .first()
+    )
+    if row is None:
+        return None
+    fingerprint = f"quiz:{quiz_pk}:{row['updated_at'].isoformat()}:{_isoformat(row['questions_updated'])}:{row['question_count']}"
+    return fingerprint, _latest(row['updated_at'], row['questions_updated'])
+
+
+def list_state(user_id):
+    """Return the validator state of ``user_id``'s quiz list."""
+    quizzes = Quiz.objects.filter(creator_id=user_id).order_by().values('creator_id')
+    questions = Question.objects.filter(quiz__creator_id=user_id).order_by().values('quiz__creator_id')
+    deletions = QuizDeletion.objects.filter(creator_id=user_id).order_by('-deleted_at')
+    row = get_user_model().objects.filter(pk=user_id).annotate(
+        quiz_count=Subquery(quizzes.annotate(value=Count('id')).values('value')),
+        quizzes_updated=Subquery(quizzes.annotate(value=Max('updated_at')).values('value')),
+        questions_updated=Subquery(questions.annotate(value=Max('updated_at')).values('value')),
+        deleted=Subquery(deletions.values('deleted_at')[:1]),
+    ).values('quiz_count', 'quizzes_updated', 'questions_updated', 'deleted').first()
+    timestamps = (row['quizzes_updated'], row['questions_updated'], row['deleted'])
+    fingerprint = f"list:{user_id}:{row['quiz_count'] or 0}:" + ":".join(_isoformat(value) for value in timestamps)
+    return fingerprint, _latest(*timestamps)
+
+
+def get_etag(request, state):
+    """Return the strong ETag of the response to ``request`` for ``state``."""
+    fingerprint, _ = state
+    renderer = getattr(request, 'accepted_renderer', None)
+    variant = f"{fingerprint}|{request.get_full_path()}|{getattr(renderer, 'format', '')}"
+    return quote_etag(hashlib.sha1(variant.encode()).hexdigest())
+
+
+def conditional_response(request, state):
+    """Return a 304/412 response if the request's preconditions say so, else ``None``."""
+    _, last_modified = state
+    response = get_conditional_response(
+        request._request,
+        etag=get_etag(request, state),
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is not None:
+        set_validators(response, request, state)
+    return response
+
+
+def set_validators(response, request, state):
+    """Add ``ETag`` and ``Last-Modified`` headers for ``state`` to ``response``."""
+    _, last_modified = state
+    response.headers['ETag'] = get_etag(request, state)
+    if last_modified:
+        response.headers['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
+
+
+def has_preconditions(request):
+    """Return whether a write request carries ``If-Match``/``If-Unmodified-Since``."""
+    return 'HTTP_IF_MATCH' in request.META or 'HTTP_IF_UNMODIFIED_SINCE' in request.META
+
+
+def _isoformat(value):
+    return value.isoformat() if value else ''
+
+
+def _latest(*timestamps):
+    timestamps = [value for value in timestamps if value]
+    return max(timestamps) if timestamps else None
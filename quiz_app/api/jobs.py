@@ -0,0 +1,132 @@
+"""Background quiz generation jobs.
+
+A :class:`~quiz_app.models.QuizGenerationJob` row is the queue entry
+for one quiz. Web requests only enqueue jobs; worker processes started
+by the ``run_quiz_workers`` management command claim pending jobs from
+the database, run the generation pipeline and record the outcome.
+
+Claiming uses a conditional ``UPDATE ... WHERE status = 'pending'`` so
+any number of workers can poll the same table without processing a job
+twice.
+"""
+
+import logging
+import os
+import socket
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from quiz_app.models import QuizGenerationJob
+from .metrics import stage, track_run
+from .persistence import save_generated_quiz
+from .backends import generate_quiz_json_from_url
+
+logger = logging.getLogger(__name__)
+
+# Shown to clients for failed jobs; the details (which may contain
+# ffmpeg/yt-dlp output, stream URLs or LLM client errors) are only logged.
+JOB_FAILED_MESSAGE = "Quiz generation failed."
+
+
+def enqueue_job(video_url, creator):
+    """Create and return a pending job for ``video_url``."""
+    return QuizGenerationJob.objects.create(video_url=video_url, creator=creator)
+
+
+def default_worker_name(index=0):
+    """Return an identifier for a worker process, used for diagnostics."""
+    return f"{socket.gethostname()}:{os.getpid()}:{index}"[:63]
+
+
+def claim_next_job(worker_name):
+    """Atomically claim the oldest pending job.
+
+    Returns:
+        QuizGenerationJob | None: The claimed job, now ``running``, or
+        ``None`` if no job is pending.
+    """
+    while True:
+        job_id = (
+            QuizGenerationJob.objects
+            .filter(status=QuizGenerationJob.STATUS_PENDING)
+            .order_by('created_at', 'id')
+            .values_list('id', flat=True)
+            .first()
+        )
+        if job_id is None:
+            return None
+
+        claimed = QuizGenerationJob.objects.filter(
+            pk=job_id, status=QuizGenerationJob.STATUS_PENDING
+        ).update(
+            status=QuizGenerationJob.STATUS_RUNNING,
+            worker=worker_name,
+            started_at=timezone.now(),
+            updated_at=timezone.now()
+        )
+        if claimed:
+            return QuizGenerationJob.objects.select_related('creator').get(pk=job_id)
+        # Another worker won the race for this job; try the next one.
+
+
+def requeue_stale_jobs():
+    """Return jobs stuck in ``running`` (e.g. after a worker crash) to the queue.
+
+    Returns:
+        int: Number of jobs that were requeued.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.QUIZ_JOB_STALE_AFTER)
+    return QuizGenerationJob.objects.filter(
+        status=QuizGenerationJob.STATUS_RUNNING, started_at__lt=cutoff
+    ).update(status=QuizGenerationJob.STATUS_PENDING, worker='', updated_at=timezone.now())
+
+
+def run_job(job):
+    """Run the generation pipeline for a claimed job and record the result."""
+    try:
+        with track_run(job_id=job.pk, video_url=job.video_url, user_id=job.creator_id):
+            quiz_json = generate_quiz_json_from_url(job.video_url)
+            with stage('persist'):
+                job.quiz, _questions = save_generated_quiz(quiz_json, job.video_url, job.creator)
+        job.status = QuizGenerationJob.STATUS_SUCCEEDED
+    except Exception:
+        logger.exception("Quiz generation job %s failed", job.pk)
+        job.status = QuizGenerationJob.STATUS_FAILED
+        job.error = JOB_FAILED_MESSAGE
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=['quiz', 'status', 'error', 'finished_at', 'updated_at'])
+    return job
+
+
+def run_worker(worker_name, poll_interval=None, once=False):
+    """Process jobs until stopped.
+
+    Args:
+        worker_name (str): Identifier stored on claimed jobs.
+        poll_interval (float, optional): Seconds to sleep when the queue
+            is empty. Defaults to ``settings.QUIZ_JOB_POLL_INTERVAL``.
+        once (bool): Return as soon as the queue is empty instead of
+            polling forever.
+
+    Returns:
+        int: Number of jobs processed.
+    """
+    if poll_interval is None:
+        poll_interval = settings.QUIZ_JOB_POLL_INTERVAL
+
+    processed = 0
+    while True:
+        close_old_connections()
+        job = claim_next_job(worker_name)
+        if job is None:
+            if once:
+                return processed
+            time.sleep(poll_interval)
+            continue
+        run_job(job)
+        processed += 1
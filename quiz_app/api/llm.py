@@ -0,0 +1,387 @@
+"""Quiz generation with the Gemini language model.
+
+The ``genai.Client`` (and the HTTP connection pool inside it) is created
+lazily once per process and reused by every quiz, so only the first
+call pays for connection and TLS setup. It is configured from
+``settings.GEMINI_*``:
+
+- ``GEMINI_API_KEY`` and ``GEMINI_MODEL``,
+- ``GEMINI_BASE_URL`` to point the client at another endpoint (e.g. a
+  local stand-in server for tests and benchmarks),
+- ``GEMINI_TIMEOUT`` (seconds per request) and
+  ``GEMINI_MAX_CONNECTIONS``/``GEMINI_KEEPALIVE_EXPIRY`` for the
+  keep-alive pool.
+
+Transcripts are normalized and, when longer than
+``QUIZ_TRANSCRIPT_TOKEN_BUDGET`` tokens, condensed map-reduce style:
+chunks of the transcript are reduced to their key facts in parallel and
+the quiz is generated from those facts.
+
+The quiz prompt uses Gemini's structured output with the schema in
+:mod:`quiz_app.api.schema`; invalid questions are regenerated one small
+prompt at a time instead of rerunning the whole pipeline.
+
+:func:`agenerate_quiz_json` is the ``async`` counterpart for async views
+and workers. Async HTTP connections belong to the event loop that opened
+them, so one async client is kept per running loop.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import re
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from django.conf import settings
+from google import genai
+from google.genai import types
+
+from .metrics import count, stage
+from .schema import (
+    OPTION_COUNT, QUESTION_COUNT, QuizQuestion, QuizSchema, QuizValidationError, add_valid_questions, validate_quiz
+)
+from .tokens import count_tokens, normalize_transcript, split_by_tokens
+
+logger = logging.getLogger(__name__)
+
+_client = None
+_client_lock = threading.Lock()
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def build_client():
+    """Return a new ``genai.Client`` configured from settings."""
+    limits = httpx.Limits(
+        max_connections=settings.GEMINI_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.GEMINI_MAX_CONNECTIONS,
+        keepalive_expiry=settings.GEMINI_KEEPALIVE_EXPIRY,
+    )
+    http_options = types.HttpOptions(
+        base_url=settings.GEMINI_BASE_URL or None,
+        timeout=int(settings.GEMINI_TIMEOUT * 1000),
+        client_args={'limits': limits},
+        async_client_args={'limits': limits},
+    )
+    return genai.Client(api_key=settings.GEMINI_API_KEY, http_options=http_options)
+
+
+def get_client():
+    """Return the process-wide client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = build_client()
+    return _client
+
+
+def get_async_client():
+    """Return the async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = build_client().aio
+    return client
+
+
+def reset_clients():
+    """Drop the cached clients, e.g. after changing the GEMINI settings."""
+    global _client
+    with _client_lock:
+        _client = None
+        _async_clients.clear()
+
+
+def build_quiz_prompt(transcript_text):
+    """Return the quiz generation prompt for ``transcript_text``."""
+    return f"""
+        Based on the following transcript, generate a quiz in valid JSON format.
+
+        The quiz must follow this exact structure:
+
+        {{
+            "title": "Create a concise quiz title based on the topic of the transcript.",
+            "description": "Summarize the transcript in no more than 150 characters. Do not include any quiz questions or answers.",
+            "questions": [
+                {{
+                    "question_title": "The question goes here.",
+                    "question_options": ["Option A", "Option B", "Option C", "Option D"],
+                    "answer": "The correct answer from the above options"
+                }},
+                ...
+                (exactly {QUESTION_COUNT} questions)
+            ]
+        }}
+
+        Requirements:
+        - Each question must have exactly {OPTION_COUNT} distinct answer options.
+        - Only one correct answer is allowed per question, and it must be present in 'question_options'.
+        - The output must be valid JSON and parsable as-is (e.g., using Python's json.loads).
+        - Do not include explanations, comments, or any text outside the JSON
+        ---
+        {transcript_text}
+        ---
+        """
+
+
+def build_repair_prompt(transcript_text, quiz, missing):
+    """Return the prompt asking for ``missing`` replacement questions."""
+    existing = "\n".join(f"- {question['question_title']}" for question in quiz['questions'])
+    return f"""
+        Based on the following transcript, write {missing} new quiz question(s)
+        as a JSON array for the quiz "{quiz['title']}".
+
+        Each element must follow this exact structure:
+
+        {{
+            "question_title": "The question goes here.",
+            "question_options": ["Option A", "Option B", "Option C", "Option D"],
+            "answer": "The correct answer from the above options"
+        }}
+
+        Requirements:
+        - Each question must have exactly {OPTION_COUNT} distinct answer options.
+        - Only one correct answer is allowed per question, and it must be present in 'question_options'.
+        - Do not repeat any of these existing questions:
+        {existing or "- (none)"}
+        - The output must be valid JSON and parsable as-is (e.g., using Python's json.loads).
+        ---
+        {transcript_text}
+        ---
+        """
+
+
+def record_usage(response):
+    """Add the token usage reported with ``response`` to the metrics."""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        count("llm_prompt_tokens", usage.prompt_token_count or 0)
+        count("llm_output_tokens", usage.candidates_token_count or 0)
+
+
+def parse_quiz_response(response):
+    """Record token usage of ``response`` and return its parsed JSON body."""
+    record_usage(response)
+
+    raw_text = response.text
+    cleaned_text = re.sub(r"^```(?:json)?\s*|\s*```$", "", raw_text.strip(), flags=re.MULTILINE)
+    return json.loads(cleaned_text)
+
+
+def build_key_facts_prompt(chunk_text):
+    """Return the prompt condensing one transcript chunk into key facts."""
+    return f"""
+        The following text is one part of a longer lecture transcript.
+        Extract the key facts, definitions, names, numbers and explanations
+        a quiz about the whole lecture could ask about.
+
+        Requirements:
+        - Answer with a plain bullet list, one fact per line.
+        - Keep every fact self-contained and faithful to the text.
+        - Do not add facts that are not in the text.
+        - Use at most {settings.QUIZ_MAP_SUMMARY_WORDS} words.
+        ---
+        {chunk_text}
+        ---
+        """
+
+
+def prepare_transcript(transcript_text):
+    """Normalize ``transcript_text`` and report whether it fits the budget.
+
+    Returns:
+        tuple[str, bool]: The normalized transcript and ``True`` if it
+        exceeds ``QUIZ_TRANSCRIPT_TOKEN_BUDGET`` and must be condensed.
+    """
+    text = normalize_transcript(transcript_text)
+    tokens = count_tokens(text)
+    count("transcript_tokens", tokens)
+    return text, tokens > settings.QUIZ_TRANSCRIPT_TOKEN_BUDGET
+
+
+def condense_transcript(transcript_text):
+    """Map-reduce ``transcript_text`` into key facts within the token budget.
+
+    The transcript is split into chunks of ``QUIZ_MAP_CHUNK_TOKENS``
+    whose key facts are extracted in parallel; if the combined facts are
+    still over budget, they are condensed again (at most
+    ``QUIZ_MAP_MAX_ROUNDS`` rounds).
+    """
+    text = transcript_text
+    with stage('condense'):
+        for _round in range(settings.QUIZ_MAP_MAX_ROUNDS):
+            chunks = split_by_tokens(text, settings.QUIZ_MAP_CHUNK_TOKENS)
+            workers = max(1, min(settings.QUIZ_MAP_CONCURRENCY, len(chunks)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Run each call in a copy of this context so its token
+                # counts go to the current pipeline run.
+                futures = [
+                    executor.submit(contextvars.copy_context().run, extract_key_facts, chunk) for chunk in chunks
+                ]
+                facts = [future.result() for future in futures]
+            text = "\n".join(facts)
+            if count_tokens(text) <= settings.QUIZ_TRANSCRIPT_TOKEN_BUDGET:
+                break
+    return text
+
+
+def extract_key_facts(chunk_text):
+    """Return the key facts of one transcript chunk as text."""
+    response = get_client().models.generate_content(
+        model=settings.GEMINI_MODEL,
+        contents=build_key_facts_prompt(chunk_text)
+    )
+    record_usage(response)
+    return response.text.strip()
+
+
+def structured_config(schema):
+    """Return a generation config requesting JSON output matching ``schema``."""
+    return types.GenerateContentConfig(response_mime_type='application/json', response_schema=schema)
+
+
+def accept_quiz(response):
+    """Validate the response to the quiz prompt.
+
+    Returns:
+        tuple[dict | None, int]: The quiz with its valid questions and the
+        number of questions missing, or ``(None, 0)`` if the output is
+        unusable and the quiz prompt has to run again.
+    """
+    try:
+        return validate_quiz(parse_quiz_response(response))
+    except (ValueError, AttributeError) as exc:
+        logger.warning("Discarding invalid quiz output: %s", exc)
+        count("quiz_generation_retries")
+        return None, 0
+
+
+def accept_repair(quiz, response):
+    """Add the valid replacement questions in ``response`` to ``quiz``.
+
+    Returns:
+        int: The number of questions still missing.
+    """
+    try:
+        candidates = parse_quiz_response(response)
+    except (ValueError, AttributeError):
+        candidates = []
+    if isinstance(candidates, dict):
+        candidates = candidates.get('questions', [])
+    if not isinstance(candidates, list):
+        candidates = []
+    return add_valid_questions(quiz, candidates)
+
+
+def generate_quiz_json(transcript_text):
+    """Use a language model to produce a quiz JSON from transcript_text.
+
+    The transcript is normalized first; transcripts over the token
+    budget are condensed with :func:`condense_transcript` so the final
+    prompt stays bounded however long the video is.
+
+    The model is asked for JSON matching :class:`QuizSchema` and the
+    output is validated question by question. Invalid questions are
+    regenerated from the same transcript with a small follow-up prompt
+    (up to ``QUIZ_REPAIR_ATTEMPTS`` extra calls) instead of rerunning
+    the pipeline.
+
+    Returns:
+        dict: The validated quiz.
+
+    Raises:
+        QuizValidationError: If no valid quiz could be produced.
+    """
+    text, over_budget = prepare_transcript(transcript_text)
+    if over_budget:
+        text = condense_transcript(text)
+
+    models = get_client().models
+    quiz, missing = None, 0
+    for _attempt in range(settings.QUIZ_REPAIR_ATTEMPTS + 1):
+        if quiz is None:
+            response = models.generate_content(
+                model=settings.GEMINI_MODEL,
+                contents=build_quiz_prompt(text),
+                config=structured_config(QuizSchema)
+            )
+            quiz, missing = accept_quiz(response)
+        else:
+            count("quiz_questions_repaired", missing)
+            response = models.generate_content(
+                model=settings.GEMINI_MODEL,
+                contents=build_repair_prompt(text, quiz, missing),
+                config=structured_config(list[QuizQuestion])
+            )
+            missing = accept_repair(quiz, response)
+        if quiz is not None and not missing:
+            return quiz
+    raise QuizValidationError(invalid_quiz_message(quiz, missing))
+
+
+async def acondense_transcript(transcript_text):
+    """Async variant of :func:`condense_transcript`."""
+    text = transcript_text
+    semaphore = asyncio.Semaphore(settings.QUIZ_MAP_CONCURRENCY)
+
+    async def extract(chunk_text):
+        async with semaphore:
+            return await aextract_key_facts(chunk_text)
+
+    with stage('condense'):
+        for _round in range(settings.QUIZ_MAP_MAX_ROUNDS):
+            chunks = split_by_tokens(text, settings.QUIZ_MAP_CHUNK_TOKENS)
+            text = "\n".join(await asyncio.gather(*(extract(chunk) for chunk in chunks)))
+            if count_tokens(text) <= settings.QUIZ_TRANSCRIPT_TOKEN_BUDGET:
+                break
+    return text
+
+
+async def aextract_key_facts(chunk_text):
+    """Async variant of :func:`extract_key_facts`."""
+    response = await get_async_client().models.generate_content(
+        model=settings.GEMINI_MODEL,
+        contents=build_key_facts_prompt(chunk_text)
+    )
+    record_usage(response)
+    return response.text.strip()
+
+
+async def agenerate_quiz_json(transcript_text):
+    """Async variant of :func:`generate_quiz_json`."""
+    text, over_budget = prepare_transcript(transcript_text)
+    if over_budget:
+        text = await acondense_transcript(text)
+
+    models = get_async_client().models
+    quiz, missing = None, 0
+    for _attempt in range(settings.QUIZ_REPAIR_ATTEMPTS + 1):
+        if quiz is None:
+            response = await models.generate_content(
+                model=settings.GEMINI_MODEL,
+                contents=build_quiz_prompt(text),
+                config=structured_config(QuizSchema)
+            )
+            quiz, missing = accept_quiz(response)
+        else:
+            count("quiz_questions_repaired", missing)
+            response = await models.generate_content(
+                model=settings.GEMINI_MODEL,
+                contents=build_repair_prompt(text, quiz, missing),
+                config=structured_config(list[QuizQuestion])
+            )
+            missing = accept_repair(quiz, response)
+        if quiz is not None and not missing:
+            return quiz
+    raise QuizValidationError(invalid_quiz_message(quiz, missing))
+
+
+def invalid_quiz_message(quiz, missing):
+    """Return the error message for a quiz that could not be completed."""
+    if quiz is None:
+        return "The language model did not return a valid quiz."
+    return f"The language model did not return {missing} of {QUESTION_COUNT} valid questions."
@@ -0,0 +1,205 @@
+"""Timing and volume metrics for the quiz generation pipeline.
+
+Wrap a pipeline run in :func:`track_run` and its stages in
+:func:`stage`; helpers deeper in the call stack can add to counters
+with :func:`count` without having the run passed to them (the active
+run is kept in a :class:`contextvars.ContextVar`).
+
+Every finished run is reported three ways:
+
+- :meth:`PipelineRun.server_timing` builds a ``Server-Timing`` header
+  value for the HTTP response,
+- one structured JSON log line is written to the ``quiz_app.pipeline``
+  logger,
+- stage durations are added to per-process histograms and counters that
+  :func:`render_prometheus` exposes in the Prometheus text format.
+
+The aggregates live in process memory, so every web or worker process
+reports its own numbers; the structured log lines cover all processes.
+"""
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+logger = logging.getLogger('quiz_app.pipeline')
+
+METRIC_PREFIX = 'quizly_pipeline'
+
+# Histogram bucket upper bounds in seconds; stages range from
+# milliseconds (cache lookups) to many minutes (CPU transcription).
+BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+_current_run = ContextVar('quiz_pipeline_run', default=None)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """Record one observation of ``value`` seconds."""
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Thread-safe per-process store of stage histograms and counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages = {}
+        self.counters = {}
+        self.runs = {}
+
+    def observe_stage(self, name, seconds):
+        with self._lock:
+            self.stages.setdefault(name, Histogram()).observe(seconds)
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def record_run(self, outcome):
+        with self._lock:
+            self.runs[outcome] = self.runs.get(outcome, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+            self.counters.clear()
+            self.runs.clear()
+
+    def render_prometheus(self):
+        """Return all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            lines = [
+                f'# HELP {METRIC_PREFIX}_stage_seconds Time spent in each quiz pipeline stage.',
+                f'# TYPE {METRIC_PREFIX}_stage_seconds histogram',
+            ]
+            for name, histogram in sorted(self.stages.items()):
+                for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                    lines.append(f'{METRIC_PREFIX}_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {bucket_count}')
+                lines.append(f'{METRIC_PREFIX}_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{METRIC_PREFIX}_stage_seconds_sum{{stage="{name}"}} {histogram.total:.6f}')
+                lines.append(f'{METRIC_PREFIX}_stage_seconds_count{{stage="{name}"}} {histogram.count}')
+
+            lines += [
+                f'# HELP {METRIC_PREFIX}_runs_total Finished quiz pipeline runs by outcome.',
+                f'# TYPE {METRIC_PREFIX}_runs_total counter',
+            ]
+            for outcome, value in sorted(self.runs.items()):
+                lines.append(f'{METRIC_PREFIX}_runs_total{{outcome="{outcome}"}} {value}')
+
+            for name, value in sorted(self.counters.items()):
+                lines += [
+                    f'# TYPE {METRIC_PREFIX}_{name}_total counter',
+                    f'{METRIC_PREFIX}_{name}_total {value}',
+                ]
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+
+class PipelineRun:
+    """Stage timings and counters collected for one pipeline run."""
+
+    def __init__(self, **labels):
+        self.labels = labels
+        self.stages = {}
+        self.counters = {}
+        self.started = time.perf_counter()
+        self.duration = None
+        # Helper threads of one run (e.g. the map phase) add concurrently.
+        self._lock = threading.Lock()
+
+    def add_stage(self, name, seconds):
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def add_count(self, name, value):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def server_timing(self):
+        """Return the stage timings as a ``Server-Timing`` header value."""
+        entries = [f'{name};dur={seconds * 1000:.1f}' for name, seconds in self.stages.items()]
+        if self.duration is not None:
+            entries.append(f'total;dur={self.duration * 1000:.1f}')
+        return ', '.join(entries)
+
+    def as_dict(self):
+        return {
+            **self.labels,
+            'duration_ms': round((self.duration or 0.0) * 1000, 1),
+            'stages_ms': {name: round(seconds * 1000, 1) for name, seconds in self.stages.items()},
+            'counters': self.counters,
+        }
+
+
+@contextmanager
+def track_run(**labels):
+    """Collect metrics for one pipeline run.
+
+    Keyword arguments are added to the structured log line (e.g. the
+    video URL or job id).
+
+    Yields:
+        PipelineRun: The run; its timings are complete once the block
+        exits.
+    """
+    run = PipelineRun(**labels)
+    token = _current_run.set(run)
+    outcome = 'success'
+    try:
+        yield run
+    except BaseException:
+        outcome = 'error'
+        raise
+    finally:
+        _current_run.reset(token)
+        run.duration = time.perf_counter() - run.started
+        registry.observe_stage('total', run.duration)
+        registry.record_run(outcome)
+        logger.info('quiz_pipeline_run %s', json.dumps({'outcome': outcome, **run.as_dict()}, default=str))
+
+
+@contextmanager
+def stage(name):
+    """Time the enclosed block as pipeline stage ``name``."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - started
+        registry.observe_stage(name, seconds)
+        run = _current_run.get()
+        if run is not None:
+            run.add_stage(name, seconds)
+
+
+def count(name, value=1):
+    """Add ``value`` to counter ``name`` for the current run and the process."""
+    if not value:
+        return
+    registry.increment(name, value)
+    run = _current_run.get()
+    if run is not None:
+        run.add_count(name, value)
+
+
+def render_prometheus():
+    """Return the process-wide metrics in Prometheus text format."""
+    return registry.render_prometheus()
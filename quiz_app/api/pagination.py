@@ -0,0 +1,110 @@
+"""Keyset (cursor) pagination for the quiz list.
+
+Quizzes are ordered by ``(created_at, id)`` and every page starts right
+after the last quiz of the previous page, so fetching page N costs the
+same as fetching page one (no ``OFFSET`` scan) and quizzes created or
+deleted between requests never shift items across pages. The composite
+index ``quiz_creator_created_idx`` on ``(creator, created_at, id)``
+serves both the filter and the ordering.
+
+Pagination is opt-in so existing clients keep receiving a plain list:
+it applies once a request passes ``page_size`` or ``cursor``.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class QuizCursorPagination(BasePagination):
+    """Paginate a queryset by ``(created_at, id)`` keyset cursors."""
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    ordering = ('created_at', 'id')
+
+    def is_requested(self, request):
+        """Return whether the client asked for a paginated response."""
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, settings.QUIZ_LIST_PAGE_SIZE))
+        except ValueError:
+            page_size = settings.QUIZ_LIST_PAGE_SIZE
+        return max(1, min(page_size, settings.QUIZ_LIST_MAX_PAGE_SIZE))
+
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request.query_params.get(self.cursor_query_param))
+        if position is not None:
+            created_at, pk = position
+            queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+
+        # One extra row tells whether there is a next page.
+        page = list(queryset[:self.page_size + 1])
+        self.has_next = len(page) > self.page_size
+        page = page[:self.page_size]
+        self.last = page[-1] if page else None
+        return page
+
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.last))
+
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'results': data})
+
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+    def encode_cursor(self, quiz):
+        """Return the cursor after ``quiz`` (a Quiz or a row from ``.values()``)."""
+        if isinstance(quiz, dict):
+            created_at, pk = quiz['created_at'], quiz['id']
+        else:
+            created_at, pk = quiz.created_at, quiz.pk
+        position = f"{created_at.isoformat()}|{pk}"
+        return base64.urlsafe_b64encode(position.encode()).decode().rstrip('=')
+
+
+    def decode_cursor(self, cursor):
+        """Return ``(created_at, id)`` from ``cursor`` or ``None`` for the first page.
+
+        Raises a ValidationError (400) for malformed cursors.
+        """
+        if not cursor:
+            return None
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            created_at, pk = base64.urlsafe_b64decode(padded).decode().rsplit('|', 1)
+            return datetime.fromisoformat(created_at), int(pk)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationError({self.cursor_query_param: ["Invalid cursor."]})
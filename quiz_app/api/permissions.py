@@ -3,13 +3,31 @@
 This module provides:
 - :class:`CookieJWTAuthentication` — a SimpleJWT authentication class that
     falls back to reading an `access_token` from cookies when no
-    Authorization header is present (useful for HttpOnly cookie workflows).
+    Authorization header is present (useful for HttpOnly cookie workflows)
+    and caches the authenticated users for a short time.
 - :class:`IsCreator` — a permission that allows access only to the
     creator/owner of a Quiz instance.
+- :class:`HasMetricsToken` — a permission that allows access only to
+    requests carrying the configured metrics bearer token.
 """
 
+import copy
+import hmac
+import threading
+
+from cachetools import TTLCache
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from rest_framework import permissions
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+_user_cache = None
+_user_cache_lock = threading.Lock()
+# Bumped by every invalidation; a lookup that started before one does not
+# store its (possibly outdated) user.
+_user_cache_generation = 0
 
 class CookieJWTAuthentication(JWTAuthentication):
     """JWT authentication that falls back to an access token stored in cookies.
@@ -29,9 +47,86 @@ class CookieJWTAuthentication(JWTAuthentication):
                 return f'Bearer {token}'.encode()
         return header
 
+    def get_user(self, validated_token):
+        """Return the token's user, from the user cache when possible.
+
+        Users are cached for ``AUTH_USER_CACHE_TTL`` seconds, keyed by user
+        id and the token's revoke claim (a hash of the password, see
+        ``SIMPLE_JWT['CHECK_REVOKE_TOKEN']``), so a password change misses
+        the cache. Saving or deleting a user and logging out evict the
+        user in this process; changes made elsewhere (another process,
+        ``QuerySet.update()``) take effect after the TTL at the latest.
+        Only users that passed SimpleJWT's checks (active, matching
+        password hash) are cached, and every request gets its own copy.
+        """
+        cache = get_user_cache()
+        if cache is None:
+            return super().get_user(validated_token)
+
+        key = (str(validated_token.get(api_settings.USER_ID_CLAIM)), validated_token.get(api_settings.REVOKE_TOKEN_CLAIM))
+        with _user_cache_lock:
+            user = cache.get(key)
+            generation = _user_cache_generation
+        if user is None:
+            user = super().get_user(validated_token)
+            with _user_cache_lock:
+                if generation == _user_cache_generation:
+                    cache[key] = user
+        return copy.copy(user)
+
+
+def get_user_cache():
+    """Return the process-wide TTL cache of users (``None`` if disabled)."""
+    global _user_cache
+    if _user_cache is None and settings.AUTH_USER_CACHE_TTL > 0:
+        with _user_cache_lock:
+            if _user_cache is None:
+                _user_cache = TTLCache(maxsize=settings.AUTH_USER_CACHE_SIZE, ttl=settings.AUTH_USER_CACHE_TTL)
+    return _user_cache
+
+
+def invalidate_cached_user(user_id):
+    """Drop every cached entry of user ``user_id``."""
+    global _user_cache_generation
+    with _user_cache_lock:
+        _user_cache_generation += 1
+        if _user_cache is not None:
+            for key in [key for key in _user_cache if key[0] == str(user_id)]:
+                del _user_cache[key]
+
+
+def clear_user_cache():
+    """Forget all cached users (and pick up changed cache settings)."""
+    global _user_cache, _user_cache_generation
+    with _user_cache_lock:
+        _user_cache = None
+        _user_cache_generation += 1
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_saved_user(sender, instance, **kwargs):
+    """Evict users on any change: password, deactivation, deletion."""
+    invalidate_cached_user(instance.pk)
+
 
 class IsCreator(permissions.BasePermission):
-    """Allow access only to the object creator."""
+    """Allow access only to the object creator.
+
+    Compares ``creator_id`` so the check does not load the creator row.
+    """
 
     def has_object_permission(self, request, view, obj):
-        return obj.creator == request.user
\ No newline at end of file
+        return obj.creator_id == request.user.pk
+
+
+class HasMetricsToken(permissions.BasePermission):
+    """Allow access only with ``Authorization: Bearer <METRICS_TOKEN>``.
+
+    Denies every request while ``METRICS_TOKEN`` is empty.
+    """
+
+    def has_permission(self, request, view):
+        token = settings.METRICS_TOKEN
+        header = request.META.get('HTTP_AUTHORIZATION', '')
+        return bool(token) and hmac.compare_digest(header.encode(), f'Bearer {token}'.encode())
@@ -0,0 +1,75 @@
+"""Persist generated quiz content.
+
+Both the synchronous createQuiz endpoint and the background quiz workers
+turn the quiz dict produced by the pipeline into database rows; this
+module is the single place where that happens. Deleting a quiz goes
+through :func:`delete_quiz`, which leaves a tombstone for syncing clients.
+
+The quiz and all of its questions are written in one transaction with a
+single bulk INSERT for the questions, which keeps the write lock short
+when many generators finish at the same time. The created questions are
+returned with the quiz; passing them to ``QuizPostSerializer`` (as
+``context['questions']``) serializes the new quiz without reading them
+back from the database. Both functions
+invalidate the creator's cached quiz responses (see :mod:`.response_cache`).
+"""
+
+from django.db import transaction
+
+from quiz_app.models import Quiz, Question, QuizDeletion
+from .response_cache import bump_versions
+from .sync import tombstone_cutoff
+
+
+def save_generated_quiz(quiz_json, video_url, creator):
+    """Create a Quiz and its Questions from a generated quiz dict.
+
+    Args:
+        quiz_json (dict): Quiz data with ``title``, ``description`` and
+            ``questions`` (and optionally ``transcript_source``) as
+            produced by ``generate_quiz_json_from_url``.
+        video_url (str): The (normalized) YouTube URL the quiz is based on.
+        creator (User): The user owning the new quiz.
+
+    Returns:
+        tuple[Quiz, list[Question]]: The created quiz and its questions,
+        in the order of ``quiz_json['questions']``.
+    """
+    quiz = Quiz(
+        title=quiz_json['title'],
+        description=quiz_json['description'],
+        video_url=video_url,
+        creator=creator,
+        transcript_source=quiz_json.get('transcript_source', '')
+    )
+    questions = [
+        Question(
+            question_title=question_data['question_title'],
+            question_options=question_data['question_options'],
+            answer=question_data['answer'],
+            quiz=quiz
+        )
+        for question_data in quiz_json['questions']
+    ]
+
+    with transaction.atomic():
+        quiz.save(force_insert=True)
+        for question in questions:
+            question.quiz_id = quiz.pk
+        Question.objects.bulk_create(questions)
+        bump_versions([creator.pk])
+
+    return quiz, questions
+
+
+def delete_quiz(quiz):
+    """Delete ``quiz`` and record a :class:`QuizDeletion` tombstone for it.
+
+    Tombstones of the same creator older than ``QUIZ_SYNC_TOMBSTONE_MAX_AGE``
+    are pruned at the same time.
+    """
+    with transaction.atomic():
+        QuizDeletion.objects.filter(creator_id=quiz.creator_id, deleted_at__lt=tombstone_cutoff()).delete()
+        QuizDeletion.objects.create(quiz_id=quiz.pk, creator_id=quiz.creator_id)
+        quiz.delete()
+        bump_versions([quiz.creator_id])
@@ -0,0 +1,47 @@
+"""Fast JSON rendering for the API.
+
+:class:`FastJSONRenderer` renders with `orjson <https://github.com/ijl/orjson>`_
+when it is installed (``pip install orjson``) and falls back to DRF's
+:class:`~rest_framework.renderers.JSONRenderer` otherwise. Its output is
+the same bytes DRF would produce with the default ``COMPACT_JSON`` /
+``UNICODE_JSON`` settings: values orjson does not handle identically
+(datetimes, decimals, lazy strings, ...) go through DRF's JSON encoder,
+and U+2028/U+2029 are escaped the same way. Indented output (e.g. for
+the browsable API) and non-default JSON settings use DRF's renderer.
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_encoder = JSONEncoder()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSON renderer using orjson when available."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None or orjson is None or not self.can_use_orjson(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=_encoder.default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            # E.g. integers beyond 64 bits; the standard library handles them.
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+    def can_use_orjson(self, accepted_media_type, renderer_context):
+        """Return whether orjson produces the output DRF's settings ask for."""
+        return (
+            self.compact and not self.ensure_ascii
+            and self.get_indent(accepted_media_type, renderer_context) is None
+        )
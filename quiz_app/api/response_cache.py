@@ -0,0 +1,102 @@
+"""Cache of serialized quiz list and detail responses.
+
+Quizzes rarely change after they are generated, but every read rebuilt
+the same nested quiz/question data. :func:`cached_response` keeps the
+serialized payload of successful reads in the Django cache
+(``CACHES['default']``, configured with ``CACHE_URL``), keyed by the
+requesting user, that user's cache version and the request URL.
+
+The version of a user is a random token stored in
+:class:`~quiz_app.models.QuizCacheVersion`. Every write that changes a
+user's quizzes — quiz creation (:func:`save_generated_quiz`), updates
+through ``QuizSerializer.update``, :func:`delete_quiz` and seeding —
+replaces the token with :func:`bump_versions` after writing, so older
+entries are never read again and simply expire. Reads look the token up
+before loading any quiz data (creating it for users who have none yet), so a read racing a write can at worst
+store an outdated payload under the outdated token. Because the
+token lives in the database, invalidation holds across all web and
+worker processes even with the per-process local-memory cache; a read
+costs one primary-key lookup of the token plus the cache lookup.
+
+Entries also hold the ETag/Last-Modified state of the payload (see
+:mod:`.conditional`), so a conditional request that hits the cache is
+answered without the validator query.
+
+Hits and misses are counted as ``response_cache_hits`` and
+``response_cache_misses`` in the process metrics.
+"""
+
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+from quiz_app.models import QuizCacheVersion
+from .conditional import conditional_response, set_validators
+from .metrics import count
+
+KEY_PREFIX = 'quizly:response'
+
+
+def bump_versions(user_ids):
+    """Invalidate the cached responses of ``user_ids`` with one upsert."""
+    QuizCacheVersion.objects.bulk_create(
+        [QuizCacheVersion(user_id=user_id, token=uuid.uuid4().hex) for user_id in set(user_ids)],
+        update_conflicts=True, unique_fields=['user'], update_fields=['token']
+    )
+
+
+def get_cache_key(request):
+    """Return the cache key of ``request``, creating the user's version token if needed."""
+    user_id = request.user.pk
+    token = QuizCacheVersion.objects.filter(user_id=user_id).values_list('token', flat=True).first()
+    if token is None:
+        version, _created = QuizCacheVersion.objects.get_or_create(
+            user_id=user_id, defaults={'token': uuid.uuid4().hex}
+        )
+        token = version.token
+    url = hashlib.sha1(request.build_absolute_uri().encode()).hexdigest()
+    return f"{KEY_PREFIX}:{user_id}:{token}:{url}"
+
+
+def cached_response(request, build_response, get_state):
+    """Return the response to a conditional GET, from the cache when possible.
+
+    ``get_state`` returns the validator state of the requested resource
+    (``None`` if the requester may not see it) and ``build_response``
+    builds the full response; both are only called on a cache miss, and
+    only 200 responses are stored. A request whose ``If-None-Match`` /
+    ``If-Modified-Since`` matches is answered with 304.
+
+    Entries expire after ``QUIZ_RESPONSE_CACHE_TIMEOUT`` seconds, which
+    also bounds how long changes made outside the invalidating write
+    paths (e.g. in the admin) can go unnoticed.
+    """
+    key = get_cache_key(request) if settings.QUIZ_RESPONSE_CACHE_ENABLED else None
+    entry = cache.get(key) if key is not None else None
+    if entry is not None:
+        count('response_cache_hits')
+        state, data = entry
+    else:
+        if key is not None:
+            count('response_cache_misses')
+        state, data = get_state(), None
+
+    if state is not None:
+        not_modified = conditional_response(request, state)
+        if not_modified is not None:
+            return not_modified
+
+    if data is not None:
+        response = Response(data)
+    else:
+        response = build_response()
+        if key is not None and state is not None and response.status_code == status.HTTP_200_OK:
+            cache.set(key, (state, response.data), settings.QUIZ_RESPONSE_CACHE_TIMEOUT)
+
+    if state is not None and response.status_code == status.HTTP_200_OK:
+        set_validators(response, request, state)
+    return response
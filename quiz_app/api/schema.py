@@ -0,0 +1,106 @@
+"""Schema of generated quizzes.
+
+The pydantic models serve two purposes: they are passed to Gemini as the
+response schema (structured output), and they validate whatever the model
+returns before it reaches the database. Questions are validated one by
+one, so a quiz with a few broken questions keeps its good ones and only
+the broken ones have to be generated again (see
+:func:`quiz_app.api.llm.generate_quiz_json`).
+"""
+
+from typing import Annotated
+
+from pydantic import BaseModel, Field, StringConstraints, ValidationError, field_validator, model_validator
+
+QUESTION_COUNT = 10
+OPTION_COUNT = 4
+TITLE_MAX_LENGTH = 63
+
+Text = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=255)]
+
+
+class QuizValidationError(ValueError):
+    """The model output could not be turned into a valid quiz."""
+
+
+class QuizQuestion(BaseModel):
+    question_title: Text
+    question_options: Annotated[list[Text], Field(min_length=OPTION_COUNT, max_length=OPTION_COUNT)]
+    answer: Text
+
+    @model_validator(mode='after')
+    def check_options(self):
+        if len(set(self.question_options)) != OPTION_COUNT:
+            raise ValueError("question_options must be distinct")
+        if self.answer not in self.question_options:
+            raise ValueError("answer must be one of question_options")
+        return self
+
+
+class QuizHeader(BaseModel):
+    title: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+    description: Annotated[str, StringConstraints(strip_whitespace=True)]
+
+    @field_validator('title')
+    @classmethod
+    def fit_title(cls, value):
+        # Quiz.title is a CharField(max_length=63); a long title is not worth a retry.
+        return value[:TITLE_MAX_LENGTH].rstrip()
+
+
+class QuizSchema(QuizHeader):
+    """Response schema of the quiz prompt."""
+
+    questions: Annotated[list[QuizQuestion], Field(min_length=QUESTION_COUNT, max_length=QUESTION_COUNT)]
+
+
+def validate_quiz(data):
+    """Validate a quiz dict question by question.
+
+    Args:
+        data (dict): The parsed model output.
+
+    Returns:
+        tuple[dict, int]: The quiz with ``title``, ``description`` and its
+        valid ``questions`` (duplicates and extra questions dropped), and
+        the number of questions still missing to reach
+        :data:`QUESTION_COUNT`.
+
+    Raises:
+        QuizValidationError: If the title or description is unusable or
+            ``questions`` is not a list.
+    """
+    try:
+        header = QuizHeader.model_validate(data)
+    except ValidationError as exc:
+        raise QuizValidationError(f"Invalid quiz: {exc}") from exc
+
+    questions = data.get('questions')
+    if not isinstance(questions, list):
+        raise QuizValidationError("Invalid quiz: 'questions' is not a list")
+
+    quiz = header.model_dump()
+    quiz['questions'] = []
+    add_valid_questions(quiz, questions)
+    return quiz, QUESTION_COUNT - len(quiz['questions'])
+
+
+def add_valid_questions(quiz, candidates):
+    """Append the valid, new entries of ``candidates`` to ``quiz['questions']``.
+
+    Returns:
+        int: The number of questions still missing.
+    """
+    titles = {question['question_title'].lower() for question in quiz['questions']}
+    for candidate in candidates:
+        if len(quiz['questions']) >= QUESTION_COUNT:
+            break
+        try:
+            question = QuizQuestion.model_validate(candidate).model_dump()
+        except ValidationError:
+            continue
+        if question['question_title'].lower() in titles:
+            continue
+        titles.add(question['question_title'].lower())
+        quiz['questions'].append(question)
+    return QUESTION_COUNT - len(quiz['questions'])
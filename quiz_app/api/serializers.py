@@ -1,12 +1,28 @@
 """Serializers for the quiz app API.
 
-Provide serializers for Question and Quiz models and a specialized
-serializer used when creating quizzes from a YouTube URL.
+Provide serializers for Question and Quiz models, a specialized
+serializer used when creating quizzes from a YouTube URL and a
+serializer reporting the state of background generation jobs.
+
+The read endpoints do not run :class:`QuizSerializer` per object:
+:func:`quiz_values` and :func:`serialize_quiz_rows` load plain rows with
+``.values()`` and build the same representation directly, which avoids
+model instances and per-field method dispatch on large lists. Their
+output is identical to ``QuizSerializer(...).data``.
 """
 
+from django.urls import reverse
+from django.utils import timezone
 from rest_framework import serializers
 
-from quiz_app.models import Quiz, Question
+from quiz_app.models import Quiz, Question, QuizGenerationJob
+from .conditional import PreconditionFailed
+from .response_cache import bump_versions
+
+
+def format_datetime(dt):
+    """Format ``dt`` (UTC) like 'YYYY-MM-DDTHH:MM:SS.mmmZ' (milliseconds truncated)."""
+    return dt.isoformat(timespec='milliseconds')[:23] + 'Z'
 
 
 class QuestionSerializer(serializers.ModelSerializer):
@@ -28,7 +44,7 @@ class QuestionSerializer(serializers.ModelSerializer):
         Returns:
             str: Formatted datetime like 'YYYY-MM-DDTHH:MM:SS.mmmZ'.
         """
-        return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{int(dt.microsecond / 1000):03d}Z"
+        return format_datetime(dt)
 
 
     def get_created_at(self, obj):
@@ -51,7 +67,7 @@ class QuizPostSerializer(serializers.ModelSerializer):
     created_at = serializers.SerializerMethodField()
     updated_at = serializers.SerializerMethodField()
     url = serializers.URLField(write_only=True)
-    questions = QuestionSerializer(many=True, read_only=True)
+    questions = serializers.SerializerMethodField()
 
     class Meta:
         model = Quiz
@@ -77,7 +93,7 @@ class QuizPostSerializer(serializers.ModelSerializer):
 
     def format_datetime(self, dt):
         """Format a datetime value for API output."""
-        return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{int(dt.microsecond / 1000):03d}Z"
+        return format_datetime(dt)
 
 
     def get_created_at(self, obj):
@@ -90,6 +106,18 @@ class QuizPostSerializer(serializers.ModelSerializer):
         return self.format_datetime(obj.updated_at)
 
 
+    def get_questions(self, obj):
+        """Return the serialized questions of the quiz.
+
+        ``context['questions']`` (the questions just created by
+        ``save_generated_quiz``) is used instead of querying them.
+        """
+        questions = self.context.get('questions')
+        if questions is None:
+            questions = obj.questions.all()
+        return QuestionSerializer(questions, many=True).data
+
+
     def validate_url(self, value):
         """Normalize YouTube short URLs to full watch URLs.
 
@@ -132,7 +160,7 @@ class QuizSerializer(serializers.ModelSerializer):
 
     def format_datetime(self, dt):
         """Format datetime values consistently for API output."""
-        return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{int(dt.microsecond / 1000):03d}Z"
+        return format_datetime(dt)
 
 
     def get_created_at(self, obj):
@@ -146,8 +174,117 @@ class QuizSerializer(serializers.ModelSerializer):
 
 
     def update(self, instance, validated_data):
-        """Update mutable fields of a Quiz instance and persist changes."""
+        """Update mutable fields of a Quiz instance and persist changes.
+
+        With ``expected_updated_at`` (passed to ``save()``) the row is only
+        written if its ``updated_at`` still has that value, in a single
+        UPDATE; otherwise :class:`PreconditionFailed` is raised. The
+        creator's cached quiz responses are invalidated afterwards.
+        """
+        expected_updated_at = validated_data.pop('expected_updated_at', None)
         instance.title = validated_data.get('title', instance.title)
         instance.description = validated_data.get('description', instance.description)
-        instance.save()
-        return instance
\ No newline at end of file
+        if expected_updated_at is None:
+            instance.save()
+        else:
+            instance.updated_at = timezone.now()
+            updated = Quiz.objects.filter(pk=instance.pk, updated_at=expected_updated_at).update(
+                title=instance.title, description=instance.description, updated_at=instance.updated_at
+            )
+            if not updated:
+                raise PreconditionFailed()
+        bump_versions([instance.creator_id])
+        return instance
+
+
+class QuizGenerationJobSerializer(serializers.ModelSerializer):
+    """Serialize the state of a background quiz generation job.
+
+    Once the job has succeeded, ``quiz`` holds the id of the generated
+    quiz and ``quiz_url`` links to its detail endpoint.
+    """
+
+    created_at = serializers.SerializerMethodField()
+    updated_at = serializers.SerializerMethodField()
+    quiz_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = QuizGenerationJob
+        fields = ['id', 'status', 'video_url', 'quiz', 'quiz_url', 'error', 'created_at', 'updated_at']
+        read_only_fields = fields
+
+
+    def format_datetime(self, dt):
+        """Format datetime values consistently for API output."""
+        return format_datetime(dt)
+
+
+    def get_created_at(self, obj):
+        """Return formatted created_at timestamp."""
+        return self.format_datetime(obj.created_at)
+
+
+    def get_updated_at(self, obj):
+        """Return formatted updated_at timestamp."""
+        return self.format_datetime(obj.updated_at)
+
+
+    def get_quiz_url(self, obj):
+        """Return the URL of the generated quiz, if there is one."""
+        if obj.quiz_id is None:
+            return None
+        url = reverse('quizzes-detail', kwargs={'pk': obj.quiz_id})
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+
+QUIZ_FIELDS = QuizSerializer.Meta.fields
+QUESTION_FIELDS = QuestionSerializer.Meta.fields
+TIMESTAMP_FIELDS = ('created_at', 'updated_at')
+
+
+def quiz_values(queryset, fields=None):
+    """Return ``queryset`` as rows for :func:`serialize_quiz_rows`.
+
+    Only the columns of ``fields`` (all fields if ``None``) are selected,
+    plus ``id`` and ``created_at``, which the list pagination needs.
+    """
+    columns = [name for name in QUIZ_FIELDS if name != 'questions' and (fields is None or name in fields)]
+    return queryset.values(*dict.fromkeys(['id', 'created_at', *columns]))
+
+
+def serialize_quiz_rows(rows, fields=None):
+    """Return the ``QuizSerializer`` representation of quiz ``rows``.
+
+    ``rows`` are dicts from :func:`quiz_values`; the questions of all of
+    them are loaded with one query if ``questions`` is among ``fields``.
+    """
+    rows = list(rows)
+    names = [name for name in QUIZ_FIELDS if fields is None or name in fields]
+    questions = question_representations([row['id'] for row in rows]) if 'questions' in names else {}
+
+    data = []
+    for row in rows:
+        quiz = {}
+        for name in names:
+            if name == 'questions':
+                quiz[name] = questions.get(row['id'], [])
+            elif name in TIMESTAMP_FIELDS:
+                quiz[name] = format_datetime(row[name])
+            else:
+                quiz[name] = row[name]
+        data.append(quiz)
+    return data
+
+
+def question_representations(quiz_ids):
+    """Return the ``QuestionSerializer`` representations of the quizzes' questions by quiz id."""
+    questions = {}
+    if not quiz_ids:
+        return questions
+    for row in Question.objects.filter(quiz_id__in=quiz_ids).values('quiz_id', *QUESTION_FIELDS):
+        questions.setdefault(row['quiz_id'], []).append({
+            name: format_datetime(row[name]) if name in TIMESTAMP_FIELDS else row[name]
+            for name in QUESTION_FIELDS
+        })
+    return questions
@@ -0,0 +1,168 @@
+"""Deterministic offline backends for benchmarks and load tests.
+
+These stand in for YouTube, Whisper and Gemini (see
+:mod:`quiz_app.api.backends`) so the rest of the system — views, jobs,
+workers, caching and persistence — can be exercised on a machine without
+network access or a GPU. Select them in settings::
+
+    QUIZ_FETCHER_BACKEND=quiz_app.api.stubs.FixtureAudioFetcher
+    QUIZ_TRANSCRIBER_BACKEND=quiz_app.api.stubs.CannedTranscriber
+    QUIZ_GENERATOR_BACKEND=quiz_app.api.stubs.TemplateQuizGenerator
+
+``QUIZ_STUB_TRANSCRIBE_LATENCY`` and ``QUIZ_STUB_GENERATE_LATENCY``
+(seconds) simulate the time the real services take.
+"""
+
+import hashlib
+import shutil
+import time
+import wave
+from pathlib import Path
+
+from django.conf import settings
+
+from .audio import SAMPLE_RATE
+from .backends import Fetcher, Generator, Transcriber
+from .schema import OPTION_COUNT, QUESTION_COUNT
+
+# Spoken lectures run at roughly 150 words per minute.
+WORDS_PER_SECOND = 2.5
+
+CANNED_TRANSCRIPT = (
+    "Cells are the basic unit of life. "
+    "Every living organism is made of one or more cells. "
+    "The cell membrane controls what enters and leaves the cell. "
+    "The nucleus stores the genetic information of the cell. "
+    "Mitochondria produce most of the energy a cell needs. "
+    "Ribosomes build proteins from amino acids. "
+    "Plant cells have a cell wall made of cellulose. "
+    "Chloroplasts let plant cells turn sunlight into sugar. "
+    "Cells divide by mitosis to grow and repair tissue. "
+    "Meiosis produces the sex cells needed for reproduction. "
+    "Bacteria are single cells without a nucleus. "
+    "Stem cells can develop into many different cell types. "
+)
+
+
+class FixtureAudioFetcher(Fetcher):
+    """Serve audio from local fixture files instead of YouTube.
+
+    With ``QUIZ_STUB_AUDIO_DIR`` set, every video URL is mapped to one of
+    the files in that directory (``<video id>.*`` if present, otherwise
+    a stable choice by URL hash) and the file is copied into the run's
+    workspace like a download. Without it, a silent WAV of
+    ``QUIZ_STUB_AUDIO_SECONDS`` is written instead. No captions are
+    returned, so every uncached run goes through transcription.
+    """
+
+    def load_audio(self, url, workspace):
+        source = self.select_fixture(url)
+        target = Path(workspace) / ("audio" + (source.suffix if source else ".wav"))
+        if source is None:
+            write_silence(target, settings.QUIZ_STUB_AUDIO_SECONDS)
+        else:
+            shutil.copyfile(source, target)
+        return str(target)
+
+    def select_fixture(self, url):
+        """Return the fixture file for ``url`` or ``None`` if there are none."""
+        if not settings.QUIZ_STUB_AUDIO_DIR:
+            return None
+        from .utils import extract_video_id
+
+        files = sorted(path for path in Path(settings.QUIZ_STUB_AUDIO_DIR).iterdir() if path.is_file())
+        if not files:
+            return None
+        video_id = extract_video_id(url)
+        for path in files:
+            if path.stem == video_id:
+                return path
+        digest = int(hashlib.sha1(url.encode()).hexdigest(), 16)
+        return files[digest % len(files)]
+
+
+class CannedTranscriber(Transcriber):
+    """Return a canned lecture transcript as long as the audio.
+
+    The transcript cycles through the sentences of
+    ``QUIZ_STUB_TRANSCRIPT`` (a text file; a short built-in lecture by
+    default) until it has as many words as the audio would contain.
+    """
+
+    def get_cache_key(self):
+        return "stub"
+
+    def transcribe(self, audio):
+        time.sleep(settings.QUIZ_STUB_TRANSCRIBE_LATENCY)
+        sentences = self.load_sentences()
+        words = max(1, int(audio_seconds(audio) * WORDS_PER_SECOND))
+
+        transcript, count = [], 0
+        while count < words:
+            sentence = sentences[len(transcript) % len(sentences)]
+            transcript.append(sentence)
+            count += len(sentence.split())
+        return " ".join(transcript)
+
+    def load_sentences(self):
+        text = CANNED_TRANSCRIPT
+        if settings.QUIZ_STUB_TRANSCRIPT:
+            text = Path(settings.QUIZ_STUB_TRANSCRIPT).read_text(encoding="utf-8")
+        return [sentence.strip() + "." for sentence in text.split(".") if sentence.strip()]
+
+
+class TemplateQuizGenerator(Generator):
+    """Build a valid quiz from the transcript's sentences without an LLM.
+
+    Each question asks which word completes one of the first distinct
+    sentences; the other options are words from other sentences.
+    """
+
+    def generate(self, transcript_text):
+        time.sleep(settings.QUIZ_STUB_GENERATE_LATENCY)
+        sentences = list(dict.fromkeys(
+            sentence.strip() for sentence in transcript_text.split(".") if len(sentence.split()) > 2
+        ))
+        if not sentences:
+            sentences = ["The transcript of this video is empty"]
+
+        answers = [sentence.split()[-1] for sentence in sentences]
+        distractors = list(dict.fromkeys(answers + ["energy", "protein", "membrane", "nucleus", "tissue"]))
+        questions = []
+        for index in range(QUESTION_COUNT):
+            sentence = sentences[index % len(sentences)]
+            words = sentence.split()
+            answer = words[-1]
+            options = [answer] + [word for word in distractors if word != answer][:OPTION_COUNT - 1]
+            options = options[index % OPTION_COUNT:] + options[:index % OPTION_COUNT]
+            questions.append({
+                "question_title": f"{index + 1}. Complete the sentence: {' '.join(words[:-1])} ...?"[:255],
+                "question_options": options,
+                "answer": answer,
+            })
+
+        return {
+            "title": " ".join(sentences[0].split()[:6])[:63],
+            "description": transcript_text[:150],
+            "questions": questions,
+        }
+
+
+def audio_seconds(audio):
+    """Return the duration of ``audio`` (a WAV path or samples) in seconds."""
+    if isinstance(audio, str):
+        try:
+            with wave.open(audio, "rb") as wav:
+                return wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError):
+            return Path(audio).stat().st_size / (SAMPLE_RATE * 2)
+    return len(audio) / SAMPLE_RATE
+
+
+def write_silence(path, seconds):
+    """Write ``seconds`` of 16 kHz mono silence to a WAV file at ``path``."""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(b"\x00\x00" * int(seconds * SAMPLE_RATE))
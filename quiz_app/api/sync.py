@@ -0,0 +1,81 @@
+"""Incremental sync of a user's quiz list.
+
+Clients that poll ``/api/quizzes/`` pass the ``watermark`` of their
+previous response as ``?updated_since=`` and get back only the quizzes
+that changed since then (the quiz itself or one of its questions) plus
+the ids of quizzes deleted since then. Deletions are recorded as
+:class:`~quiz_app.models.QuizDeletion` tombstones by
+:func:`~quiz_app.api.persistence.delete_quiz`; tombstones older than
+``QUIZ_SYNC_TOMBSTONE_MAX_AGE`` are pruned, so a client whose
+``updated_since`` is older than that must reload the full list.
+
+Writers stamp ``updated_at`` / ``deleted_at`` before their transaction
+commits, so a row can become visible after a poll that started later
+than its stamp. The returned watermark therefore lags the poll by
+``QUIZ_SYNC_WATERMARK_LAG`` seconds and timestamps are compared
+inclusively: a change committed within that lag is still picked up by
+the next poll, at the cost of sending changes of the last
+``QUIZ_SYNC_WATERMARK_LAG`` seconds more than once. Clients apply
+results as upserts, so duplicates are harmless.
+"""
+
+from datetime import timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+from quiz_app.models import Question, QuizDeletion
+
+
+class SyncExpired(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = "updated_since is older than the retained deletion log; reload the full list."
+    default_code = 'sync_expired'
+
+
+def parse_since(value):
+    """Return ``value`` (an ISO 8601 timestamp) as an aware datetime.
+
+    Raises a ValidationError (400) for unparsable timestamps and
+    :class:`SyncExpired` (410) when deletions since then may have been
+    pruned.
+    """
+    try:
+        since = parse_datetime(value.strip().replace(' ', '+'))
+    except ValueError:
+        since = None
+    if since is None:
+        raise ValidationError({'updated_since': ["Expected an ISO 8601 timestamp."]})
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since, dt_timezone.utc)
+    if since < tombstone_cutoff():
+        raise SyncExpired()
+    return since
+
+
+def tombstone_cutoff():
+    """Return the time before which tombstones are no longer kept."""
+    return timezone.now() - timedelta(seconds=settings.QUIZ_SYNC_TOMBSTONE_MAX_AGE)
+
+
+def sync_watermark():
+    """Return the watermark of a poll starting now (see the module docstring)."""
+    return timezone.now() - timedelta(seconds=settings.QUIZ_SYNC_WATERMARK_LAG)
+
+
+def changed_quizzes(queryset, since):
+    """Filter ``queryset`` to quizzes that or whose questions changed since ``since``."""
+    changed_questions = Question.objects.filter(updated_at__gte=since).values('quiz_id')
+    return queryset.filter(Q(updated_at__gte=since) | Q(id__in=changed_questions))
+
+
+def deleted_quiz_ids(creator_id, since):
+    """Return the ids of ``creator_id``'s quizzes deleted since ``since``."""
+    return list(
+        QuizDeletion.objects.filter(creator_id=creator_id, deleted_at__gte=since)
+        .order_by('deleted_at', 'quiz_id').values_list('quiz_id', flat=True)
+    )
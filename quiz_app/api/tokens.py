@@ -0,0 +1,114 @@
+"""Token counting, normalization and splitting of transcripts.
+
+Transcripts go into the quiz prompt, so their size drives LLM latency
+and cost. Tokens are counted with tiktoken (``QUIZ_TOKEN_ENCODING``).
+Gemini uses its own tokenizer, but the counts are close enough for
+budgeting. If the encoding cannot be loaded (tiktoken downloads it on
+first use), counts fall back to an estimate of four characters per token.
+
+:func:`normalize_transcript` removes filler words and repeated
+sentences, which are common in spoken lectures and in Whisper's
+hallucination loops. :func:`split_by_tokens` cuts a transcript into
+chunks of at most a given token count along sentence boundaries.
+"""
+
+import logging
+import re
+import threading
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+
+# Only pure disfluencies: phrases like "you know" or "I mean" are often
+# content ("Do you know the answer?") and are kept.
+FILLER_PATTERN = re.compile(
+    r"(?<![\w'-])(?:u+m+|u+h+|e+r+m+|h+m+|m+h+m+)(?![\w'-])[,.]?\s*",
+    flags=re.IGNORECASE,
+)
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+WHITESPACE_PATTERN = re.compile(r"[ \t]+")
+
+# How many preceding sentences a sentence is compared with when dropping repeats.
+REPEAT_WINDOW = 3
+
+_encoding = None
+_encoding_failed = False
+_encoding_lock = threading.Lock()
+
+
+def get_encoding():
+    """Return the tiktoken encoding, or ``None`` if it cannot be loaded."""
+    global _encoding, _encoding_failed
+    if _encoding is None and not _encoding_failed:
+        with _encoding_lock:
+            if _encoding is None and not _encoding_failed:
+                try:
+                    import tiktoken
+
+                    _encoding = tiktoken.get_encoding(settings.QUIZ_TOKEN_ENCODING)
+                except Exception as exc:
+                    _encoding_failed = True
+                    logger.warning("Could not load tiktoken encoding, estimating token counts: %s", exc)
+    return _encoding
+
+
+def count_tokens(text):
+    """Return the number of tokens in ``text``."""
+    encoding = get_encoding()
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def split_sentences(text):
+    """Split ``text`` into sentences (and lines without punctuation)."""
+    return [sentence.strip() for sentence in SENTENCE_PATTERN.split(text) if sentence.strip()]
+
+
+def normalize_transcript(text):
+    """Strip filler words and repeated sentences from a transcript."""
+    text = FILLER_PATTERN.sub("", text)
+    text = WHITESPACE_PATTERN.sub(" ", text)
+
+    sentences = []
+    recent = []
+    for sentence in split_sentences(text):
+        key = re.sub(r"\W+", " ", sentence).strip().lower()
+        if not key or key in recent:
+            continue
+        sentences.append(sentence[:1].upper() + sentence[1:])
+        recent = (recent + [key])[-REPEAT_WINDOW:]
+    return " ".join(sentences)
+
+
+def split_by_tokens(text, max_tokens):
+    """Split ``text`` into chunks of at most ``max_tokens`` tokens.
+
+    Chunks end on sentence boundaries; a single sentence longer than
+    ``max_tokens`` is split by words.
+    """
+    chunks = []
+    current, current_tokens = [], 0
+    for sentence in split_sentences(text):
+        tokens = count_tokens(sentence) + 1
+        if tokens > max_tokens:
+            words = sentence.split()
+            step = max(1, len(words) * max_tokens // tokens)
+            pieces = [" ".join(words[i:i + step]) for i in range(0, len(words), step)]
+        else:
+            pieces = [sentence]
+
+        for piece in pieces:
+            piece_tokens = count_tokens(piece) + 1 if len(pieces) > 1 else tokens
+            if current and current_tokens + piece_tokens > max_tokens:
+                chunks.append(" ".join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece_tokens
+
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
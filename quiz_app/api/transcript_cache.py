@@ -0,0 +1,99 @@
+"""Database-backed cache of video transcripts.
+
+Transcribing a video is the most expensive step of quiz generation and
+popular videos are submitted over and over. Transcripts are therefore
+stored zlib-compressed in :class:`~quiz_app.models.TranscriptCacheEntry`
+rows keyed by the YouTube video id and the Whisper model that produced
+them.
+
+The cache is bounded by age (``TRANSCRIPT_CACHE_MAX_AGE`` seconds since
+creation) and by total compressed size (``TRANSCRIPT_CACHE_MAX_BYTES``);
+when the size limit is exceeded the least recently used entries are
+evicted first.
+"""
+
+import zlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import Sum
+from django.utils import timezone
+
+from quiz_app.models import TranscriptCacheEntry
+
+
+def get_cached_transcript(video_id, model_name):
+    """Return the cached transcript or ``None`` on a miss.
+
+    A hit refreshes the entry's ``last_used_at`` so it survives LRU
+    eviction; expired entries count as misses.
+    """
+    if not settings.TRANSCRIPT_CACHE_ENABLED:
+        return None
+
+    entry = (
+        TranscriptCacheEntry.objects
+        .filter(video_id=video_id, model_name=model_name, created_at__gte=_expiry_cutoff())
+        .only('id', 'compressed_text')
+        .first()
+    )
+    if entry is None:
+        return None
+
+    TranscriptCacheEntry.objects.filter(pk=entry.pk).update(last_used_at=timezone.now())
+    return zlib.decompress(bytes(entry.compressed_text)).decode('utf-8')
+
+
+def store_transcript(video_id, model_name, text):
+    """Store ``text`` for ``video_id``/``model_name`` and enforce the limits."""
+    if not settings.TRANSCRIPT_CACHE_ENABLED:
+        return
+
+    compressed = zlib.compress(text.encode('utf-8'), level=6)
+    if len(compressed) > settings.TRANSCRIPT_CACHE_MAX_BYTES:
+        return
+
+    values = {
+        'compressed_text': compressed,
+        'size': len(compressed),
+        'created_at': timezone.now(),
+        'last_used_at': timezone.now(),
+    }
+    try:
+        TranscriptCacheEntry.objects.update_or_create(
+            video_id=video_id, model_name=model_name, defaults=values
+        )
+    except IntegrityError:
+        # A concurrent run stored the same transcript first; keep theirs.
+        pass
+
+    evict()
+
+
+def evict():
+    """Delete expired entries, then least recently used ones over the size limit.
+
+    Returns:
+        int: Number of entries deleted.
+    """
+    deleted, _ = TranscriptCacheEntry.objects.filter(created_at__lt=_expiry_cutoff()).delete()
+
+    total = TranscriptCacheEntry.objects.aggregate(total=Sum('size'))['total'] or 0
+    excess = total - settings.TRANSCRIPT_CACHE_MAX_BYTES
+    if excess <= 0:
+        return deleted
+
+    victims = []
+    for pk, size in TranscriptCacheEntry.objects.order_by('last_used_at', 'id').values_list('id', 'size').iterator():
+        if excess <= 0:
+            break
+        victims.append(pk)
+        excess -= size
+
+    return deleted + TranscriptCacheEntry.objects.filter(pk__in=victims).delete()[0]
+
+
+def _expiry_cutoff():
+    """Return the creation time before which entries are expired."""
+    return timezone.now() - timedelta(seconds=settings.TRANSCRIPT_CACHE_MAX_AGE)
@@ -0,0 +1,178 @@
+"""Parallel transcription of long audio.
+
+A single ``model.transcribe`` call runs on one core, so an hour-long
+lecture takes far longer than a request can wait. For audio longer than
+``WHISPER_CHUNKED_MIN_SECONDS`` the samples are split into chunks of
+roughly ``WHISPER_CHUNK_SECONDS``, cut at the quietest point near each
+boundary so words are not split, and every chunk is extended by
+``WHISPER_CHUNK_OVERLAP`` seconds on both sides for context.
+
+The chunks are transcribed in parallel by a process pool whose workers
+each load the Whisper model once at start-up. Every chunk "owns" the
+span between its two cut points; only segments whose midpoint falls
+into that span are kept, so the overlaps are not transcribed twice into
+the result.
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+from django.conf import settings
+
+from .audio import SAMPLE_RATE, frame_energy
+from .whisper_models import get_device
+
+SPLIT_FRAME_SECONDS = 0.025
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# Model loaded by each pool worker process in _init_worker().
+_worker_model = None
+_worker_fp16 = False
+
+
+def plan_chunks(audio, chunk_seconds, overlap_seconds, search_seconds=None):
+    """Plan chunk boundaries for ``audio``.
+
+    Args:
+        audio (numpy.ndarray): Mono 16 kHz float32 samples.
+        chunk_seconds (float): Target length of the owned span per chunk.
+        overlap_seconds (float): Extra context added on both sides.
+        search_seconds (float, optional): How far around each target
+            boundary to look for silence. Defaults to a sixth of
+            ``chunk_seconds``.
+
+    Returns:
+        list[tuple[int, int, int, int]]: ``(start, end, own_start,
+        own_end)`` sample indices per chunk. ``start``/``end`` include the
+        overlap; ``own_start``/``own_end`` are the cut points.
+    """
+    total = len(audio)
+    chunk = int(chunk_seconds * SAMPLE_RATE)
+    overlap = int(overlap_seconds * SAMPLE_RATE)
+    search = int((search_seconds if search_seconds is not None else chunk_seconds / 6) * SAMPLE_RATE)
+    frame = int(SPLIT_FRAME_SECONDS * SAMPLE_RATE)
+
+    cuts = [0]
+    while total - cuts[-1] > chunk + search:
+        target = cuts[-1] + chunk
+        low = max(cuts[-1] + frame, target - search)
+        high = min(total, target + search)
+        energy = frame_energy(audio[low:high], frame)
+        cut = low + int(np.argmin(energy)) * frame if len(energy) else target
+        cuts.append(cut)
+    cuts.append(total)
+
+    return [
+        (max(0, own_start - overlap), min(total, own_end + overlap), own_start, own_end)
+        for own_start, own_end in zip(cuts, cuts[1:])
+    ]
+
+
+def stitch_segments(chunk_results, plan):
+    """Merge per-chunk segments into one transcript.
+
+    Args:
+        chunk_results (list[list[dict]]): Whisper segments (``start``,
+            ``end``, ``text``; seconds relative to the chunk) per chunk.
+        plan (list[tuple]): The chunk plan from :func:`plan_chunks`.
+
+    Returns:
+        str: The transcript text in order without overlap duplicates.
+    """
+    texts = []
+    for segments, (start, _end, own_start, own_end) in zip(chunk_results, plan):
+        offset = start / SAMPLE_RATE
+        own_from, own_to = own_start / SAMPLE_RATE, own_end / SAMPLE_RATE
+        for segment in segments:
+            midpoint = offset + (segment['start'] + segment['end']) / 2
+            if not own_from <= midpoint < own_to:
+                continue
+            text = segment['text'].strip()
+            # A sentence straddling a cut point can still show up in both chunks.
+            if text and (not texts or texts[-1] != text):
+                texts.append(text)
+    return " ".join(texts)
+
+
+def transcribe_chunked(audio, executor=None):
+    """Transcribe ``audio`` in parallel chunks and return the text.
+
+    Args:
+        audio (numpy.ndarray): Mono 16 kHz float32 samples.
+        executor (concurrent.futures.Executor, optional): Executor to run
+            the chunks on. Defaults to the shared process pool.
+    """
+    plan = plan_chunks(audio, settings.WHISPER_CHUNK_SECONDS, settings.WHISPER_CHUNK_OVERLAP)
+    chunks = [audio[start:end] for start, end, _own_start, _own_end in plan]
+    try:
+        results = list((executor or get_pool()).map(transcribe_chunk, chunks))
+    except BrokenProcessPool:
+        # A crashed worker breaks the pool for good; start a new one next time.
+        if executor is None:
+            shutdown_pool()
+        raise
+    return stitch_segments(results, plan)
+
+
+def should_chunk(audio):
+    """Return whether ``audio`` is long enough to be transcribed in chunks."""
+    return (
+        settings.WHISPER_CHUNKED_ENABLED
+        and settings.WHISPER_CHUNK_WORKERS > 1
+        and len(audio) >= settings.WHISPER_CHUNKED_MIN_SECONDS * SAMPLE_RATE
+    )
+
+
+def get_pool():
+    """Return the process pool shared by all chunked transcriptions."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                workers = settings.WHISPER_CHUNK_WORKERS
+                threads = max(1, (os.cpu_count() or 1) // workers)
+                _pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(settings.WHISPER_MODEL, get_device(), threads),
+                )
+                atexit.register(shutdown_pool)
+    return _pool
+
+
+def shutdown_pool():
+    """Stop the worker processes of the shared pool, if it was started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+
+def _init_worker(model_name, device, threads):
+    """Load the Whisper model once in a freshly started pool process."""
+    global _worker_model, _worker_fp16
+    import torch
+    import whisper
+
+    # Each worker gets its share of the cores instead of all of them.
+    torch.set_num_threads(threads)
+    _worker_model = whisper.load_model(model_name, device=device)
+    _worker_fp16 = device == "cuda"
+
+
+def transcribe_chunk(samples):
+    """Transcribe one chunk in a pool worker and return its segments."""
+    result = _worker_model.transcribe(samples, fp16=_worker_fp16)
+    return [
+        {'start': segment['start'], 'end': segment['end'], 'text': segment['text']}
+        for segment in result['segments']
+    ]
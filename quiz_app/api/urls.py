@@ -1,13 +1,21 @@
 """URL configuration for the quiz app API endpoints.
 
-Exports routes for creating quizzes and for listing/retrieving/updating
-quizzes owned by the authenticated user.
+Exports routes for creating quizzes, following background generation
+jobs and listing/retrieving/updating quizzes owned by the authenticated
+user, plus a readiness probe and pipeline metrics.
 """
 
 from django.urls import path
 from rest_framework import routers
 
-from .views import CreateQuizAPIView, QuizListAPIView, QuizRetrieveUpdateDestroyAPIView
+from .views import (
+    CreateQuizAPIView,
+    QuizListAPIView,
+    QuizRetrieveUpdateDestroyAPIView,
+    QuizGenerationJobRetrieveAPIView,
+    ReadinessAPIView,
+    MetricsAPIView,
+)
 
 router = routers.DefaultRouter()
 
@@ -15,4 +23,7 @@ urlpatterns = [
     path('createQuiz/', CreateQuizAPIView.as_view(), name='create-quiz'),
     path('quizzes/', QuizListAPIView.as_view(), name='quizzes-list'),
     path('quizzes/<int:pk>/', QuizRetrieveUpdateDestroyAPIView.as_view(), name='quizzes-detail'),
+    path('jobs/<int:pk>/', QuizGenerationJobRetrieveAPIView.as_view(), name='jobs-detail'),
+    path('health/ready/', ReadinessAPIView.as_view(), name='readiness'),
+    path('metrics/', MetricsAPIView.as_view(), name='metrics'),
 ]
\ No newline at end of file
@@ -1,10 +1,54 @@
 import yt_dlp
+import hashlib
 import re
-import os
-import whisper
-from google import genai
-import json
-from pathlib import Path
+import logging
+from urllib.parse import urlparse, parse_qs
+
+from django.conf import settings
+
+from quiz_app.models import Quiz, TranscriptCacheEntry
+
+from .audio import SAMPLE_RATE, AudioDecodeError, decode_audio, trim_non_speech
+from .backends import get_fetcher, get_generator, get_transcriber
+from .captions import fetch_captions
+from .llm import generate_quiz_json
+from .metrics import count, stage
+from .transcription import should_chunk, transcribe_chunked
+from .whisper_models import get_model
+from .transcript_cache import get_cached_transcript, store_transcript
+from .workspace import pipeline_workspace
+
+logger = logging.getLogger(__name__)
+
+YOUTUBE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{11}$")
+
+# Prefix of the transcript cache keys caption transcripts are stored under.
+CAPTIONS_CACHE_PREFIX = "captions"
+
+
+def extract_video_id(url):
+    """Return the YouTube video id contained in ``url``.
+
+    Supports ``watch?v=`` URLs as well as ``youtu.be``, ``/shorts/``,
+    ``/embed/`` and ``/live/`` links. Returns ``None`` if no valid id is
+    found.
+    """
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    path_parts = [part for part in parsed.path.split("/") if part]
+
+    candidate = None
+    if host.endswith("youtu.be"):
+        candidate = path_parts[0] if path_parts else None
+    elif host.endswith("youtube.com"):
+        if path_parts[:1] == ["watch"]:
+            candidate = parse_qs(parsed.query).get("v", [None])[0]
+        elif len(path_parts) >= 2 and path_parts[0] in ("shorts", "embed", "live", "v"):
+            candidate = path_parts[1]
+
+    if candidate and YOUTUBE_ID_PATTERN.match(candidate):
+        return candidate
+    return None
 
 
 def download_audio(url, tmp_filename):
@@ -23,68 +67,181 @@ def download_audio(url, tmp_filename):
     }
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         ydl.download([url])
+
+
+def stream_audio(url):
+    """Decode the audio of a YouTube video without writing it to disk.
+
+    yt-dlp only resolves the direct URL of the best progressive audio
+    stream; ffmpeg then reads that stream and pipes 16 kHz mono PCM
+    straight into a NumPy array.
+
+    Raises AudioDecodeError if no directly streamable format exists or
+    decoding fails, so the caller can fall back to ``download_audio``.
+    """
+    ydl_opts = {
+        "format": "bestaudio[protocol^=http]/bestaudio",
+        "quiet": True,
+        "noplaylist": True,
+    }
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+
+    if info.get("protocol") not in ("http", "https") or not info.get("url"):
+        raise AudioDecodeError(f"No directly streamable audio format for {url}")
+
+    return decode_audio(info["url"], headers=info.get("http_headers"), timeout=get_decode_timeout())
+
+
+def get_decode_timeout():
+    """Return the ffmpeg timeout in seconds (``None`` if disabled)."""
+    return settings.QUIZ_AUDIO_DECODE_TIMEOUT or None
+
+
+def load_audio(url, workspace):
+    """Return audio for ``url`` ready to be passed to ``transcribe_audio``.
+
+    With ``QUIZ_AUDIO_STREAMING`` enabled the audio is streamed and
+    decoded in memory (a float32 array). If that is disabled or not
+    possible, the audio is downloaded into ``workspace`` and the file
+    path is returned instead.
+    """
+    if settings.QUIZ_AUDIO_STREAMING:
+        try:
+            return stream_audio(url)
+        except (AudioDecodeError, yt_dlp.utils.DownloadError) as exc:
+            logger.warning("Streaming audio for %s failed, downloading instead: %s", url, exc)
+
+    tmp_filename = str(workspace / 'audio.m4a')
+    download_audio(url, tmp_filename)
+    return tmp_filename
     
 
-def transcribe_audio(tmp_filename):
-    """Transcribe the audio file and return the transcript text."""
-    model = whisper.load_model("tiny", device="cuda" if os.getenv("WHISPER_USE_CUDA") == "1" else "cpu")
-    result = model.transcribe(tmp_filename)
+def transcribe_audio(audio):
+    """Transcribe the audio and return the transcript text.
+
+    ``audio`` is either a path to an audio file or a mono 16 kHz float32
+    NumPy array as returned by :func:`stream_audio`. Uses the shared
+    model from :mod:`quiz_app.api.whisper_models` so the weights are
+    only loaded once per process. Silence (and, if configured, music) is
+    cut out first (see :func:`quiz_app.api.audio.trim_non_speech`) and
+    long audio is split into chunks that are transcribed in parallel
+    (see :mod:`quiz_app.api.transcription`).
+    """
+    if settings.WHISPER_CHUNKED_ENABLED or settings.WHISPER_VAD_ENABLED:
+        if isinstance(audio, str):
+            audio = decode_audio(audio, timeout=get_decode_timeout())
+
+    if not isinstance(audio, str):
+        count('audio_bytes', audio.nbytes)
+
+    if settings.WHISPER_VAD_ENABLED:
+        with stage('vad'):
+            audio, stats = trim_non_speech(
+                audio,
+                threshold_db=settings.WHISPER_VAD_THRESHOLD_DB,
+                min_gap=settings.WHISPER_VAD_MIN_GAP,
+                padding=settings.WHISPER_VAD_PADDING,
+                music_modulation_db=settings.WHISPER_VAD_MUSIC_MODULATION_DB,
+            )
+        count('audio_dropped_bytes', int(stats['dropped_seconds'] * SAMPLE_RATE) * audio.itemsize)
+        logger.info(
+            "Dropped %.1fs of %.1fs non-speech audio (%.0f%%) before transcription",
+            stats['dropped_seconds'], stats['original_seconds'], stats['dropped_ratio'] * 100
+        )
+
+    if should_chunk(audio):
+        return transcribe_chunked(audio)
+
+    model = get_model()
+    result = model.transcribe(audio)
     return result["text"]
     
 
-def generate_quiz_json(transcript_text):
-            """Use a language model to produce a quiz JSON from transcript_text.
-
-            Returns a Python dict parsed from the model output.
-            """
-            client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-
-            prompt = f"""
-                    Based on the following transcript, generate a quiz in valid JSON format.
-
-                    The quiz must follow this exact structure:
-
-                    {{
-                        "title": "Create a concise quiz title based on the topic of the transcript.",
-                        "description": "Summarize the transcript in no more than 150 characters. Do not include any quiz questions or answers.",
-                        "questions": [
-                            {{
-                                "question_title": "The question goes here.",
-                                "question_options": ["Option A", "Option B", "Option C", "Option D"],
-                                "answer": "The correct answer from the above options"
-                            }},
-                            ...
-                            (exactly 10 questions)
-                        ]
-                    }}
-
-                    Requirements:
-                    - Each question must have exactly 4 distinct answer options.
-                    - Only one correct answer is allowed per question, and it must be present in 'question_options'.
-                    - The output must be valid JSON and parsable as-is (e.g., using Python's json.loads).
-                    - Do not include explanations, comments, or any text outside the JSON
-                    ---
-                    {transcript_text}
-                    ---
-                    """
-
-            response = client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=prompt
-            )
+def get_captions_cache_key():
+    """Return the transcript cache key of captions in the configured languages.
+
+    Which caption track is used depends on ``QUIZ_CAPTION_LANGUAGES``,
+    so captions cached for one language list are not served for
+    another. Lists too long for the key column are hashed.
+    """
+    key = f"{CAPTIONS_CACHE_PREFIX}:{','.join(settings.QUIZ_CAPTION_LANGUAGES)}"
+    if len(key) > TranscriptCacheEntry._meta.get_field('model_name').max_length:
+        key = f"{CAPTIONS_CACHE_PREFIX}:{hashlib.sha1(key.encode()).hexdigest()}"
+    return key
+
 
-            raw_text = response.text
-            cleaned_text = re.sub(r"^```(?:json)?\s*|\s*```$", "", raw_text.strip(), flags=re.MULTILINE)
-            return json.loads(cleaned_text)
+def get_transcript(url):
+    """Return the transcript for ``url`` and where it came from.
+
+    Sources are tried from cheapest to most expensive: the transcript
+    cache, the video's existing captions (if ``QUIZ_CAPTIONS_ENABLED``)
+    and finally a transcription of the audio. Captions and audio come
+    from the configured fetcher and the transcription from the
+    configured transcriber (see :mod:`quiz_app.api.backends`). New
+    transcripts are stored in the cache.
+
+    Returns:
+        tuple[str, str]: The transcript text and its source,
+        ``Quiz.TRANSCRIPT_SOURCE_CAPTIONS`` or the transcriber's
+        ``source``.
+    """
+    fetcher, transcriber = get_fetcher(), get_transcriber()
+    video_id = extract_video_id(url)
+    whisper_key = transcriber.get_cache_key()
+    captions_key = get_captions_cache_key()
+
+    if video_id:
+        with stage('cache_lookup'):
+            cached = None
+            if settings.QUIZ_CAPTIONS_ENABLED:
+                cached = get_cached_transcript(video_id, captions_key)
+                source = Quiz.TRANSCRIPT_SOURCE_CAPTIONS
+            if cached is None:
+                cached = get_cached_transcript(video_id, whisper_key)
+                source = transcriber.source
+        if cached is not None:
+            count('transcript_cache_hits')
+            return cached, source
+        count('transcript_cache_misses')
+
+    if settings.QUIZ_CAPTIONS_ENABLED:
+        with stage('captions'):
+            transcript_text = fetcher.fetch_captions(url)
+        if transcript_text:
+            if video_id:
+                store_transcript(video_id, captions_key, transcript_text)
+            return transcript_text, Quiz.TRANSCRIPT_SOURCE_CAPTIONS
+
+    with pipeline_workspace() as workspace:
+        with stage('download'):
+            audio = fetcher.load_audio(url, workspace)
+        with stage('transcribe'):
+            transcript_text = transcriber.transcribe(audio)
+
+    if video_id:
+        store_transcript(video_id, whisper_key, transcript_text)
+    return transcript_text, transcriber.source
 
 
 def generate_quiz_json_from_url(url):
     """Generate a quiz dict from a YouTube URL.
 
-    This convenience helper downloads the audio for the given YouTube URL
-    into the repository `media/audio.m4a` file, transcribes it with Whisper,
-    removes the temporary audio file and returns the parsed quiz JSON
-    produced by the language model.
+    This convenience helper obtains a transcript for the given YouTube
+    URL (see :func:`get_transcript`) and returns the parsed quiz JSON
+    produced by the language model, with ``transcript_source`` added.
+
+    If the video has usable captions they are used as the transcript.
+    Otherwise the audio is streamed and decoded in memory (falling back
+    to a download into a private temporary workspace, see
+    :mod:`quiz_app.api.workspace`) and transcribed with Whisper.
+    Concurrent transcriptions are isolated from each other and limited
+    by ``QUIZ_PIPELINE_CONCURRENCY``. Stage timings and counters are
+    recorded in the active :func:`quiz_app.api.metrics.track_run`.
+
+    Transcripts are cached per video id and source (see
+    :mod:`quiz_app.api.transcript_cache`); on a cache hit the download
+    and transcription steps are skipped entirely.
 
     Parameters
     ----------
@@ -95,29 +252,25 @@ def generate_quiz_json_from_url(url):
     -------
     dict
         A Python dictionary parsed from the model output matching the
-        quiz schema used by this project (title, description, questions).
+        quiz schema used by this project (title, description, questions)
+        plus the ``transcript_source`` the quiz is based on.
 
     Raises
     ------
-    Any exception raised by the underlying helpers (`download_audio`,
-    `transcribe_audio`, `generate_quiz_json`) is propagated to the caller.
+    Any exception raised by the configured backends (by default
+    `load_audio`, `transcribe_audio`, `generate_quiz_json`) is propagated
+    to the caller.
 
     Side effects
     ------------
-    Writes a temporary `media/audio.m4a` file in the project and deletes
-    it after transcription.
+    May write the audio to a temporary directory that is deleted after
+    transcription, also on failure. Stores new transcripts in the cache.
     """
 
-    audio_path = Path(__file__).resolve().parent.parent.parent / 'media' / 'audio.m4a'
-
-    if audio_path.exists():
-        audio_path.unlink()
-
-    tmp_filename = str(audio_path)
-
-    download_audio(url, tmp_filename)
-
-    transcript_text = transcribe_audio(tmp_filename)
-    os.remove(tmp_filename)
+    transcript_text, transcript_source = get_transcript(url)
+    count('transcript_chars', len(transcript_text))
 
-    return generate_quiz_json(transcript_text)
\ No newline at end of file
+    with stage('generate'):
+        quiz_json = get_generator().generate(transcript_text)
+    quiz_json['transcript_source'] = transcript_source
+    return quiz_json
\ No newline at end of file
@@ -1,20 +1,36 @@
 """Views for quiz-related API endpoints.
 
 This module exposes an endpoint to create a quiz (from a YouTube
-URL) and standard DRF generic views to list, retrieve, update and
-delete quizzes that belong to the authenticated user.
+URL), an endpoint reporting the state of background generation jobs
+and standard DRF generic views to list, retrieve, update and delete
+quizzes that belong to the authenticated user.
 """
 
+from django.conf import settings
+from django.http import HttpResponse
+from django.urls import reverse
+
 from rest_framework.views import APIView
 from rest_framework.viewsets import generics
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.exceptions import ValidationError
 
-from quiz_app.models import Quiz, Question
-from .serializers import QuizPostSerializer, QuizSerializer
-from .permissions import IsCreator
-from .utils import generate_quiz_json_from_url
+from quiz_app.models import Quiz, QuizGenerationJob
+from .serializers import (
+    QuizPostSerializer, QuizSerializer, QuizGenerationJobSerializer, quiz_values, serialize_quiz_rows
+)
+from .pagination import QuizCursorPagination
+from .permissions import HasMetricsToken, IsCreator
+from .persistence import delete_quiz, save_generated_quiz
+from .response_cache import cached_response
+from .conditional import conditional_response, has_preconditions, list_state, quiz_state, set_validators
+from .sync import changed_quizzes, deleted_quiz_ids, parse_since, sync_watermark
+from .jobs import enqueue_job
+from .metrics import render_prometheus, stage, track_run
+from .backends import generate_quiz_json_from_url
+from .whisper_models import loaded_models
 
 class CreateQuizAPIView(APIView):
     """Create a quiz resource from a YouTube URL.
@@ -22,10 +38,26 @@ class CreateQuizAPIView(APIView):
     The view downloads audio, transcribes it and constructs quiz
     content via a language model. Helper methods raise exceptions on
     failure and the view returns appropriate HTTP responses.
+
+    When asynchronous generation is requested (``?async=1``) or enabled
+    by ``QUIZ_GENERATION_ASYNC``, the view only enqueues a
+    :class:`~quiz_app.models.QuizGenerationJob` and answers 202 with the
+    job; its state can be followed at ``/api/jobs/<id>/``.
+
+    Synchronous responses carry a ``Server-Timing`` header with the
+    duration of every pipeline stage.
     """
 
     permission_classes = [IsAuthenticated]
 
+    def wants_async(self, request):
+        """Return whether this request should be handled by a worker."""
+        value = request.query_params.get('async')
+        if value is None:
+            return settings.QUIZ_GENERATION_ASYNC
+        return value.lower() in ('1', 'true', 'yes')
+
+
     def post(self, request):
         """Create the quiz resource and its related Question objects."""
         serializer = QuizPostSerializer(data=request.data)
@@ -34,39 +66,71 @@ class CreateQuizAPIView(APIView):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         url = serializer.validated_data["url"]
-        
-        quiz_json = generate_quiz_json_from_url(url)
-
-        quiz = Quiz.objects.create(
-            title=quiz_json['title'],
-            description=quiz_json['description'],
-            video_url=url,
-            creator=request.user
-        )
 
-        for question_data in quiz_json['questions']:
-            Question.objects.create(
-                question_title=question_data['question_title'],
-                question_options=question_data['question_options'],
-                answer=question_data['answer'],
-                quiz=quiz
-            )
+        if self.wants_async(request):
+            job = enqueue_job(url, request.user)
+            data = QuizGenerationJobSerializer(job, context={'request': request}).data
+            location = reverse('jobs-detail', kwargs={'pk': job.pk})
+            return Response(data, status=status.HTTP_202_ACCEPTED, headers={'Location': location})
 
-        return Response(QuizPostSerializer(quiz).data, status=status.HTTP_201_CREATED)
+        with track_run(video_url=url, user_id=request.user.pk) as run:
+            quiz_json = generate_quiz_json_from_url(url)
+            with stage('persist'):
+                quiz, questions = save_generated_quiz(quiz_json, url, request.user)
+
+        response = Response(
+            QuizPostSerializer(quiz, context={'questions': questions}).data, status=status.HTTP_201_CREATED
+        )
+        response['Server-Timing'] = run.server_timing()
+        return response
     
 
 class QuizListAPIView(generics.ListAPIView):
     """List quizzes for the authenticated user.
 
-    GET: Return a list of quizzes owned by the requesting user. The
-    view uses the default pagination and serialization defined by DRF and
-    the local serializer class.
+    GET: Return the quizzes owned by the requesting user, ordered by
+    ``(created_at, id)``. The questions of all listed quizzes are loaded
+    with one prefetch query, so the number of queries does not grow with
+    the number of quizzes.
+
+    Query parameters:
+
+    - ``page_size`` / ``cursor``: return one page of a keyset-paginated
+      list (see :class:`QuizCursorPagination`) instead of all quizzes.
+    - ``fields``: comma-separated fields to return, e.g.
+      ``fields=id,title,created_at`` for a lightweight summary list.
+      Questions are only returned (and loaded) if ``questions`` is one of
+      them or ``include=questions`` is passed.
+    - ``updated_since``: return only the changes since that timestamp as
+      ``{"watermark", "results", "deleted"}`` (see :mod:`.sync`); pass
+      the ``watermark`` as ``updated_since`` on the next poll.
     """
 
     permission_classes = [IsAuthenticated]
     serializer_class = QuizSerializer
+    pagination_class = QuizCursorPagination
     queryset = Quiz.objects.all()
 
+    def get_requested_fields(self):
+        """Return the field names selected with ``?fields=``, or ``None`` for all.
+
+        Raises a ValidationError (400) for unknown field names.
+        """
+        if not hasattr(self, '_requested_fields'):
+            fields = self.request.query_params.get('fields')
+            if fields is None:
+                self._requested_fields = None
+            else:
+                requested = {name.strip() for name in fields.split(',') if name.strip()}
+                if 'questions' in self.request.query_params.get('include', '').split(','):
+                    requested.add('questions')
+                unknown = requested - set(QuizSerializer.Meta.fields)
+                if unknown:
+                    raise ValidationError({'fields': [f"Unknown field(s): {', '.join(sorted(unknown))}."]})
+                self._requested_fields = requested
+        return self._requested_fields
+
+
     def get_queryset(self):
         """Return queryset filtered to the current user.
 
@@ -74,7 +138,51 @@ class QuizListAPIView(generics.ListAPIView):
         """
 
         queryset = super().get_queryset()
-        return queryset.filter(creator=self.request.user)
+        return queryset.filter(creator_id=self.request.user.pk).order_by('created_at', 'id')
+
+
+    def serialize(self, queryset):
+        """Return the representation of ``queryset`` without per-object serializers.
+
+        Only the selected columns are loaded, and questions (with one
+        extra query) only when they are returned. See
+        :func:`serialize_quiz_rows`.
+        """
+        fields = self.get_requested_fields()
+        return serialize_quiz_rows(quiz_values(queryset, fields), fields)
+
+
+    def paginate_queryset(self, queryset):
+        """Paginate only if the client asked for it, keeping plain lists the default."""
+        if not self.paginator.is_requested(self.request):
+            return None
+        return super().paginate_queryset(queryset)
+
+
+    def list(self, request, *args, **kwargs):
+        """Return the full list, or only the changes with ``?updated_since=``."""
+        updated_since = request.query_params.get('updated_since')
+        if updated_since is None:
+            return cached_response(request, self.build_list_response, lambda: list_state(request.user.pk))
+
+        since = parse_since(updated_since)
+        watermark = sync_watermark()
+        quizzes = changed_quizzes(self.get_queryset(), since)
+        return Response({
+            'watermark': watermark.isoformat(),
+            'results': self.serialize(quizzes),
+            'deleted': deleted_quiz_ids(request.user.pk, since),
+        })
+
+
+    def build_list_response(self):
+        """Return the (paginated if requested) list of the requester's quizzes."""
+        fields = self.get_requested_fields()
+        rows = quiz_values(self.get_queryset(), fields)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serialize_quiz_rows(page, fields))
+        return Response(serialize_quiz_rows(rows, fields))
    
 
 class QuizRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
@@ -85,6 +193,12 @@ class QuizRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
     DELETE: remove the quiz (only allowed for the creator)
 
     Object-level permissions are enforced by :class:`IsCreator`.
+
+    GET and update responses carry ``ETag`` and ``Last-Modified`` (see
+    :mod:`.conditional`). GET honours ``If-None-Match`` /
+    ``If-Modified-Since`` with 304; PUT/PATCH honour ``If-Match`` /
+    ``If-Unmodified-Since`` with 412, so clients can avoid overwriting
+    changes they have not seen.
     """
 
     permission_classes = [IsAuthenticated, IsCreator]
@@ -98,18 +212,132 @@ class QuizRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
         quiz objects.
         """
 
-        queryset = super().get_queryset()
-        return queryset.filter(creator=self.request.user)
+        return super().get_queryset().filter(creator_id=self.request.user.pk)
     
 
     def get_object(self):
-        """Retrieve the object by primary key and enforce permissions.
+        """Retrieve the requester's quiz by primary key.
 
-        Uses ``get_object_or_404`` and then runs the usual DRF permission
-        checks for object-level access.
+        The quiz is looked up in :meth:`get_queryset`. Only if that finds
+        nothing is the unfiltered table checked, so that a quiz owned by
+        someone else still answers 403 (from :class:`IsCreator`) rather
+        than 404.
         """
 
         pk = self.kwargs.get("pk")
-        obj = generics.get_object_or_404(Quiz, pk=pk)
+        obj = self.get_queryset().filter(pk=pk).first()
+        if obj is None:
+            obj = generics.get_object_or_404(Quiz.objects.only('id', 'creator_id'), pk=pk)
         self.check_object_permissions(self.request, obj)
-        return obj
\ No newline at end of file
+        return obj
+
+
+    def retrieve(self, request, *args, **kwargs):
+        """Return the quiz, from the response cache when possible.
+
+        Cache entries are per requester and only successful responses are
+        stored, so the permission check of a miss is never skipped for a
+        quiz the requester may not see.
+        """
+        return cached_response(
+            request, self.build_detail_response, lambda: quiz_state(request.user.pk, self.kwargs.get("pk"))
+        )
+
+
+    def build_detail_response(self):
+        """Return the quiz and its questions without per-object serializers."""
+        quiz = self.get_object()
+        row = {name: getattr(quiz, name) for name in QuizSerializer.Meta.fields if name != 'questions'}
+        return Response(serialize_quiz_rows([row])[0])
+
+
+    def update(self, request, *args, **kwargs):
+        """Update the quiz, checking ``If-Match`` / ``If-Unmodified-Since`` first.
+
+        With preconditions the quiz's ``updated_at`` is read before they
+        are checked, and the update is a compare-and-set on that value
+        (see ``QuizSerializer.update``): if another write lands in
+        between, no row matches and the request fails with 412, so of two
+        clients sending the same ``If-Match`` only one succeeds.
+        """
+        pk = self.kwargs.get("pk")
+        if has_preconditions(request):
+            self.expected_updated_at = (
+                Quiz.objects.filter(pk=pk, creator_id=request.user.pk).values_list('updated_at', flat=True).first()
+            )
+            state = quiz_state(request.user.pk, pk)
+            failed = conditional_response(request, state) if state is not None else None
+            if failed is not None:
+                return failed
+        response = super().update(request, *args, **kwargs)
+
+        state = quiz_state(request.user.pk, pk)
+        if state is not None:
+            set_validators(response, request, state)
+        return response
+
+
+    def perform_update(self, serializer):
+        """Save the quiz, only if unchanged since the preconditions were checked."""
+        serializer.save(expected_updated_at=getattr(self, 'expected_updated_at', None))
+
+
+    def perform_destroy(self, instance):
+        """Delete the quiz and leave a tombstone for syncing clients."""
+        delete_quiz(instance)
+
+
+class QuizGenerationJobRetrieveAPIView(generics.RetrieveAPIView):
+    """Report the state of a background quiz generation job.
+
+    GET: Return the job status and, once it has succeeded, a link to the
+    generated quiz. Users can only see their own jobs.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = QuizGenerationJobSerializer
+    queryset = QuizGenerationJob.objects.all()
+
+    def get_queryset(self):
+        """Return jobs created by the requesting user."""
+        queryset = super().get_queryset()
+        return queryset.filter(creator=self.request.user)
+
+
+class ReadinessAPIView(APIView):
+    """Report whether this worker is ready to generate quizzes.
+
+    GET: Return the load state of every configured Whisper model. With
+    ``WHISPER_PRELOAD`` enabled the response is 200 when all models are
+    loaded and 503 otherwise, so it can be used directly as a load
+    balancer readiness probe. Without preloading, models are loaded on
+    the first quiz request, so the worker is always ready.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        """Return the Whisper model load state."""
+        models = loaded_models()
+        ready = all(models.values()) or not settings.WHISPER_PRELOAD
+        return Response(
+            {'ready': ready, 'preload': settings.WHISPER_PRELOAD, 'whisper_models': models},
+            status=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+
+class MetricsAPIView(APIView):
+    """Expose pipeline metrics of this process in Prometheus text format.
+
+    GET: Return per-stage duration histograms and byte/token counters
+    collected by :mod:`quiz_app.api.metrics`. Only scrapers sending the
+    ``METRICS_TOKEN`` bearer token are allowed.
+    """
+
+    permission_classes = [HasMetricsToken]
+    authentication_classes = []
+
+    def get(self, request):
+        """Return the metrics as ``text/plain`` for Prometheus scrapers."""
+        return HttpResponse(render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,91 @@
+"""Process-wide registry for loaded Whisper models.
+
+Loading a Whisper checkpoint means deserializing the weights and
+allocating the tensors for them, which is by far the largest fixed cost
+of a quiz generation run. This module keeps every loaded model in a
+per-process registry so each worker pays that cost once and all
+transcriptions share the same model instance.
+
+Models can be loaded lazily on first use via :func:`get_model` or
+eagerly at startup via :func:`preload_models` (called from
+:meth:`quiz_app.apps.QuizAppConfig.ready` when ``WHISPER_PRELOAD`` is
+enabled).
+
+``whisper`` (and torch) are imported on the first model load rather
+than with this module, so processes that never transcribe do not load
+them.
+"""
+
+import logging
+import threading
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_models = {}
+_lock = threading.Lock()
+
+
+def get_device():
+    """Return the torch device Whisper models should be loaded on."""
+    return "cuda" if settings.WHISPER_USE_CUDA else "cpu"
+
+
+def get_model(name=None):
+    """Return the shared Whisper model ``name``, loading it on first use.
+
+    Args:
+        name (str, optional): Whisper model name. Defaults to
+            ``settings.WHISPER_MODEL``.
+
+    Returns:
+        whisper.model.Whisper: The loaded (and warmed up) model.
+    """
+    name = name or settings.WHISPER_MODEL
+    model = _models.get(name)
+    if model is not None:
+        return model
+
+    with _lock:
+        # Another thread may have finished loading while we waited.
+        model = _models.get(name)
+        if model is None:
+            import whisper
+
+            logger.info("Loading Whisper model %r on %s", name, get_device())
+            model = whisper.load_model(name, device=get_device())
+            if settings.WHISPER_WARMUP:
+                warm_up(model)
+            _models[name] = model
+    return model
+
+
+def warm_up(model):
+    """Run a short transcription on silence to initialize lazy kernels.
+
+    The first ``transcribe`` call on a fresh model is noticeably slower
+    than later ones; doing it here keeps that cost out of the first
+    user request.
+    """
+    import numpy as np
+    import whisper
+
+    silence = np.zeros(whisper.audio.SAMPLE_RATE, dtype=np.float32)
+    model.transcribe(silence, fp16=False, language="en")
+
+
+def preload_models():
+    """Load every model listed in ``settings.WHISPER_MODELS``."""
+    for name in settings.WHISPER_MODELS:
+        get_model(name)
+
+
+def is_loaded(name=None):
+    """Return ``True`` if the model ``name`` is already in the registry."""
+    return (name or settings.WHISPER_MODEL) in _models
+
+
+def loaded_models():
+    """Return a mapping of configured model names to their load state."""
+    return {name: name in _models for name in settings.WHISPER_MODELS}
@@ -0,0 +1,63 @@
+"""Isolated scratch directories for quiz generation runs.
+
+Every pipeline run downloads its audio into its own temporary directory
+so concurrent runs never touch each other's files. The directory lives
+on tmpfs (``/dev/shm``) when available, which keeps the audio round
+trip off the disk, and is removed when the run finishes, whether it
+succeeded or raised.
+
+The number of runs holding a workspace at the same time is limited per
+process by ``QUIZ_PIPELINE_CONCURRENCY``; further runs wait for a free
+slot.
+"""
+
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+
+_slots = None
+_slots_lock = threading.Lock()
+
+
+def get_workspace_root():
+    """Return the directory new workspaces are created in.
+
+    Uses ``settings.QUIZ_WORKSPACE_DIR`` if set, otherwise ``/dev/shm``
+    when it exists and is writable, otherwise the system temp directory
+    (``None`` lets :mod:`tempfile` decide).
+    """
+    if settings.QUIZ_WORKSPACE_DIR:
+        return settings.QUIZ_WORKSPACE_DIR
+    shm = Path('/dev/shm')
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return str(shm)
+    return None
+
+
+def get_slots():
+    """Return the semaphore limiting concurrent runs in this process."""
+    global _slots
+    if _slots is None:
+        with _slots_lock:
+            if _slots is None:
+                _slots = threading.BoundedSemaphore(max(1, settings.QUIZ_PIPELINE_CONCURRENCY))
+    return _slots
+
+
+@contextmanager
+def pipeline_workspace():
+    """Reserve a pipeline slot and yield a fresh temporary directory.
+
+    Yields:
+        Path: The workspace directory. It is deleted with its contents
+        when the ``with`` block exits.
+    """
+    with get_slots():
+        with tempfile.TemporaryDirectory(
+            prefix='quizly-', dir=get_workspace_root(), ignore_cleanup_errors=True
+        ) as path:
+            yield Path(path)
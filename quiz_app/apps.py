@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class QuizAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'quiz_app'
+
+    def ready(self):
+        """Preload the configured Whisper models if enabled in settings."""
+        if settings.WHISPER_PRELOAD:
+            from .api.whisper_models import preload_models
+            preload_models()
@@ -0,0 +1,79 @@
+"""Run the end-to-end benchmark suite and write the results as JSON."""
+
+import json
+import logging
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from benchmarks.suite import SCENARIOS, TRANSCRIBERS, run_suite
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark quiz generation (pipeline and createQuiz endpoint) with fixture audio "
+        "and a local stand-in LLM, and write per-stage timings, CPU time, peak RSS and "
+        "throughput to a JSON file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS),
+            help="Scenarios to run (default: all)."
+        )
+        parser.add_argument(
+            '--durations', nargs='+', type=float, default=[30, 120],
+            help="Lengths of the fixture audio in seconds (default: 30 120)."
+        )
+        parser.add_argument(
+            '--concurrency', nargs='+', type=int, default=[1, 4],
+            help="Concurrency levels to measure (default: 1 4)."
+        )
+        parser.add_argument(
+            '--runs', type=int, default=4,
+            help="Quiz generations per scenario, duration and concurrency level."
+        )
+        parser.add_argument(
+            '--transcriber', choices=sorted(TRANSCRIBERS), default='whisper',
+            help="Use Whisper or the canned stub transcriber (no model download needed)."
+        )
+        parser.add_argument(
+            '--llm-latency', type=float, default=1.0,
+            help="Seconds the stand-in LLM waits before answering each request."
+        )
+        parser.add_argument(
+            '--no-warmup', action='store_true',
+            help="Also measure the first run (model loading, pool start-up)."
+        )
+        parser.add_argument(
+            '--output',
+            help="Result file (default: benchmarks/results/benchmark-<timestamp>.json)."
+        )
+
+
+    def handle(self, *args, **options):
+        if options['verbosity'] < 2:
+            # One structured log line per run would drown the summary.
+            logging.getLogger('quiz_app.pipeline').setLevel(logging.WARNING)
+
+        results = run_suite(
+            scenarios=options['scenarios'],
+            durations=options['durations'],
+            concurrency_levels=options['concurrency'],
+            runs=options['runs'],
+            transcriber=options['transcriber'],
+            llm_latency=options['llm_latency'],
+            warmup=not options['no_warmup'],
+            report=self.stdout.write,
+        )
+
+        output = options['output'] or (
+            Path(settings.BASE_DIR) / 'benchmarks' / 'results'
+            / f"benchmark-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        )
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Wrote {output}"))
@@ -0,0 +1,56 @@
+"""Run background worker processes that generate queued quizzes."""
+
+import multiprocessing
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from quiz_app.api.jobs import default_worker_name, requeue_stale_jobs
+from quiz_app.workers import worker_main
+
+
+class Command(BaseCommand):
+    help = "Start worker processes that claim and run pending quiz generation jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=settings.QUIZ_WORKERS,
+            help="Number of worker processes (default: QUIZ_WORKERS setting)."
+        )
+        parser.add_argument(
+            '--poll-interval', type=float, default=settings.QUIZ_JOB_POLL_INTERVAL,
+            help="Seconds an idle worker waits before polling the queue again."
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help="Exit once the queue is empty instead of polling forever."
+        )
+
+
+    def handle(self, *args, **options):
+        requeued = requeue_stale_jobs()
+        if requeued:
+            self.stdout.write(f"Requeued {requeued} stale job(s).")
+
+        context = multiprocessing.get_context('spawn')
+        processes = [
+            context.Process(
+                target=worker_main,
+                args=(default_worker_name(index), options['poll_interval'], options['once']),
+                name=f"quiz-worker-{index}",
+            )
+            for index in range(max(1, options['workers']))
+        ]
+
+        for process in processes:
+            process.start()
+        self.stdout.write(f"Started {len(processes)} quiz worker(s).")
+
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for process in processes:
+                process.terminate()
+            for process in processes:
+                process.join()
@@ -0,0 +1,53 @@
+"""Benchmark the quiz list and detail endpoints against seeded data."""
+
+import json
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from benchmarks.read_path import ENDPOINTS, run_read_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway database with N users x M quizzes and measure latency "
+        "percentiles, requests per second and SQL queries per request of the quiz "
+        "read endpoints; results are written as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=5, help="Seeded users (default: 5).")
+        parser.add_argument('--quizzes', type=int, default=100, help="Quizzes per user (default: 100).")
+        parser.add_argument('--requests', type=int, default=200, help="Requests per endpoint and level.")
+        parser.add_argument(
+            '--concurrency', nargs='+', type=int, default=[1, 4],
+            help="Concurrency levels to measure (default: 1 4)."
+        )
+        parser.add_argument(
+            '--endpoints', nargs='+', choices=ENDPOINTS, default=list(ENDPOINTS),
+            help="Endpoints to benchmark (default: all)."
+        )
+        parser.add_argument(
+            '--output',
+            help="Result file (default: benchmarks/results/read-<timestamp>.json)."
+        )
+
+
+    def handle(self, *args, **options):
+        results = run_read_benchmark(
+            users=options['users'],
+            quizzes_per_user=options['quizzes'],
+            requests=options['requests'],
+            concurrency_levels=options['concurrency'],
+            endpoints=options['endpoints'],
+            report=self.stdout.write,
+        )
+
+        output = Path(options['output'] or (
+            Path(settings.BASE_DIR) / 'benchmarks' / 'results' / f"read-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        ))
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Wrote {output}"))
@@ -0,0 +1,34 @@
+"""Fill the database with generated users, quizzes and questions."""
+
+from django.core.management.base import BaseCommand
+
+from quiz_app.seeding import seed_quizzes
+
+
+class Command(BaseCommand):
+    help = "Bulk-create N users with M quizzes of Q questions each for load testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10, help="Number of users (default: 10).")
+        parser.add_argument('--quizzes', type=int, default=100, help="Quizzes per user (default: 100).")
+        parser.add_argument('--questions', type=int, default=10, help="Questions per quiz (default: 10).")
+        parser.add_argument(
+            '--password', default='seed-password',
+            help="Password of the seeded users (default: seed-password)."
+        )
+        parser.add_argument(
+            '--prefix', default='seed',
+            help="Username prefix; users are named <prefix>-<n> (default: seed)."
+        )
+
+
+    def handle(self, *args, **options):
+        users = seed_quizzes(
+            options['users'], options['quizzes'], options['questions'],
+            password=options['password'], prefix=options['prefix']
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {options['quizzes']} quizzes with {options['questions']} questions "
+            f"for each of {len(users)} users ({users[0].username} ... {users[-1].username})."
+            if users else "Nothing to seed."
+        ))
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-17 07:37
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz_app', '0003_quizgenerationjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('video_id', models.CharField(max_length=32)),
+                ('model_name', models.CharField(max_length=63)),
+                ('compressed_text', models.BinaryField()),
+                ('size', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('video_id', 'model_name'), name='unique_transcript_per_video_model')],
+            },
+        ),
+    ]
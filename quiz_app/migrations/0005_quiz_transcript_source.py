@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 07:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz_app', '0004_transcriptcacheentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quiz',
+            name='transcript_source',
+            field=models.CharField(blank=True, choices=[('whisper', 'Whisper transcription'), ('captions', 'YouTube captions')], max_length=16),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-17 08:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz_app', '0005_quiz_transcript_source'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['creator', 'created_at', 'id'], name='quiz_creator_created_idx'),
+        ),
+    ]
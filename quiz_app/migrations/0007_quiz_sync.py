@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-17 08:22
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz_app', '0006_quiz_creator_created_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuizDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quiz_id', models.PositiveBigIntegerField()),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['updated_at'], name='question_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['creator', 'updated_at'], name='quiz_creator_updated_idx'),
+        ),
+        migrations.AddField(
+            model_name='quizdeletion',
+            name='creator',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='quiz_deletions', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='quizdeletion',
+            index=models.Index(fields=['creator', 'deleted_at'], name='quiz_deletion_creator_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quizdeletion',
+            index=models.Index(fields=['deleted_at'], name='quiz_deletion_deleted_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-17 08:25
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('quiz_app', '0007_quiz_sync'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuizCacheVersion',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='quiz_cache_version', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('token', models.CharField(max_length=32)),
+            ],
+        ),
+    ]
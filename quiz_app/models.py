@@ -1,15 +1,30 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 User = get_user_model()
 
 class Quiz(models.Model):
+    TRANSCRIPT_SOURCE_WHISPER = 'whisper'
+    TRANSCRIPT_SOURCE_CAPTIONS = 'captions'
+    TRANSCRIPT_SOURCE_CHOICES = [
+        (TRANSCRIPT_SOURCE_WHISPER, 'Whisper transcription'),
+        (TRANSCRIPT_SOURCE_CAPTIONS, 'YouTube captions'),
+    ]
+
     title = models.CharField(max_length=63)
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     video_url = models.URLField()
     creator = models.ForeignKey(User, on_delete=models.CASCADE)
+    transcript_source = models.CharField(max_length=16, choices=TRANSCRIPT_SOURCE_CHOICES, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['creator', 'created_at', 'id'], name='quiz_creator_created_idx'),
+            models.Index(fields=['creator', 'updated_at'], name='quiz_creator_updated_idx'),
+        ]
     
     def __str__(self):
         return f"Quiz {self.id} {self.title}  by {self.creator.username}"
@@ -22,6 +37,86 @@ class Question(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE, related_name='questions')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at'], name='question_updated_idx'),
+        ]
     
     def __str__(self):
-        return f"Question {self.id} for Quiz {self.quiz.id}"
\ No newline at end of file
+        return f"Question {self.id} for Quiz {self.quiz.id}"
+
+class QuizDeletion(models.Model):
+    """Tombstone of a deleted quiz, reported to clients syncing their quiz list."""
+
+    quiz_id = models.PositiveBigIntegerField()
+    creator = models.ForeignKey(User, on_delete=models.CASCADE, related_name='quiz_deletions')
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['creator', 'deleted_at'], name='quiz_deletion_creator_idx'),
+            models.Index(fields=['deleted_at'], name='quiz_deletion_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f"QuizDeletion of quiz {self.quiz_id} at {self.deleted_at}"
+
+
+class QuizCacheVersion(models.Model):
+    """Current version token of a user's cached quiz responses."""
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='quiz_cache_version')
+    token = models.CharField(max_length=32)
+
+    def __str__(self):
+        return f"QuizCacheVersion {self.token} of user {self.user_id}"
+
+
+class QuizGenerationJob(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_SUCCEEDED, 'Succeeded'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    video_url = models.URLField()
+    creator = models.ForeignKey(User, on_delete=models.CASCADE, related_name='quiz_jobs')
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    quiz = models.ForeignKey(Quiz, on_delete=models.SET_NULL, null=True, blank=True, related_name='jobs')
+    error = models.TextField(blank=True)
+    worker = models.CharField(max_length=63, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='quiz_job_status_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"QuizGenerationJob {self.id} ({self.status}) for {self.video_url}"
+
+
+class TranscriptCacheEntry(models.Model):
+    video_id = models.CharField(max_length=32)
+    model_name = models.CharField(max_length=63)
+    compressed_text = models.BinaryField()
+    size = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['video_id', 'model_name'], name='unique_transcript_per_video_model'),
+        ]
+
+    def __str__(self):
+        return f"Transcript {self.video_id} ({self.model_name})"
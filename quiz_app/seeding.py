@@ -0,0 +1,70 @@
+"""Bulk-create users, quizzes and questions for load tests.
+
+Used by the ``seed_quizzes`` management command and the read-path
+benchmark. Everything is written with ``bulk_create`` in one
+transaction, so seeding thousands of quizzes takes seconds.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from quiz_app.api.response_cache import bump_versions
+from quiz_app.models import Quiz, Question
+
+BATCH_SIZE = 1000
+
+
+def seed_quizzes(users, quizzes_per_user, questions_per_quiz=10, password='seed-password', prefix='seed'):
+    """Create ``users`` users owning ``quizzes_per_user`` quizzes each.
+
+    Existing users named ``<prefix>-<n>`` are reused, so seeding can be
+    repeated to add more quizzes.
+
+    Returns:
+        list[User]: The seeded users.
+    """
+    User = get_user_model()
+    usernames = [f"{prefix}-{index}" for index in range(users)]
+    # Hash once; every seeded user gets the same password.
+    password_hash = make_password(password)
+
+    with transaction.atomic():
+        existing = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+        User.objects.bulk_create(
+            [User(username=name, email=f"{name}@example.com", password=password_hash)
+             for name in usernames if name not in existing],
+            batch_size=BATCH_SIZE
+        )
+        seeded_users = list(User.objects.filter(username__in=usernames).order_by('id'))
+
+        for user in seeded_users:
+            quizzes = Quiz.objects.bulk_create(
+                [
+                    Quiz(
+                        title=f"Seeded quiz {index + 1}",
+                        description=f"Seeded quiz {index + 1} of {user.username}.",
+                        video_url=f"https://www.youtube.com/watch?v=seed{index:07d}",
+                        creator=user,
+                        transcript_source=Quiz.TRANSCRIPT_SOURCE_CAPTIONS,
+                    )
+                    for index in range(quizzes_per_user)
+                ],
+                batch_size=BATCH_SIZE
+            )
+            Question.objects.bulk_create(
+                [
+                    Question(
+                        question_title=f"Question {number + 1} of {quiz.title}?",
+                        question_options=["Option A", "Option B", "Option C", "Option D"],
+                        answer="Option A",
+                        quiz=quiz,
+                    )
+                    for quiz in quizzes
+                    for number in range(questions_per_quiz)
+                ],
+                batch_size=BATCH_SIZE
+            )
+        bump_versions(user.pk for user in seeded_users)
+
+    return seeded_users
@@ -0,0 +1,127 @@
+"""Tests for in-memory audio decoding and the streaming audio path."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import yt_dlp
+from django.test import TestCase, override_settings
+
+from quiz_app.api.audio import AudioDecodeError, decode_audio, trim_non_speech
+from quiz_app.api.utils import load_audio
+
+
+class DecodeAudioTests(TestCase):
+    """ffmpeg output is converted into a float32 sample buffer."""
+
+    @patch('quiz_app.api.audio.subprocess.run')
+    def test_decode_to_float32(self, mock_run):
+        pcm = np.array([0, 16384, -32768, 32767], dtype='<i2').tobytes()
+        mock_run.return_value = MagicMock(stdout=pcm)
+
+        samples = decode_audio("https://example.com/audio", headers={'User-Agent': 'test'})
+
+        self.assertEqual(samples.dtype, np.float32)
+        np.testing.assert_allclose(samples, [0.0, 0.5, -1.0, 32767 / 32768])
+        cmd = mock_run.call_args.args[0]
+        self.assertEqual(cmd[cmd.index('-ar') + 1], '16000')
+        self.assertEqual(cmd[cmd.index('-ac') + 1], '1')
+        self.assertEqual(cmd[cmd.index('-headers') + 1], 'User-Agent: test\r\n')
+        self.assertEqual(cmd[-1], '-')
+
+
+    @patch('quiz_app.api.audio.subprocess.run')
+    def test_decode_errors(self, mock_run):
+        errors = [
+            FileNotFoundError(),
+            subprocess.CalledProcessError(1, 'ffmpeg', stderr=b'bad input'),
+            subprocess.TimeoutExpired('ffmpeg', 5),
+        ]
+        for error in errors:
+            with self.subTest(error=error):
+                mock_run.side_effect = error
+                with self.assertRaises(AudioDecodeError):
+                    decode_audio("missing.m4a", timeout=5)
+        self.assertEqual(mock_run.call_args.kwargs['timeout'], 5)
+
+
+@override_settings(QUIZ_AUDIO_STREAMING=True)
+class LoadAudioTests(TestCase):
+    """Streaming is preferred and falls back to downloading a file."""
+
+    @patch('quiz_app.api.utils.download_audio')
+    @patch('quiz_app.api.utils.stream_audio')
+    def test_streamed_audio_is_returned(self, mock_stream, mock_download):
+        mock_stream.return_value = np.zeros(16000, dtype=np.float32)
+
+        audio = load_audio("https://www.youtube.com/watch?v=_dQYvRM9zNY", Path("/tmp"))
+
+        self.assertIs(audio, mock_stream.return_value)
+        mock_download.assert_not_called()
+
+
+    @patch('quiz_app.api.utils.download_audio')
+    @patch('quiz_app.api.utils.stream_audio', side_effect=AudioDecodeError("no stream"))
+    def test_falls_back_to_download(self, mock_stream, mock_download):
+        audio = load_audio("https://www.youtube.com/watch?v=_dQYvRM9zNY", Path("/tmp/run"))
+
+        self.assertEqual(audio, str(Path("/tmp/run") / 'audio.m4a'))
+        mock_download.assert_called_once_with("https://www.youtube.com/watch?v=_dQYvRM9zNY", audio)
+
+
+    @patch('quiz_app.api.utils.download_audio')
+    @patch('quiz_app.api.utils.stream_audio', side_effect=yt_dlp.utils.DownloadError("format unavailable"))
+    def test_falls_back_to_download_on_extract_error(self, mock_stream, mock_download):
+        audio = load_audio("https://www.youtube.com/watch?v=_dQYvRM9zNY", Path("/tmp/run"))
+
+        self.assertEqual(audio, str(Path("/tmp/run") / 'audio.m4a'))
+        mock_download.assert_called_once()
+
+
+class TrimNonSpeechTests(TestCase):
+    """Silence and steady music are removed before transcription."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # 1 s "speech": noise whose loudness changes every 100 ms.
+        envelope = np.repeat(rng.uniform(0.05, 0.5, 10), 1600)
+        self.speech = (rng.standard_normal(16000) * envelope).astype(np.float32)
+        self.silence = np.zeros(3 * 16000, dtype=np.float32)
+        tone = np.sin(2 * np.pi * 440 * np.arange(3 * 16000) / 16000)
+        self.music = (0.3 * tone).astype(np.float32)
+
+
+    def test_long_silence_is_removed(self):
+        audio = np.concatenate([self.silence, self.speech, self.silence, self.speech])
+
+        trimmed, stats = trim_non_speech(audio, padding=0.0)
+
+        self.assertEqual(len(trimmed), 2 * len(self.speech))
+        self.assertEqual(stats['original_seconds'], 8.0)
+        self.assertEqual(stats['dropped_seconds'], 6.0)
+        self.assertEqual(stats['dropped_ratio'], 0.75)
+
+
+    def test_short_pauses_and_padding_are_kept(self):
+        pause = np.zeros(8000, dtype=np.float32)
+        audio = np.concatenate([self.speech, pause, self.speech, self.silence])
+
+        trimmed, stats = trim_non_speech(audio, padding=0.25)
+
+        self.assertEqual(len(trimmed), 2 * len(self.speech) + len(pause) + int(0.25 * 16000))
+
+
+    def test_music_removed_only_when_enabled(self):
+        audio = np.concatenate([self.music, self.speech])
+
+        self.assertEqual(len(trim_non_speech(audio, padding=0.0)[0]), len(audio))
+        trimmed, _stats = trim_non_speech(audio, padding=0.0, music_modulation_db=3.0)
+        self.assertLess(len(trimmed), len(self.music) // 2 + len(self.speech))
+
+
+    def test_all_silent_audio_is_unchanged(self):
+        trimmed, stats = trim_non_speech(self.silence)
+
+        self.assertIs(trimmed, self.silence)
+        self.assertEqual(stats['dropped_seconds'], 0.0)
@@ -0,0 +1,125 @@
+"""Tests for the pluggable pipeline backends and the offline stubs."""
+
+import tempfile
+import wave
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from quiz_app.api import backends, stubs
+from quiz_app.api.schema import validate_quiz
+from quiz_app.models import Quiz
+
+User = get_user_model()
+
+STUB_BACKENDS = {
+    'QUIZ_FETCHER_BACKEND': 'quiz_app.api.stubs.FixtureAudioFetcher',
+    'QUIZ_TRANSCRIBER_BACKEND': 'quiz_app.api.stubs.CannedTranscriber',
+    'QUIZ_GENERATOR_BACKEND': 'quiz_app.api.stubs.TemplateQuizGenerator',
+}
+
+
+class BackendSelectionTests(SimpleTestCase):
+    """Backends are loaded from settings once per dotted path."""
+
+    def test_default_backends(self):
+        self.assertIsInstance(backends.get_fetcher(), backends.YouTubeFetcher)
+        self.assertIsInstance(backends.get_transcriber(), backends.WhisperTranscriber)
+        self.assertIsInstance(backends.get_generator(), backends.GeminiGenerator)
+
+
+    @override_settings(**STUB_BACKENDS)
+    def test_configured_backends_shared(self):
+        self.assertIsInstance(backends.get_transcriber(), stubs.CannedTranscriber)
+        self.assertIs(backends.get_generator(), backends.get_generator())
+
+
+    def test_transcript_sources(self):
+        self.assertEqual(backends.WhisperTranscriber.source, Quiz.TRANSCRIPT_SOURCE_WHISPER)
+        self.assertEqual(stubs.CannedTranscriber.source, '')
+
+
+    def test_incomplete_backend_rejected(self):
+        class PartialTranscriber(backends.Transcriber):
+            def transcribe(self, audio):
+                return ""
+
+        with self.assertRaises(TypeError):
+            PartialTranscriber()
+
+
+@override_settings(QUIZ_STUB_AUDIO_DIR=None, QUIZ_STUB_TRANSCRIPT=None)
+class StubTests(SimpleTestCase):
+    """The stand-ins are deterministic and produce valid output."""
+
+    @override_settings(QUIZ_STUB_AUDIO_SECONDS=2.5)
+    def test_silence_written_without_fixture_dir(self):
+        with tempfile.TemporaryDirectory() as workspace:
+            path = stubs.FixtureAudioFetcher().load_audio("https://youtu.be/_dQYvRM9zNY", workspace)
+
+            with wave.open(path, 'rb') as wav:
+                self.assertEqual(wav.getnframes(), 40000)
+            self.assertEqual(stubs.audio_seconds(path), 2.5)
+
+
+    def test_fixture_selected_by_video_id(self):
+        with tempfile.TemporaryDirectory() as fixtures, tempfile.TemporaryDirectory() as workspace:
+            for name in ('_dQYvRM9zNY.wav', 'other.wav'):
+                stubs.write_silence(f"{fixtures}/{name}", 0.1)
+
+            with self.settings(QUIZ_STUB_AUDIO_DIR=fixtures):
+                fetcher = stubs.FixtureAudioFetcher()
+                self.assertEqual(
+                    fetcher.select_fixture("https://youtu.be/_dQYvRM9zNY").name, '_dQYvRM9zNY.wav'
+                )
+                self.assertEqual(
+                    fetcher.select_fixture("https://youtu.be/aaaaaaaaaaa"),
+                    fetcher.select_fixture("https://youtu.be/aaaaaaaaaaa")
+                )
+                self.assertTrue(fetcher.load_audio("https://youtu.be/_dQYvRM9zNY", workspace).endswith('.wav'))
+
+
+    def test_transcript_scales_with_audio_length(self):
+        transcriber = stubs.CannedTranscriber()
+
+        one_minute = transcriber.transcribe(np.zeros(16000 * 60, dtype=np.float32))
+        ten_minutes = transcriber.transcribe(np.zeros(16000 * 600, dtype=np.float32))
+
+        self.assertGreaterEqual(len(one_minute.split()), 150)
+        self.assertGreaterEqual(len(ten_minutes.split()), 1500)
+        self.assertTrue(ten_minutes.startswith(one_minute))
+
+
+    def test_template_quiz_is_valid(self):
+        transcript = stubs.CannedTranscriber().transcribe(np.zeros(16000 * 60, dtype=np.float32))
+
+        quiz, missing = validate_quiz(stubs.TemplateQuizGenerator().generate(transcript))
+
+        self.assertEqual(missing, 0)
+        self.assertEqual(quiz['title'], "Cells are the basic unit of")
+
+
+@override_settings(
+    QUIZ_AUDIO_STREAMING=False, QUIZ_CAPTIONS_ENABLED=False, QUIZ_STUB_AUDIO_DIR=None,
+    QUIZ_STUB_AUDIO_SECONDS=30.0, QUIZ_STUB_TRANSCRIPT=None, **STUB_BACKENDS
+)
+class OfflinePipelineTests(APITestCase):
+    """createQuiz runs end to end on the stubs without network access."""
+
+    def test_create_quiz_with_stubs(self):
+        user = User.objects.create_user(username="username", password='TEST1234')
+        self.client.force_authenticate(user=user)
+
+        response = self.client.post(
+            reverse('create-quiz'), {'url': "https://youtu.be/_dQYvRM9zNY"}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data['questions']), 10)
+        self.assertIn('transcribe;dur=', response['Server-Timing'])
+        quiz = Quiz.objects.get()
+        self.assertEqual(quiz.transcript_source, '')
@@ -0,0 +1,62 @@
+"""Tests for the benchmark suite helpers."""
+
+import tempfile
+
+from django.test import SimpleTestCase, override_settings
+
+from benchmarks.fixtures import SAMPLE_RATE, synthesize_lecture, write_fixture
+from benchmarks.measure import summarize
+from benchmarks.scenarios import parse_server_timing, run_pipeline_scenario, video_urls
+from quiz_app.api.audio import trim_non_speech
+
+
+class BenchmarkHelperTests(SimpleTestCase):
+    """Fixtures, timing parsing and summaries."""
+
+    def test_fixture_has_speech_and_gaps(self):
+        audio = synthesize_lecture(60)
+
+        trimmed, stats = trim_non_speech(audio, threshold_db=-45.0, min_gap=1.0, padding=0.25)
+
+        self.assertEqual(len(audio), 60 * SAMPLE_RATE)
+        self.assertGreater(stats['dropped_seconds'], 0)
+        self.assertGreater(len(trimmed), 40 * SAMPLE_RATE)
+
+
+    def test_parse_server_timing(self):
+        self.assertEqual(
+            parse_server_timing("download;dur=12.5, generate;dur=1000.0, total;dur=1020.0"),
+            {'download': 0.0125, 'generate': 1.0, 'total': 1.02}
+        )
+
+
+    def test_summarize(self):
+        summary = summarize([0.1, 0.2, 0.3, 0.4])
+
+        self.assertEqual(summary['count'], 4)
+        self.assertEqual(summary['max_ms'], 400.0)
+        self.assertEqual(summary['mean_ms'], 250.0)
+
+
+@override_settings(
+    QUIZ_FETCHER_BACKEND='quiz_app.api.stubs.FixtureAudioFetcher',
+    QUIZ_TRANSCRIBER_BACKEND='quiz_app.api.stubs.CannedTranscriber',
+    QUIZ_GENERATOR_BACKEND='quiz_app.api.stubs.TemplateQuizGenerator',
+    QUIZ_CAPTIONS_ENABLED=False, TRANSCRIPT_CACHE_ENABLED=False, QUIZ_STUB_TRANSCRIPT=None,
+)
+class PipelineScenarioTests(SimpleTestCase):
+    """The pipeline scenario reports throughput and stage timings."""
+
+    def test_pipeline_scenario(self):
+        with tempfile.TemporaryDirectory() as fixtures:
+            write_fixture(fixtures, 5)
+            with self.settings(QUIZ_STUB_AUDIO_DIR=fixtures):
+                result = run_pipeline_scenario(video_urls(4), concurrency=2, audio_seconds=5)
+
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(result['runs'], 4)
+        self.assertEqual(result['audio_seconds'], 5)
+        self.assertGreater(result['throughput_per_minute'], 0)
+        self.assertGreater(result['peak_rss_mb'], 0)
+        self.assertEqual(result['stages']['transcribe']['count'], 4)
+        self.assertIn('total', result['stages'])
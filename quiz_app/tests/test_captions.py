@@ -0,0 +1,100 @@
+"""Tests for the caption fast path of the quiz pipeline."""
+
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from quiz_app.api.captions import parse_srv, parse_vtt, select_track
+from quiz_app.api.utils import generate_quiz_json_from_url
+from quiz_app.models import Quiz
+
+VTT = """WEBVTT
+Kind: captions
+Language: en
+
+NOTE produced by the test suite
+
+00:00:00.000 --> 00:00:02.000 align:start position:0%
+welcome<00:00:00.500><c> to</c><00:00:01.000><c> the</c> lecture
+
+00:00:02.000 --> 00:00:04.000 align:start position:0%
+welcome to the lecture
+today we talk about &amp; cells
+
+1
+00:00:04.000 --> 00:00:06.000
+today we talk about &amp; cells
+"""
+
+SRV3 = """<?xml version="1.0" encoding="utf-8" ?>
+<timedtext format="3"><body>
+<p t="0" d="2000">welcome to the lecture</p>
+<p t="2000" d="2000"><s>today</s><s t="300"> we talk</s></p>
+</body></timedtext>"""
+
+
+class CaptionParsingTests(TestCase):
+    """Caption documents are reduced to plain transcript text."""
+
+    def test_parse_vtt(self):
+        self.assertEqual(parse_vtt(VTT), "welcome to the lecture today we talk about & cells")
+
+
+    def test_parse_srv(self):
+        self.assertEqual(parse_srv(SRV3), "welcome to the lecture today we talk")
+
+
+    def test_select_track_prefers_language_order_and_vtt(self):
+        tracks = {
+            'de': [{'ext': 'vtt', 'url': 'de.vtt'}],
+            'en-US': [{'ext': 'json3', 'url': 'en.json3'}, {'ext': 'srv1', 'url': 'en.srv1'}, {'ext': 'vtt', 'url': 'en.vtt'}],
+        }
+        self.assertEqual(select_track(tracks, ['en', 'de'])['url'], 'en.vtt')
+        self.assertEqual(select_track(tracks, ['de'])['url'], 'de.vtt')
+        self.assertIsNone(select_track(tracks, ['fr']))
+
+
+@override_settings(QUIZ_CAPTIONS_ENABLED=True, QUIZ_CAPTION_LANGUAGES=['en'], TRANSCRIPT_CACHE_ENABLED=True)
+class CaptionPipelineTests(TestCase):
+    """The pipeline uses captions when possible and Whisper otherwise."""
+
+    url = "https://www.youtube.com/watch?v=_dQYvRM9zNY"
+
+    @patch('quiz_app.api.utils.generate_quiz_json', side_effect=lambda text: {"title": text})
+    @patch('quiz_app.api.utils.transcribe_audio')
+    @patch('quiz_app.api.utils.load_audio')
+    @patch('quiz_app.api.utils.fetch_captions', return_value="caption transcript")
+    def test_captions_skip_whisper(self, mock_captions, mock_load, mock_transcribe, mock_generate):
+        for _ in range(2):
+            quiz_json = generate_quiz_json_from_url(self.url)
+
+            self.assertEqual(quiz_json['title'], "caption transcript")
+            self.assertEqual(quiz_json['transcript_source'], Quiz.TRANSCRIPT_SOURCE_CAPTIONS)
+        # The second run is served from the transcript cache.
+        mock_captions.assert_called_once()
+        mock_load.assert_not_called()
+        mock_transcribe.assert_not_called()
+
+
+    @patch('quiz_app.api.utils.generate_quiz_json', side_effect=lambda text: {"title": text})
+    @patch('quiz_app.api.utils.fetch_captions', side_effect=["english transcript", "german transcript"])
+    def test_cache_keyed_by_languages(self, mock_captions, mock_generate):
+        english = generate_quiz_json_from_url(self.url)
+        with self.settings(QUIZ_CAPTION_LANGUAGES=['de']):
+            german = generate_quiz_json_from_url(self.url)
+
+        self.assertEqual(english['title'], "english transcript")
+        self.assertEqual(german['title'], "german transcript")
+        self.assertEqual(mock_captions.call_count, 2)
+
+
+    @patch('quiz_app.api.utils.generate_quiz_json', side_effect=lambda text: {"title": text})
+    @patch('quiz_app.api.utils.transcribe_audio', return_value="whisper transcript")
+    @patch('quiz_app.api.utils.load_audio')
+    @patch('quiz_app.api.utils.fetch_captions', return_value=None)
+    def test_falls_back_to_whisper(self, mock_captions, mock_load, mock_transcribe, mock_generate):
+        quiz_json = generate_quiz_json_from_url(self.url)
+
+        self.assertEqual(quiz_json['title'], "whisper transcript")
+        self.assertEqual(quiz_json['transcript_source'], Quiz.TRANSCRIPT_SOURCE_WHISPER)
+        mock_transcribe.assert_called_once()
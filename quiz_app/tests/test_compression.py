@@ -0,0 +1,135 @@
+"""Tests for the fast JSON renderer and response compression."""
+
+import gzip
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import brotli
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from core import middleware
+from core.middleware import negotiate_encoding
+from quiz_app.api import renderers
+from quiz_app.api.renderers import FastJSONRenderer
+from quiz_app.models import Quiz
+from quiz_app.seeding import seed_quizzes
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    """The fast renderer's bytes equal DRF's JSONRenderer."""
+
+    DATA = {
+        'title': "Zellbiologie \u2013 Grundlagen\u2028line\u2029",
+        'created_at': datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+        'score': Decimal('1.50'),
+        'options': ["A", "B", 3, 4.5, None, True],
+        1: {'nested': []},
+    }
+
+    def test_same_output_as_drf(self):
+        self.assertEqual(FastJSONRenderer().render(self.DATA), JSONRenderer().render(self.DATA))
+
+
+    def test_indented_output_uses_drf(self):
+        media_type = 'application/json; indent=4'
+
+        self.assertEqual(
+            FastJSONRenderer().render(self.DATA, media_type), JSONRenderer().render(self.DATA, media_type)
+        )
+
+
+    def test_works_without_orjson(self):
+        with patch.object(renderers, 'orjson', None):
+            self.assertEqual(FastJSONRenderer().render(self.DATA), JSONRenderer().render(self.DATA))
+
+
+class NegotiateEncodingTests(SimpleTestCase):
+    """Brotli is preferred unless the client ranks gzip higher."""
+
+    def test_negotiation(self):
+        cases = {
+            '': None,
+            'identity': None,
+            'gzip, deflate': 'gzip',
+            'gzip, deflate, br': 'br',
+            'br;q=0.5, gzip': 'gzip',
+            'br;q=0, gzip;q=0': None,
+            '*': 'br',
+            'gzip;q=0, *': 'br',
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(negotiate_encoding(header), expected)
+
+
+class CompressionMiddlewareTests(APITestCase):
+    """Quiz responses are compressed for clients that accept it."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, = seed_quizzes(1, 3, prefix='compress')
+        cls.quiz = Quiz.objects.filter(creator=cls.user).first()
+        cls.detail_url = reverse('quizzes-detail', kwargs={'pk': cls.quiz.pk})
+
+
+    def setUp(self):
+        cache.clear()
+        middleware.reset_compressed_cache()
+        self.client.force_authenticate(user=self.user)
+
+
+    def test_brotli(self):
+        plain = self.client.get(reverse('quizzes-list'))
+
+        response = self.client.get(reverse('quizzes-list'), HTTP_ACCEPT_ENCODING='gzip, br')
+
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), plain.content)
+        self.assertLess(len(response.content), len(plain.content) / 3)
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+
+    def test_gzip(self):
+        plain = self.client.get(reverse('quizzes-list'))
+
+        response = self.client.get(reverse('quizzes-list'), HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+
+
+    def test_small_responses_not_compressed(self):
+        with self.settings(RESPONSE_COMPRESSION_MIN_BYTES=10 ** 6):
+            response = self.client.get(reverse('quizzes-list'), HTTP_ACCEPT_ENCODING='br')
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+
+    def test_repeated_payload_compressed_once(self):
+        with patch('core.middleware._compress', wraps=middleware._compress) as compress:
+            first = self.client.get(reverse('quizzes-list'), HTTP_ACCEPT_ENCODING='br')
+            second = self.client.get(reverse('quizzes-list'), HTTP_ACCEPT_ENCODING='br')
+
+        self.assertEqual(compress.call_count, 1)
+        self.assertEqual(first.content, second.content)
+
+
+    def test_etags_keep_working(self):
+        etag = self.client.get(self.detail_url, HTTP_ACCEPT_ENCODING='br')['ETag']
+        self.assertTrue(etag.endswith('-br"'))
+
+        not_modified = self.client.get(self.detail_url, HTTP_ACCEPT_ENCODING='br', HTTP_IF_NONE_MATCH=etag)
+        updated = self.client.patch(
+            self.detail_url, {'title': "Renamed"}, format='json', HTTP_ACCEPT_ENCODING='br', HTTP_IF_MATCH=etag
+        )
+
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified['ETag'], etag)
+        self.assertIn('Accept-Encoding', not_modified['Vary'])
+        self.assertEqual(updated.status_code, status.HTTP_200_OK)
@@ -0,0 +1,168 @@
+"""Tests for ETag / Last-Modified handling of the quiz endpoints."""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.utils import timezone
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from quiz_app.api import conditional
+from quiz_app.models import Question, Quiz
+from quiz_app.seeding import seed_quizzes
+
+
+class ConditionalGetTests(APITestCase):
+    """Unchanged quizzes and lists are answered with 304."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.other_user = seed_quizzes(2, 3, questions_per_quiz=2, prefix='etag')
+        cls.quiz = Quiz.objects.filter(creator=cls.user).first()
+        cls.detail_url = reverse('quizzes-detail', kwargs={'pk': cls.quiz.pk})
+
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(user=self.user)
+
+
+    def test_validators_on_responses(self):
+        for url in (self.detail_url, reverse('quizzes-list')):
+            response = self.client.get(url)
+            self.assertTrue(response['ETag'].startswith('"'))
+            self.assertIn('Last-Modified', response)
+
+
+    def test_not_modified(self):
+        for url in (self.detail_url, reverse('quizzes-list')):
+            etag = self.client.get(url)['ETag']
+
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response['ETag'], etag)
+            self.assertEqual(response.content, b'')
+
+
+    def test_not_modified_without_cache_needs_one_aggregate(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        cache.clear()
+
+        # The response cache version and the ETag aggregate (the user is
+        # force-authenticated, so there is no user lookup).
+        with self.assertNumQueries(2):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.settings(QUIZ_RESPONSE_CACHE_ENABLED=False), self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+    def test_if_modified_since(self):
+        last_modified = self.client.get(self.detail_url)['Last-Modified']
+
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+    def test_etag_changes_with_data(self):
+        detail_etag = self.client.get(self.detail_url)['ETag']
+        list_etag = self.client.get(reverse('quizzes-list'))['ETag']
+        question = Question.objects.filter(quiz=self.quiz).first()
+        question.save()
+        cache.clear()
+
+        self.assertEqual(self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=detail_etag).status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.client.get(reverse('quizzes-list'), HTTP_IF_NONE_MATCH=list_etag).status_code, status.HTTP_200_OK
+        )
+
+
+    def test_list_etag_changes_on_delete(self):
+        list_etag = self.client.get(reverse('quizzes-list'))['ETag']
+        other_quiz = Quiz.objects.filter(creator=self.user).last()
+
+        self.client.delete(reverse('quizzes-detail', kwargs={'pk': other_quiz.pk}))
+
+        response = self.client.get(reverse('quizzes-list'), HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+
+    def test_etag_depends_on_fields(self):
+        full = self.client.get(reverse('quizzes-list'))['ETag']
+        summary = self.client.get(reverse('quizzes-list'), {'fields': 'id,title'})['ETag']
+
+        self.assertNotEqual(full, summary)
+
+
+    def test_other_users_quiz_forbidden_despite_etag(self):
+        etag = self.client.get(self.detail_url)['ETag']
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ConditionalUpdateTests(APITestCase):
+    """``If-Match`` protects PUT/PATCH against lost updates."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, = seed_quizzes(1, 1, questions_per_quiz=2, prefix='ifmatch')
+        cls.quiz = Quiz.objects.get(creator=cls.user)
+        cls.detail_url = reverse('quizzes-detail', kwargs={'pk': cls.quiz.pk})
+
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(user=self.user)
+
+
+    def test_if_match_current(self):
+        etag = self.client.get(self.detail_url)['ETag']
+
+        response = self.client.patch(self.detail_url, {'title': "First"}, format='json', HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(self.client.get(self.detail_url)['ETag'], response['ETag'])
+
+
+    def test_if_match_stale(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        self.client.patch(self.detail_url, {'title': "First"}, format='json', HTTP_IF_MATCH=etag)
+
+        response = self.client.patch(self.detail_url, {'title': "Second"}, format='json', HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(Quiz.objects.get(pk=self.quiz.pk).title, "First")
+
+
+    def test_write_between_check_and_update(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        quiz_state = conditional.quiz_state
+
+        def state_then_concurrent_write(user_id, quiz_pk):
+            state = quiz_state(user_id, quiz_pk)
+            Quiz.objects.filter(pk=quiz_pk).update(title="Concurrent", updated_at=timezone.now())
+            return state
+
+        with patch('quiz_app.api.views.quiz_state', side_effect=state_then_concurrent_write):
+            response = self.client.patch(self.detail_url, {'title': "Late"}, format='json', HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(Quiz.objects.get(pk=self.quiz.pk).title, "Concurrent")
+
+
+    def test_put_if_match_stale(self):
+        response = self.client.put(
+            self.detail_url, {'title': "Put", 'description': "New"}, format='json', HTTP_IF_MATCH='"stale"'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
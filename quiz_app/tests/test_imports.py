@@ -0,0 +1,42 @@
+"""Guard against heavy pipeline dependencies being imported eagerly.
+
+Importing the URL configuration (and with it every view) must not load
+Whisper, torch, yt-dlp, google-genai or tiktoken; they are only needed
+once a process generates a quiz. The check runs in a fresh interpreter
+so modules imported by other tests do not interfere.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+HEAVY_MODULES = ['torch', 'whisper', 'yt_dlp', 'google.genai', 'tiktoken', 'numpy']
+
+IMPORT_SCRIPT = """
+import json, sys
+import django
+django.setup()
+import core.urls
+import quiz_app.api.views, quiz_app.api.jobs
+from django.core.management import load_command_class
+load_command_class('quiz_app', 'run_quiz_workers')
+print(json.dumps(sorted(name for name in %r if name in sys.modules)))
+"""
+
+
+class LazyImportTests(SimpleTestCase):
+    """The web and worker entry points import without the ML stack."""
+
+    def test_views_do_not_import_heavy_modules(self):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='core.settings', WHISPER_PRELOAD='0')
+        result = subprocess.run(
+            [sys.executable, '-c', IMPORT_SCRIPT % HEAVY_MODULES],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True
+        )
+        loaded = json.loads(result.stdout.strip().splitlines()[-1])
+
+        self.assertEqual(loaded, [])
@@ -0,0 +1,118 @@
+"""Tests for asynchronous quiz generation jobs.
+
+Covers enqueueing via ``POST /api/createQuiz/?async=1``, claiming and
+running jobs in a worker loop and reporting job state at
+``/api/jobs/<id>/``.
+"""
+
+from unittest.mock import patch
+
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from quiz_app.api.jobs import JOB_FAILED_MESSAGE, claim_next_job, run_worker
+from quiz_app.models import Quiz, QuizGenerationJob
+
+User = get_user_model()
+
+QUIZ_JSON = {
+    "title": "Sample Quiz Title",
+    "description": "Sample Quiz Description",
+    "questions": [
+        {
+            "question_title": "Sample Question",
+            "question_options": ["Option 1", "Option 2", "Option 3", "Option 4"],
+            "answer": "Option 1"
+        }
+    ]
+}
+
+
+class QuizGenerationJobTests(APITestCase):
+    """Test suite for the background generation workflow."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="username", password='TEST1234')
+        self.user_2 = User.objects.create_user(username="username_2", password='TEST1234')
+        self.url_create = reverse('create-quiz') + '?async=1'
+        self.post_data = {'url': "https://youtu.be/_dQYvRM9zNY"}
+
+
+    def login(self, user=None):
+        """Authenticate the test client as ``user`` (defaults to test user)."""
+        self.client.force_authenticate(user=user or self.user)
+
+
+    def get_job_url(self, pk):
+        return reverse('jobs-detail', kwargs={'pk': pk})
+
+
+    def test_post_async_returns_accepted(self):
+        """An async create request enqueues a job and returns 202."""
+        self.login()
+        response = self.client.post(self.url_create, self.post_data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['status'], QuizGenerationJob.STATUS_PENDING)
+        self.assertEqual(response['Location'], self.get_job_url(response.data['id']))
+        self.assertEqual(response.data['video_url'], "https://www.youtube.com/watch?v=_dQYvRM9zNY")
+        self.assertFalse(Quiz.objects.exists())
+
+
+    @patch('quiz_app.api.jobs.generate_quiz_json_from_url', return_value=QUIZ_JSON)
+    def test_worker_completes_job(self, mock_generate):
+        """A worker runs the pipeline and links the job to the new quiz."""
+        self.login()
+        job_id = self.client.post(self.url_create, self.post_data, format='json').data['id']
+
+        self.assertEqual(run_worker('test-worker', once=True), 1)
+
+        response = self.client.get(self.get_job_url(job_id))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], QuizGenerationJob.STATUS_SUCCEEDED)
+        quiz = Quiz.objects.get(pk=response.data['quiz'])
+        self.assertEqual(quiz.creator, self.user)
+        self.assertEqual(quiz.questions.count(), 1)
+        self.assertTrue(response.data['quiz_url'].endswith(reverse('quizzes-detail', kwargs={'pk': quiz.pk})))
+
+
+    @patch('quiz_app.api.jobs.generate_quiz_json_from_url', side_effect=RuntimeError("download failed"))
+    def test_worker_records_failure(self, mock_generate):
+        """Pipeline errors mark the job as failed; the details are only logged."""
+        self.login()
+        job_id = self.client.post(self.url_create, self.post_data, format='json').data['id']
+
+        with self.assertLogs('quiz_app.api.jobs', level='ERROR') as logs:
+            run_worker('test-worker', once=True)
+
+        response = self.client.get(self.get_job_url(job_id))
+        self.assertEqual(response.data['status'], QuizGenerationJob.STATUS_FAILED)
+        self.assertEqual(response.data['error'], JOB_FAILED_MESSAGE)
+        self.assertIn("download failed", logs.output[0])
+        self.assertIsNone(response.data['quiz_url'])
+
+
+    def test_job_claimed_once(self):
+        """A claimed job is not handed to a second worker."""
+        QuizGenerationJob.objects.create(video_url=self.post_data['url'], creator=self.user)
+
+        job = claim_next_job('worker-1')
+
+        self.assertEqual(job.status, QuizGenerationJob.STATUS_RUNNING)
+        self.assertEqual(job.worker, 'worker-1')
+        self.assertIsNone(claim_next_job('worker-2'))
+
+
+    def test_get_job_fails(self):
+        """Jobs are only visible to their creator."""
+        job = QuizGenerationJob.objects.create(video_url=self.post_data['url'], creator=self.user)
+
+        response = self.client.get(self.get_job_url(job.pk))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.login(self.user_2)
+        response = self.client.get(self.get_job_url(job.pk))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,144 @@
+"""Tests for the shared Gemini client against a local stand-in server."""
+
+import asyncio
+import json
+
+from django.test import SimpleTestCase, override_settings
+
+from benchmarks.llm_server import KEY_FACTS_RESPONSE as KEY_FACTS, QUESTIONS, QUIZ as QUIZ_JSON, StandInGeminiServer
+from quiz_app.api import llm, metrics
+from quiz_app.api.schema import QuizValidationError
+
+
+class GeminiClientTests(SimpleTestCase):
+    """The client is created once, reuses connections and supports async."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        usage = {"promptTokenCount": 120, "candidatesTokenCount": 80}
+        cls.server = StandInGeminiServer(usage=usage, record_requests=True).start()
+
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        super().tearDownClass()
+
+
+    def setUp(self):
+        self.server.reset()
+        overrides = override_settings(
+            GEMINI_BASE_URL=self.server.base_url, GEMINI_API_KEY='test-key', GEMINI_MODEL='gemini-test'
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        llm.reset_clients()
+        self.addCleanup(llm.reset_clients)
+
+
+    def test_generate_quiz_json(self):
+        self.assertEqual(llm.generate_quiz_json("Cells are the basic unit of life."), QUIZ_JSON)
+
+        path, _address, body = self.server.requests[0]
+        self.assertIn('/models/gemini-test:generateContent', path)
+        self.assertIn("Cells are the basic unit of life.", body['contents'][0]['parts'][0]['text'])
+        self.assertEqual(body['generationConfig']['responseMimeType'], 'application/json')
+        self.assertIn('questions', body['generationConfig']['responseSchema']['properties'])
+
+
+    def test_client_and_connection_reused(self):
+        for _ in range(3):
+            llm.generate_quiz_json("transcript")
+
+        self.assertIs(llm.get_client(), llm.get_client())
+        client_addresses = {address for _path, address, _body in self.server.requests}
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(len(client_addresses), 1)
+
+
+    def test_async_generate_quiz_json(self):
+        async def generate_many():
+            return await asyncio.gather(*(llm.agenerate_quiz_json("transcript") for _ in range(3)))
+
+        self.assertEqual(asyncio.run(generate_many()), [QUIZ_JSON] * 3)
+        self.assertEqual(len(self.server.requests), 3)
+
+
+    @override_settings(QUIZ_TRANSCRIPT_TOKEN_BUDGET=50, QUIZ_MAP_CHUNK_TOKENS=40)
+    def test_long_transcript_condensed_before_quiz_prompt(self):
+        transcript = " ".join(f"Sentence number {index} is about cells." for index in range(40))
+
+        with metrics.track_run() as run:
+            self.assertEqual(llm.generate_quiz_json(transcript), QUIZ_JSON)
+
+        prompts = [body['contents'][0]['parts'][0]['text'] for _path, _address, body in self.server.requests]
+        map_prompts, quiz_prompts = prompts[:-1], prompts[-1:]
+        self.assertGreater(len(map_prompts), 1)
+        self.assertTrue(all('key facts' in prompt for prompt in map_prompts))
+        self.assertIn(KEY_FACTS, quiz_prompts[0])
+        self.assertNotIn("Sentence number 39", quiz_prompts[0])
+        self.assertIn('condense', run.stages)
+        # Every request, map phase included, reports 120 prompt tokens.
+        self.assertEqual(run.counters['llm_prompt_tokens'], 120 * len(prompts))
+        self.assertEqual(run.counters['llm_output_tokens'], 80 * len(prompts))
+
+
+    @override_settings(QUIZ_TRANSCRIPT_TOKEN_BUDGET=50, QUIZ_MAP_CHUNK_TOKENS=40)
+    def test_async_long_transcript_condensed(self):
+        transcript = " ".join(f"Sentence number {index} is about cells." for index in range(40))
+
+        self.assertEqual(asyncio.run(llm.agenerate_quiz_json(transcript)), QUIZ_JSON)
+        self.assertGreater(len(self.server.requests), 2)
+
+
+    def test_only_invalid_questions_regenerated(self):
+        broken = dict(QUESTIONS[3], answer="Molecule")
+        quiz = dict(QUIZ_JSON, questions=QUESTIONS[:3] + [broken] + QUESTIONS[4:])
+        replacement = dict(QUESTIONS[3], question_title="Which unit is alive?")
+        self.server.replies.extend([json.dumps(quiz), json.dumps([replacement])])
+
+        with metrics.track_run() as run:
+            result = llm.generate_quiz_json("transcript")
+
+        self.assertEqual(result['questions'], QUESTIONS[:3] + QUESTIONS[4:] + [replacement])
+        self.assertEqual(len(self.server.requests), 2)
+        repair_body = self.server.requests[1][2]
+        repair_prompt = repair_body['contents'][0]['parts'][0]['text']
+        self.assertIn("write 1 new quiz question(s)", repair_prompt)
+        self.assertIn("transcript", repair_prompt)
+        self.assertEqual(repair_body['generationConfig']['responseSchema']['type'], 'ARRAY')
+        self.assertEqual(run.counters['quiz_questions_repaired'], 1)
+
+
+    def test_fenced_reply_accepted(self):
+        self.server.replies.append("```json\n" + json.dumps(QUIZ_JSON) + "\n```")
+
+        self.assertEqual(llm.generate_quiz_json("transcript"), QUIZ_JSON)
+        self.assertEqual(len(self.server.requests), 1)
+
+
+    def test_malformed_quiz_generated_again(self):
+        self.server.replies.append('{"title": "Cells", "questions": [')
+
+        self.assertEqual(llm.generate_quiz_json("transcript"), QUIZ_JSON)
+        self.assertEqual(len(self.server.requests), 2)
+
+
+    @override_settings(QUIZ_REPAIR_ATTEMPTS=1)
+    def test_invalid_output_gives_up(self):
+        self.server.replies.extend(["not json", "still not json"])
+
+        with self.assertRaises(QuizValidationError):
+            llm.generate_quiz_json("transcript")
+        self.assertEqual(len(self.server.requests), 2)
+
+
+    def test_async_repair(self):
+        quiz = dict(QUIZ_JSON, questions=QUESTIONS[:9])
+        replacement = dict(QUESTIONS[0], question_title="Which unit is alive?")
+        self.server.replies.extend([json.dumps(quiz), json.dumps([replacement])])
+
+        result = asyncio.run(llm.agenerate_quiz_json("transcript"))
+
+        self.assertEqual(result['questions'], QUESTIONS[:9] + [replacement])
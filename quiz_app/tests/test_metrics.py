@@ -0,0 +1,99 @@
+"""Tests for pipeline stage metrics and the metrics endpoint."""
+
+import time
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from quiz_app.api import metrics
+
+User = get_user_model()
+
+
+class PipelineMetricsTests(TestCase):
+    """Stages and counters are recorded per run and per process."""
+
+    def setUp(self):
+        metrics.registry.reset()
+        self.addCleanup(metrics.registry.reset)
+
+
+    def test_track_run_collects_stages_and_counters(self):
+        with self.assertLogs('quiz_app.pipeline', level='INFO') as logs:
+            with metrics.track_run(video_url='https://youtu.be/x') as run:
+                with metrics.stage('download'):
+                    time.sleep(0.01)
+                metrics.count('audio_bytes', 1024)
+                metrics.count('audio_bytes', 1024)
+
+        self.assertGreaterEqual(run.stages['download'], 0.01)
+        self.assertEqual(run.counters, {'audio_bytes': 2048})
+        self.assertRegex(run.server_timing(), r'^download;dur=\d+\.\d, total;dur=\d+\.\d$')
+        self.assertIn('"video_url": "https://youtu.be/x"', logs.output[0])
+        self.assertIn('"outcome": "success"', logs.output[0])
+
+
+    def test_prometheus_rendering(self):
+        metrics.registry.observe_stage('transcribe', 3.0)
+        metrics.registry.observe_stage('transcribe', 45.0)
+        with self.assertRaises(RuntimeError), self.assertLogs('quiz_app.pipeline'):
+            with metrics.track_run():
+                metrics.count('llm_prompt_tokens', 500)
+                raise RuntimeError()
+
+        text = metrics.render_prometheus()
+
+        self.assertIn('quizly_pipeline_stage_seconds_bucket{stage="transcribe",le="5"} 1', text)
+        self.assertIn('quizly_pipeline_stage_seconds_bucket{stage="transcribe",le="60"} 2', text)
+        self.assertIn('quizly_pipeline_stage_seconds_bucket{stage="transcribe",le="+Inf"} 2', text)
+        self.assertIn('quizly_pipeline_stage_seconds_sum{stage="transcribe"} 48.000000', text)
+        self.assertIn('quizly_pipeline_runs_total{outcome="error"} 1', text)
+        self.assertIn('quizly_pipeline_llm_prompt_tokens_total 500', text)
+
+
+@override_settings(QUIZ_GENERATION_ASYNC=False)
+@override_settings(METRICS_TOKEN='scrape-token')
+class MetricsEndpointTests(APITestCase):
+    """The metrics endpoint requires the configured bearer token."""
+
+    def test_token_required(self):
+        url = reverse('metrics')
+
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get(url, HTTP_AUTHORIZATION='Bearer wrong')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get(url, HTTP_AUTHORIZATION='Bearer scrape-token')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+    @override_settings(METRICS_TOKEN='')
+    def test_disabled_without_token(self):
+        response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer ')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class CreateQuizTimingTests(APITestCase):
+    """The synchronous create endpoint reports stage timings."""
+
+    @patch('quiz_app.api.views.generate_quiz_json_from_url')
+    def test_server_timing_header(self, mock_generate):
+        mock_generate.return_value = {"title": "Title", "description": "Description", "questions": []}
+        self.client.force_authenticate(User.objects.create_user(username="username", password="TEST1234"))
+
+        with self.assertLogs('quiz_app.pipeline'):
+            response = self.client.post(reverse('create-quiz'), {'url': "https://youtu.be/_dQYvRM9zNY"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertRegex(response['Server-Timing'], r'^persist;dur=[\d.]+, total;dur=[\d.]+$')
+
+        with self.settings(METRICS_TOKEN='scrape-token'):
+            response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer scrape-token')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertIn(b'quizly_pipeline_stage_seconds_count{stage="persist"}', response.content)
@@ -0,0 +1,100 @@
+"""Tests for cursor pagination and sparse fieldsets of the quiz list."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from quiz_app.models import Quiz
+from quiz_app.seeding import seed_quizzes
+
+
+class QuizListPaginationTests(APITestCase):
+    """``page_size``/``cursor`` walk the list in stable keyset pages."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, = seed_quizzes(1, 7, questions_per_quiz=2, prefix='page')
+        cls.quiz_ids = list(Quiz.objects.filter(creator=cls.user).order_by('created_at', 'id').values_list('id', flat=True))
+
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+
+    def test_unpaginated_by_default(self):
+        response = self.client.get(reverse('quizzes-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([quiz['id'] for quiz in response.data], self.quiz_ids)
+
+
+    def test_pages_follow_next_links(self):
+        url, seen = reverse('quizzes-list') + '?page_size=3', []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['results']), 3)
+            seen += [quiz['id'] for quiz in response.data['results']]
+            url = response.data['next']
+
+        self.assertEqual(seen, self.quiz_ids)
+
+
+    def test_deleted_quiz_does_not_shift_pages(self):
+        first = self.client.get(reverse('quizzes-list'), {'page_size': 3})
+        Quiz.objects.filter(pk=self.quiz_ids[0]).delete()
+
+        second = self.client.get(first.data['next'])
+
+        self.assertEqual([quiz['id'] for quiz in second.data['results']], self.quiz_ids[3:6])
+
+
+    def test_page_size_capped(self):
+        with self.settings(QUIZ_LIST_MAX_PAGE_SIZE=2):
+            response = self.client.get(reverse('quizzes-list'), {'page_size': 50})
+
+        self.assertEqual(len(response.data['results']), 2)
+
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('quizzes-list'), {'cursor': 'not-a-cursor'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('cursor', response.data)
+
+
+class QuizListFieldsTests(APITestCase):
+    """``fields``/``include`` select the returned fields and loaded data."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, = seed_quizzes(1, 5, questions_per_quiz=3, prefix='fields')
+
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+
+    def test_summary_fields_skip_questions(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('quizzes-list'), {'fields': 'id,title,created_at'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data[0]), {'id', 'title', 'created_at'})
+        self.assertFalse(any(query['sql'].startswith('SELECT "quiz_app_question"') for query in queries.captured_queries))
+
+
+    def test_include_questions(self):
+        response = self.client.get(reverse('quizzes-list'), {'fields': 'id,title', 'include': 'questions'})
+
+        self.assertEqual(set(response.data[0]), {'id', 'title', 'questions'})
+        self.assertEqual(len(response.data[0]['questions']), 3)
+
+
+    def test_unknown_field_rejected(self):
+        response = self.client.get(reverse('quizzes-list'), {'fields': 'id,password'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('password', str(response.data['fields']))
@@ -0,0 +1,109 @@
+"""Tests for the user cache of ``CookieJWTAuthentication``."""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from quiz_app.api import permissions
+from quiz_app.api.permissions import clear_user_cache
+
+User = get_user_model()
+
+
+class CachedUserLookupTests(APITestCase):
+    """Authenticated users are looked up once per TTL and evicted on changes."""
+
+    def setUp(self):
+        clear_user_cache()
+        self.user = User.objects.create_user(username="cached", password='TEST1234')
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+
+    def get_list(self):
+        return self.client.get(reverse('quizzes-list'), {'updated_since': '2100-01-01T00:00:00Z'})
+
+
+    def user_queries(self, queries):
+        return [query for query in queries.captured_queries if 'FROM "auth_user"' in query['sql']]
+
+
+    def test_user_query_only_once(self):
+        self.get_list()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get_list()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.user_queries(queries), [])
+
+
+    def test_requests_get_separate_copies(self):
+        cache = permissions.get_user_cache()
+        self.get_list()
+        cached = next(iter(cache.values()))
+
+        response = self.get_list()
+
+        self.assertIsNot(response.wsgi_request.user, cached)
+        self.assertEqual(response.wsgi_request.user.pk, self.user.pk)
+
+
+    def test_deactivation_evicts(self):
+        self.get_list()
+
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.get_list().status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+    def test_password_change_revokes_tokens(self):
+        self.get_list()
+
+        self.user.set_password('NEW12345')
+        self.user.save()
+
+        self.assertEqual(self.get_list().status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        self.assertEqual(self.get_list().status_code, status.HTTP_200_OK)
+
+
+    def test_logout_evicts(self):
+        login = self.client.post(reverse('token_obtain_pair'), {'username': "cached", 'password': 'TEST1234'})
+        self.assertEqual(login.status_code, status.HTTP_200_OK)
+        self.get_list()
+        self.assertEqual(len(permissions.get_user_cache()), 1)
+
+        self.client.post(reverse('logout'))
+
+        self.assertEqual(len(permissions.get_user_cache()), 0)
+
+
+    def test_lookup_racing_invalidation_not_stored(self):
+        original = permissions.JWTAuthentication.get_user
+
+        def get_user_then_invalidate(authentication, validated_token):
+            user = original(authentication, validated_token)
+            permissions.invalidate_cached_user(user.pk)
+            return user
+
+        permissions.JWTAuthentication.get_user = get_user_then_invalidate
+        try:
+            self.assertEqual(self.get_list().status_code, status.HTTP_200_OK)
+        finally:
+            permissions.JWTAuthentication.get_user = original
+
+        self.assertEqual(len(permissions.get_user_cache()), 0)
+
+
+    def test_disabled(self):
+        with self.settings(AUTH_USER_CACHE_TTL=0):
+            clear_user_cache()
+            self.get_list()
+
+            self.assertIsNone(permissions.get_user_cache())
+        clear_user_cache()
@@ -0,0 +1,73 @@
+"""Tests for persisting generated quizzes."""
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from quiz_app.api.persistence import save_generated_quiz
+from quiz_app.api.serializers import QuizPostSerializer
+from quiz_app.models import Quiz, Question
+
+User = get_user_model()
+
+QUIZ_JSON = {
+    "title": "Sample Quiz Title",
+    "description": "Sample Quiz Description",
+    "transcript_source": Quiz.TRANSCRIPT_SOURCE_CAPTIONS,
+    "questions": [
+        {
+            "question_title": f"Sample Question {index}",
+            "question_options": ["Option 1", "Option 2", "Option 3", "Option 4"],
+            "answer": "Option 1"
+        }
+        for index in range(10)
+    ]
+}
+
+
+class SaveGeneratedQuizTests(TestCase):
+    """The quiz and its questions are written in bulk, in one transaction."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="username", password='TEST1234')
+
+
+    def test_questions_inserted_in_bulk(self):
+        with CaptureQueriesContext(connection) as queries:
+            quiz, _questions = save_generated_quiz(QUIZ_JSON, "https://www.youtube.com/watch?v=_dQYvRM9zNY", self.user)
+
+        inserts = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith(('INSERT INTO "quiz_app_quiz"', 'INSERT INTO "quiz_app_question"'))
+        ]
+        self.assertEqual(len(inserts), 2)
+        self.assertEqual(quiz.transcript_source, Quiz.TRANSCRIPT_SOURCE_CAPTIONS)
+        self.assertEqual(
+            list(quiz.questions.values_list('question_title', flat=True).order_by('id')),
+            [question['question_title'] for question in QUIZ_JSON['questions']]
+        )
+
+
+    def test_response_built_without_queries(self):
+        quiz, questions = save_generated_quiz(QUIZ_JSON, "https://www.youtube.com/watch?v=_dQYvRM9zNY", self.user)
+
+        with self.assertNumQueries(0):
+            data = QuizPostSerializer(quiz, context={'questions': questions}).data
+
+        self.assertEqual(len(data['questions']), 10)
+        self.assertTrue(all(question['id'] for question in data['questions']))
+        self.assertEqual(data['questions'][0]['created_at'][-1], 'Z')
+        self.assertEqual(QuizPostSerializer(quiz).data['questions'], data['questions'])
+
+
+    def test_failed_question_insert_rolls_back_quiz(self):
+        broken = dict(QUIZ_JSON, questions=QUIZ_JSON['questions'] + [{
+            "question_title": None, "question_options": [], "answer": "Option 1"
+        }])
+
+        with self.assertRaises(IntegrityError):
+            save_generated_quiz(broken, "https://www.youtube.com/watch?v=_dQYvRM9zNY", self.user)
+
+        self.assertFalse(Quiz.objects.exists())
+        self.assertFalse(Question.objects.exists())
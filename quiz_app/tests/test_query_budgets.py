@@ -0,0 +1,132 @@
+"""Query budgets of the quiz read endpoints and data seeding.
+
+The budgets are declared in :mod:`benchmarks.budgets`; an endpoint
+running more queries than its budget fails here.
+"""
+
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from benchmarks.budgets import BUDGET_QUIZZES, QUERY_BUDGETS
+from quiz_app.api.permissions import clear_user_cache
+from quiz_app.models import Quiz, Question
+from quiz_app.seeding import seed_quizzes
+
+
+class QueryBudgetTests(APITestCase):
+    """Read endpoints stay within their declared query budgets."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.other_user = seed_quizzes(2, BUDGET_QUIZZES, prefix='budget')
+        cls.quiz = Quiz.objects.filter(creator=cls.user).first()
+
+
+    def setUp(self):
+        cache.clear()
+        clear_user_cache()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+
+    def assertWithinBudget(self, endpoint, path):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLessEqual(
+            len(queries), QUERY_BUDGETS[endpoint],
+            f"{endpoint} ran {len(queries)} queries, budget is {QUERY_BUDGETS[endpoint]}:\n"
+            + "\n".join(query['sql'] for query in queries.captured_queries)
+        )
+        return response
+
+
+    def test_list_within_budget(self):
+        response = self.assertWithinBudget('quizzes-list', reverse('quizzes-list'))
+        self.assertEqual(len(response.data), BUDGET_QUIZZES)
+
+
+    def test_detail_within_budget(self):
+        response = self.assertWithinBudget('quizzes-detail', reverse('quizzes-detail', kwargs={'pk': self.quiz.pk}))
+        self.assertEqual(len(response.data['questions']), 10)
+
+
+class SeedQuizzesCommandTests(APITestCase):
+    """``seed_quizzes`` bulk-creates users, quizzes and questions."""
+
+    def test_seed_and_reseed(self):
+        call_command('seed_quizzes', users=2, quizzes=3, questions=4, prefix='load', stdout=StringIO())
+        call_command('seed_quizzes', users=2, quizzes=1, questions=4, prefix='load', stdout=StringIO())
+
+        self.assertEqual(Quiz.objects.filter(creator__username__startswith='load-').count(), 8)
+        self.assertEqual(Question.objects.count(), 32)
+        login = self.client.post(reverse('token_obtain_pair'), {'username': 'load-0', 'password': 'seed-password'})
+        self.assertEqual(login.status_code, status.HTTP_200_OK)
+
+
+class ReadViewQueryCountTests(APITestCase):
+    """The quiz views run a fixed number of queries."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.other_user = seed_quizzes(2, 3, prefix='count')
+        cls.quiz = Quiz.objects.filter(creator=cls.user).first()
+
+
+    def setUp(self):
+        cache.clear()
+        clear_user_cache()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+
+    def test_list_queries_independent_of_quiz_count(self):
+        with self.assertNumQueries(5):
+            self.client.get(reverse('quizzes-list'))
+
+        seed_quizzes(1, 20, prefix='count')
+        # The user is cached by now.
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse('quizzes-list'))
+        self.assertEqual(len(response.data), 23)
+
+
+    def test_detail_queries(self):
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse('quizzes-detail', kwargs={'pk': self.quiz.pk}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+    def test_cached_reads(self):
+        for name, kwargs in (('quizzes-list', {}), ('quizzes-detail', {'pk': self.quiz.pk})):
+            first = self.client.get(reverse(name, kwargs=kwargs))
+            # Only the response cache version; the user is cached as well.
+            with self.assertNumQueries(1):
+                second = self.client.get(reverse(name, kwargs=kwargs))
+            self.assertEqual(second.content, first.content)
+
+
+    def test_other_users_quiz_still_forbidden(self):
+        other_quiz = Quiz.objects.filter(creator=self.other_user).first()
+
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse('quizzes-detail', kwargs={'pk': other_quiz.pk}))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+    def test_patch_queries(self):
+        # User lookup, the quiz, the UPDATE, the response cache version
+        # upsert, the questions for the response and the new ETag.
+        with self.assertNumQueries(6):
+            response = self.client.patch(
+                reverse('quizzes-detail', kwargs={'pk': self.quiz.pk}), {'title': "Renamed"}, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['questions']), 10)
@@ -0,0 +1,111 @@
+"""Tests for the cache of serialized quiz responses."""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from quiz_app.api.metrics import registry
+from quiz_app.models import Quiz, QuizCacheVersion
+from quiz_app.seeding import seed_quizzes
+
+QUIZ_JSON = {
+    'title': "New quiz",
+    'description': "Generated",
+    'questions': [
+        {'question_title': f"Q{index}", 'question_options': ["A", "B", "C", "D"], 'answer': "A"}
+        for index in range(10)
+    ],
+}
+
+
+class ResponseCacheTests(APITestCase):
+    """Reads are served from the cache until a write invalidates them."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.other_user = seed_quizzes(2, 2, questions_per_quiz=2, prefix='cache')
+        cls.quiz = Quiz.objects.filter(creator=cls.user).first()
+
+
+    def setUp(self):
+        cache.clear()
+        registry.reset()
+        self.client.force_authenticate(user=self.user)
+
+
+    def list_titles(self):
+        return [quiz['title'] for quiz in self.client.get(reverse('quizzes-list')).data]
+
+
+    def test_hits_and_misses_counted(self):
+        self.client.get(reverse('quizzes-list'))
+        self.client.get(reverse('quizzes-list'))
+        self.client.get(reverse('quizzes-list'), {'fields': 'id'})
+
+        self.assertEqual(registry.counters, {'response_cache_misses': 2, 'response_cache_hits': 1})
+        with self.settings(METRICS_TOKEN='scrape-token'):
+            metrics = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer scrape-token').content.decode()
+        self.assertIn('quizly_pipeline_response_cache_hits_total 1', metrics)
+
+
+    def test_update_invalidates(self):
+        self.list_titles()
+        self.client.get(reverse('quizzes-detail', kwargs={'pk': self.quiz.pk}))
+
+        self.client.patch(reverse('quizzes-detail', kwargs={'pk': self.quiz.pk}), {'title': "Renamed"}, format='json')
+
+        self.assertIn("Renamed", self.list_titles())
+        detail = self.client.get(reverse('quizzes-detail', kwargs={'pk': self.quiz.pk}))
+        self.assertEqual(detail.data['title'], "Renamed")
+
+
+    def test_delete_invalidates(self):
+        self.list_titles()
+        self.client.get(reverse('quizzes-detail', kwargs={'pk': self.quiz.pk}))
+
+        self.client.delete(reverse('quizzes-detail', kwargs={'pk': self.quiz.pk}))
+
+        self.assertEqual(len(self.list_titles()), 1)
+        detail = self.client.get(reverse('quizzes-detail', kwargs={'pk': self.quiz.pk}))
+        self.assertEqual(detail.status_code, status.HTTP_404_NOT_FOUND)
+
+
+    @patch('quiz_app.api.views.generate_quiz_json_from_url', return_value=QUIZ_JSON)
+    def test_creation_invalidates(self, mock_generate):
+        self.list_titles()
+
+        self.client.post(reverse('create-quiz'), {'url': "https://youtu.be/_dQYvRM9zNY"}, format='json')
+
+        self.assertIn("New quiz", self.list_titles())
+
+
+    def test_user_without_version_cached(self):
+        QuizCacheVersion.objects.filter(user=self.user).delete()
+
+        self.client.get(reverse('quizzes-list'))
+        self.client.get(reverse('quizzes-list'))
+
+        self.assertTrue(QuizCacheVersion.objects.filter(user=self.user).exists())
+        self.assertEqual(registry.counters, {'response_cache_misses': 1, 'response_cache_hits': 1})
+
+
+    def test_cache_is_per_user(self):
+        self.client.get(reverse('quizzes-detail', kwargs={'pk': self.quiz.pk}))
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(reverse('quizzes-detail', kwargs={'pk': self.quiz.pk}))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        own_quizzes = self.client.get(reverse('quizzes-list')).data
+        self.assertNotIn(self.quiz.pk, [quiz['id'] for quiz in own_quizzes])
+
+
+    def test_disabled(self):
+        with self.settings(QUIZ_RESPONSE_CACHE_ENABLED=False):
+            self.client.get(reverse('quizzes-list'))
+            self.client.get(reverse('quizzes-list'))
+
+        self.assertEqual(registry.counters, {})
@@ -0,0 +1,62 @@
+"""Tests for the generated quiz schema."""
+
+from django.test import SimpleTestCase
+
+from quiz_app.api.schema import QUESTION_COUNT, QuizValidationError, add_valid_questions, validate_quiz
+
+
+def make_question(index, **overrides):
+    question = {
+        "question_title": f"Question {index}?",
+        "question_options": ["A", "B", "C", "D"],
+        "answer": "A"
+    }
+    question.update(overrides)
+    return question
+
+
+class ValidateQuizTests(SimpleTestCase):
+    """Questions are validated one by one."""
+
+    def test_valid_quiz(self):
+        data = {"title": " Cells ", "description": "About cells.",
+                "questions": [make_question(index) for index in range(QUESTION_COUNT)]}
+
+        quiz, missing = validate_quiz(data)
+
+        self.assertEqual(missing, 0)
+        self.assertEqual(quiz['title'], "Cells")
+        self.assertEqual(len(quiz['questions']), QUESTION_COUNT)
+
+
+    def test_invalid_questions_dropped(self):
+        questions = [make_question(index) for index in range(QUESTION_COUNT)]
+        questions[1] = make_question(1, answer="E")
+        questions[2] = make_question(2, question_options=["A", "B", "C"])
+        questions[3] = make_question(3, question_options=["A", "A", "C", "D"])
+        questions[4] = make_question(0)
+
+        quiz, missing = validate_quiz({"title": "Cells", "description": "", "questions": questions})
+
+        self.assertEqual(missing, 4)
+        self.assertNotIn("Question 1?", [question['question_title'] for question in quiz['questions']])
+
+
+    def test_long_title_shortened(self):
+        quiz, _missing = validate_quiz({"title": "x" * 100, "description": "", "questions": []})
+        self.assertEqual(len(quiz['title']), 63)
+
+
+    def test_unusable_quiz_rejected(self):
+        with self.assertRaises(QuizValidationError):
+            validate_quiz({"description": "", "questions": []})
+        with self.assertRaises(QuizValidationError):
+            validate_quiz({"title": "Cells", "description": "", "questions": "none"})
+
+
+    def test_extra_questions_ignored(self):
+        quiz = {"title": "Cells", "description": "", "questions": []}
+        missing = add_valid_questions(quiz, [make_question(index) for index in range(QUESTION_COUNT + 2)])
+
+        self.assertEqual(missing, 0)
+        self.assertEqual(len(quiz['questions']), QUESTION_COUNT)
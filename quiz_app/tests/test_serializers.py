@@ -0,0 +1,76 @@
+"""The fast read path produces exactly the serializers' output."""
+
+from datetime import datetime, timezone
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from quiz_app.api.serializers import QuizSerializer, format_datetime, quiz_values, serialize_quiz_rows
+from quiz_app.models import Question, Quiz
+from quiz_app.seeding import seed_quizzes
+
+User = get_user_model()
+
+
+class FormatDatetimeTests(TestCase):
+    """``format_datetime`` truncates to milliseconds like the old strftime format."""
+
+    def test_matches_strftime_format(self):
+        for microsecond in (0, 999, 1000, 1500, 499999, 999999):
+            dt = datetime(2025, 1, 2, 3, 4, 5, microsecond, tzinfo=timezone.utc)
+            expected = dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{int(dt.microsecond / 1000):03d}Z"
+
+            self.assertEqual(format_datetime(dt), expected)
+
+
+class FastReadPathTests(APITestCase):
+    """List and detail responses are byte-identical to ``QuizSerializer``."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, = seed_quizzes(1, 4, questions_per_quiz=3, prefix='fast')
+        Question.objects.filter(pk=Question.objects.order_by('id').first().pk).update(
+            created_at=datetime(2025, 1, 2, 3, 4, 5, 999999, tzinfo=timezone.utc)
+        )
+        Quiz.objects.create(title="Empty", description="No questions", video_url="https://youtu.be/x", creator=cls.user)
+
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+
+    def expected(self):
+        quizzes = Quiz.objects.filter(creator=self.user).order_by('created_at', 'id').prefetch_related('questions')
+        return QuizSerializer(quizzes, many=True).data
+
+
+    def test_rows_match_serializer(self):
+        rows = quiz_values(Quiz.objects.filter(creator=self.user).order_by('created_at', 'id'))
+
+        self.assertEqual(JSONRenderer().render(serialize_quiz_rows(rows)), JSONRenderer().render(self.expected()))
+
+
+    def test_list_response_matches_serializer(self):
+        response = self.client.get(reverse('quizzes-list'))
+
+        self.assertEqual(response.content, JSONRenderer().render(self.expected()))
+
+
+    def test_detail_response_matches_serializer(self):
+        quiz = Quiz.objects.filter(creator=self.user).first()
+
+        response = self.client.get(reverse('quizzes-detail', kwargs={'pk': quiz.pk}))
+
+        self.assertEqual(response.content, JSONRenderer().render(QuizSerializer(quiz).data))
+
+
+    def test_sparse_fields_keep_field_order(self):
+        response = self.client.get(reverse('quizzes-list'), {'fields': 'created_at,title,id'})
+
+        expected = [
+            {'id': quiz['id'], 'title': quiz['title'], 'created_at': quiz['created_at']} for quiz in self.expected()
+        ]
+        self.assertEqual(response.content, JSONRenderer().render(expected))
@@ -0,0 +1,120 @@
+"""Tests for incremental sync of the quiz list (``?updated_since=``)."""
+
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from quiz_app.models import Question, Quiz, QuizDeletion
+from quiz_app.seeding import seed_quizzes
+
+
+class QuizSyncTests(APITestCase):
+    """Delta responses contain changed quizzes, tombstones and a watermark."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.other_user = seed_quizzes(2, 3, questions_per_quiz=2, prefix='sync')
+        cls.quizzes = list(Quiz.objects.filter(creator=cls.user).order_by('id'))
+        # Seeded long before the polls, outside the watermark lag.
+        long_ago = timezone.now() - timedelta(hours=1)
+        Quiz.objects.update(updated_at=long_ago)
+        Question.objects.update(updated_at=long_ago)
+
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+
+    def sync(self, since):
+        response = self.client.get(reverse('quizzes-list'), {'updated_since': since})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+
+    def test_nothing_changed(self):
+        watermark = self.sync(timezone.now().isoformat())['watermark']
+
+        data = self.sync(watermark)
+
+        self.assertEqual(data['results'], [])
+        self.assertEqual(data['deleted'], [])
+
+
+    def test_reports_changes_and_deletions(self):
+        watermark = self.sync(timezone.now().isoformat())['watermark']
+        edited, deleted, untouched = self.quizzes
+        self.client.patch(reverse('quizzes-detail', kwargs={'pk': edited.pk}), {'title': "Edited"}, format='json')
+        self.client.delete(reverse('quizzes-detail', kwargs={'pk': deleted.pk}))
+
+        data = self.sync(watermark)
+
+        self.assertEqual([quiz['id'] for quiz in data['results']], [edited.pk])
+        self.assertEqual(data['results'][0]['title'], "Edited")
+        self.assertEqual(data['deleted'], [deleted.pk])
+        self.assertGreater(data['watermark'], watermark)
+
+
+    def test_question_change_marks_quiz_changed(self):
+        watermark = self.sync(timezone.now().isoformat())['watermark']
+        question = Question.objects.filter(quiz=self.quizzes[2]).first()
+        question.answer = question.question_options[1]
+        question.save()
+
+        data = self.sync(watermark)
+
+        self.assertEqual([quiz['id'] for quiz in data['results']], [self.quizzes[2].pk])
+
+
+    def test_other_users_changes_hidden(self):
+        watermark = self.sync(timezone.now().isoformat())['watermark']
+        self.client.force_authenticate(user=self.other_user)
+        other_quiz = Quiz.objects.filter(creator=self.other_user).first()
+        self.client.delete(reverse('quizzes-detail', kwargs={'pk': other_quiz.pk}))
+        self.client.force_authenticate(user=self.user)
+
+        data = self.sync(watermark)
+
+        self.assertEqual(data['results'], [])
+        self.assertEqual(data['deleted'], [])
+
+
+    def test_write_committed_after_poll(self):
+        # Stamped before the poll but only visible once it has run.
+        stamped = timezone.now()
+        watermark = self.sync(timezone.now().isoformat())['watermark']
+        edited, deleted, _ = self.quizzes
+        Quiz.objects.filter(pk=edited.pk).update(title="Late commit", updated_at=stamped)
+        QuizDeletion.objects.create(quiz_id=deleted.pk, creator=self.user, deleted_at=stamped)
+        Quiz.objects.filter(pk=deleted.pk).delete()
+
+        data = self.sync(watermark)
+
+        self.assertEqual([quiz['id'] for quiz in data['results']], [edited.pk])
+        self.assertEqual(data['deleted'], [deleted.pk])
+
+
+    def test_invalid_timestamp(self):
+        response = self.client.get(reverse('quizzes-list'), {'updated_since': 'yesterday'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+    def test_expired_watermark(self):
+        with self.settings(QUIZ_SYNC_TOMBSTONE_MAX_AGE=60):
+            since = (timezone.now() - timedelta(minutes=5)).isoformat()
+            response = self.client.get(reverse('quizzes-list'), {'updated_since': since})
+
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+
+    def test_old_tombstones_pruned(self):
+        QuizDeletion.objects.create(
+            quiz_id=999, creator=self.user, deleted_at=timezone.now() - timedelta(days=365)
+        )
+
+        self.client.delete(reverse('quizzes-detail', kwargs={'pk': self.quizzes[0].pk}))
+
+        self.assertEqual(list(QuizDeletion.objects.values_list('quiz_id', flat=True)), [self.quizzes[0].pk])
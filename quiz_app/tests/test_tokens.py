@@ -0,0 +1,65 @@
+"""Tests for transcript token counting, normalization and splitting."""
+
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from quiz_app.api import tokens
+
+
+class NormalizeTranscriptTests(SimpleTestCase):
+    """Filler words and repeated sentences are removed."""
+
+    def test_filler_words_removed(self):
+        text = "Um, so cells are, uh, the basic unit of life. Mhm, hmm, they divide."
+        self.assertEqual(
+            tokens.normalize_transcript(text),
+            "So cells are, the basic unit of life. They divide."
+        )
+
+
+    def test_phrases_used_as_content_kept(self):
+        text = "Do you know the answer? What I mean by entropy is disorder."
+        self.assertEqual(tokens.normalize_transcript(text), text)
+
+
+    def test_words_containing_fillers_kept(self):
+        text = "The human umbrella was hummed."
+        self.assertEqual(tokens.normalize_transcript(text), text)
+
+
+    def test_repeated_sentences_removed(self):
+        text = "Thanks for watching. Thanks for watching!\nThanks for watching. Cells divide."
+        self.assertEqual(tokens.normalize_transcript(text), "Thanks for watching. Cells divide.")
+
+
+class SplitByTokensTests(SimpleTestCase):
+    """Chunks respect the token limit and sentence boundaries."""
+
+    def test_chunks_within_limit(self):
+        text = " ".join(f"Sentence number {index} is here." for index in range(50))
+
+        chunks = tokens.split_by_tokens(text, 30)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(tokens.count_tokens(chunk) <= 30 for chunk in chunks))
+        self.assertTrue(all(chunk.endswith(".") for chunk in chunks))
+        self.assertEqual(" ".join(chunks), text)
+
+
+    def test_long_sentence_split_by_words(self):
+        text = " ".join(["word"] * 500) + "."
+
+        chunks = tokens.split_by_tokens(text, 40)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(tokens.count_tokens(chunk) <= 40 for chunk in chunks))
+        self.assertEqual(" ".join(chunks), text)
+
+
+class CountTokensTests(SimpleTestCase):
+    """Counting falls back to an estimate without the encoding."""
+
+    def test_estimate_without_encoding(self):
+        with patch.object(tokens, 'get_encoding', return_value=None):
+            self.assertEqual(tokens.count_tokens("a" * 10), 3)
@@ -0,0 +1,91 @@
+"""Tests for the transcript cache and YouTube video id extraction."""
+
+import random
+import string
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from quiz_app.api.transcript_cache import get_cached_transcript, store_transcript
+from quiz_app.api.utils import extract_video_id, generate_quiz_json_from_url
+from quiz_app.models import TranscriptCacheEntry
+
+
+class ExtractVideoIdTests(TestCase):
+    """Video ids are extracted from all common YouTube URL shapes."""
+
+    def test_supported_urls(self):
+        cases = [
+            "https://www.youtube.com/watch?v=_dQYvRM9zNY",
+            "https://www.youtube.com/watch?feature=share&v=_dQYvRM9zNY",
+            "https://youtu.be/_dQYvRM9zNY?si=mCT_gsc0qQmdgPpp",
+            "https://m.youtube.com/shorts/_dQYvRM9zNY",
+            "https://www.youtube.com/embed/_dQYvRM9zNY",
+        ]
+        for url in cases:
+            with self.subTest(url=url):
+                self.assertEqual(extract_video_id(url), "_dQYvRM9zNY")
+
+
+    def test_unsupported_urls(self):
+        for url in ["https://www.youtube.com/", "https://example.com/watch?v=_dQYvRM9zNY", "https://youtu.be/short"]:
+            with self.subTest(url=url):
+                self.assertIsNone(extract_video_id(url))
+
+
+@override_settings(
+    TRANSCRIPT_CACHE_ENABLED=True,
+    TRANSCRIPT_CACHE_MAX_BYTES=10_000,
+    TRANSCRIPT_CACHE_MAX_AGE=3600,
+    WHISPER_MODEL='tiny'
+)
+class TranscriptCacheTests(TestCase):
+    """Cache hits, expiry and LRU eviction."""
+
+    def test_round_trip(self):
+        store_transcript("abcdefghijk", "tiny", "Hello world " * 100)
+
+        self.assertEqual(get_cached_transcript("abcdefghijk", "tiny"), "Hello world " * 100)
+        self.assertIsNone(get_cached_transcript("abcdefghijk", "base"))
+        entry = TranscriptCacheEntry.objects.get()
+        self.assertLess(entry.size, len("Hello world " * 100))
+
+
+    def test_expired_entries_miss(self):
+        store_transcript("abcdefghijk", "tiny", "old transcript")
+        TranscriptCacheEntry.objects.update(created_at=timezone.now() - timedelta(hours=2))
+
+        self.assertIsNone(get_cached_transcript("abcdefghijk", "tiny"))
+
+
+    def test_least_recently_used_evicted_first(self):
+        """Storing past the size limit drops the entries used longest ago."""
+        # Random-looking text so zlib cannot shrink it below the limit.
+        rng = random.Random(0)
+        text = "".join(rng.choice(string.ascii_letters) for _ in range(6000))
+        store_transcript("aaaaaaaaaaa", "tiny", text)
+        store_transcript("bbbbbbbbbbb", "tiny", text)
+        TranscriptCacheEntry.objects.filter(video_id="bbbbbbbbbbb").update(
+            last_used_at=timezone.now() - timedelta(minutes=10)
+        )
+
+        store_transcript("ccccccccccc", "tiny", text)
+
+        remaining = set(TranscriptCacheEntry.objects.values_list('video_id', flat=True))
+        self.assertNotIn("bbbbbbbbbbb", remaining)
+        self.assertIn("ccccccccccc", remaining)
+
+
+    @patch('quiz_app.api.utils.generate_quiz_json', return_value={"title": "t"})
+    @patch('quiz_app.api.utils.transcribe_audio')
+    @patch('quiz_app.api.utils.download_audio')
+    def test_hit_skips_download_and_transcription(self, mock_download, mock_transcribe, mock_generate):
+        store_transcript("_dQYvRM9zNY", "tiny", "Cached transcript")
+
+        generate_quiz_json_from_url("https://www.youtube.com/watch?v=_dQYvRM9zNY")
+
+        mock_download.assert_not_called()
+        mock_transcribe.assert_not_called()
+        mock_generate.assert_called_once_with("Cached transcript")
@@ -0,0 +1,76 @@
+"""Tests for chunked parallel transcription of long audio."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+from django.test import SimpleTestCase, override_settings
+
+from quiz_app.api.audio import SAMPLE_RATE
+from quiz_app.api.transcription import plan_chunks, stitch_segments, transcribe_chunked
+
+
+def make_audio(seconds, silences=()):
+    """Return audio whose level encodes the second, with silent gaps.
+
+    Second ``s`` has the constant level ``0.1 + s / 1000``; each second
+    listed in ``silences`` is silent in its first half.
+    """
+    levels = 0.1 + np.arange(seconds, dtype=np.float32) / 1000
+    audio = np.repeat(levels, SAMPLE_RATE).astype(np.float32)
+    for second in silences:
+        audio[second * SAMPLE_RATE:second * SAMPLE_RATE + SAMPLE_RATE // 2] = 0.0
+    return audio
+
+
+def fake_transcribe_chunk(samples):
+    """Return one segment per full second, labelled with its absolute second."""
+    segments = []
+    for second in range(len(samples) // SAMPLE_RATE):
+        level = samples[(second + 1) * SAMPLE_RATE - 1]
+        segments.append({'start': second, 'end': second + 1, 'text': f" s{round((level - 0.1) * 1000)}"})
+    return segments
+
+
+class ChunkPlanningTests(SimpleTestCase):
+    """Chunks are cut at silences and overlap their neighbours."""
+
+    def test_cuts_at_silence(self):
+        audio = make_audio(100, silences=(27, 58, 83))
+
+        plan = plan_chunks(audio, chunk_seconds=30, overlap_seconds=2, search_seconds=5)
+
+        cuts = [own_start / SAMPLE_RATE for _start, _end, own_start, _own_end in plan]
+        self.assertEqual(cuts, [0, 27, 58, 83])
+        self.assertEqual(plan[1][0], 25 * SAMPLE_RATE)
+        self.assertEqual(plan[1][1], 60 * SAMPLE_RATE)
+        self.assertEqual(plan[-1][3], len(audio))
+
+
+    def test_short_audio_is_one_chunk(self):
+        audio = make_audio(20)
+        self.assertEqual(plan_chunks(audio, 30, 2), [(0, len(audio), 0, len(audio))])
+
+
+    def test_stitch_removes_overlap_duplicates(self):
+        plan = [(0, 12 * SAMPLE_RATE, 0, 10 * SAMPLE_RATE), (8 * SAMPLE_RATE, 20 * SAMPLE_RATE, 10 * SAMPLE_RATE, 20 * SAMPLE_RATE)]
+        results = [
+            [{'start': 0, 'end': 5, 'text': ' one'}, {'start': 5, 'end': 9.5, 'text': ' two'}, {'start': 9.5, 'end': 12, 'text': ' three'}],
+            [{'start': 0, 'end': 2.5, 'text': ' two'}, {'start': 1.5, 'end': 4, 'text': ' three'}, {'start': 4, 'end': 12, 'text': ' four'}],
+        ]
+        self.assertEqual(stitch_segments(results, plan), "one two three four")
+
+
+@override_settings(WHISPER_CHUNK_SECONDS=30, WHISPER_CHUNK_OVERLAP=2)
+class TranscribeChunkedTests(SimpleTestCase):
+    """End-to-end chunked transcription keeps every second exactly once."""
+
+    @patch('quiz_app.api.transcription.transcribe_chunk', side_effect=fake_transcribe_chunk)
+    def test_transcribe_chunked(self, mock_transcribe_chunk):
+        audio = make_audio(100, silences=(27, 58, 83))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            text = transcribe_chunked(audio, executor=executor)
+
+        self.assertEqual(text, " ".join(f"s{second}" for second in range(100)))
+        self.assertEqual(mock_transcribe_chunk.call_count, 4)
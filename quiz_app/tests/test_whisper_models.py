@@ -0,0 +1,73 @@
+"""Tests for the process-wide Whisper model registry and readiness probe."""
+
+from unittest.mock import patch, MagicMock
+
+from django.test import override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from quiz_app.api import whisper_models
+
+
+@override_settings(WHISPER_MODEL='tiny', WHISPER_MODELS=['tiny'], WHISPER_WARMUP=False)
+class WhisperModelRegistryTests(APITestCase):
+    """The registry loads each model once and reports its state."""
+
+    def setUp(self):
+        whisper_models._models.clear()
+        self.addCleanup(whisper_models._models.clear)
+
+
+    @patch('whisper.load_model')
+    def test_model_loaded_once(self, mock_load_model):
+        """Repeated lookups share the same model instance."""
+        mock_load_model.return_value = MagicMock()
+
+        first = whisper_models.get_model()
+        second = whisper_models.get_model('tiny')
+
+        self.assertIs(first, second)
+        mock_load_model.assert_called_once_with('tiny', device='cpu')
+
+
+    @patch('whisper.load_model')
+    def test_warm_up_runs_on_load(self, mock_load_model):
+        """With warm-up enabled the model transcribes once while loading."""
+        model = MagicMock()
+        mock_load_model.return_value = model
+
+        with self.settings(WHISPER_WARMUP=True):
+            whisper_models.get_model()
+
+        model.transcribe.assert_called_once()
+
+
+    @override_settings(WHISPER_PRELOAD=True)
+    @patch('whisper.load_model')
+    def test_readiness_endpoint(self, mock_load_model):
+        """The readiness probe returns 503 until the model is loaded."""
+        mock_load_model.return_value = MagicMock()
+        url = reverse('readiness')
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.data['whisper_models'], {'tiny': False})
+
+        whisper_models.preload_models()
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['ready'])
+
+
+    @override_settings(WHISPER_PRELOAD=False)
+    def test_readiness_without_preload(self):
+        """Without preloading the probe is ready before any model is loaded."""
+        response = self.client.get(reverse('readiness'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['ready'])
+        self.assertFalse(response.data['preload'])
+        self.assertEqual(response.data['whisper_models'], {'tiny': False})
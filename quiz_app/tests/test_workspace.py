@@ -0,0 +1,56 @@
+"""Tests for the per-run pipeline workspaces."""
+
+import threading
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from quiz_app.api import workspace
+from quiz_app.api.utils import generate_quiz_json_from_url
+
+
+@override_settings(QUIZ_WORKSPACE_DIR=None, QUIZ_PIPELINE_CONCURRENCY=2, TRANSCRIPT_CACHE_ENABLED=False,
+                   QUIZ_AUDIO_STREAMING=False, QUIZ_CAPTIONS_ENABLED=False)
+class PipelineWorkspaceTests(TestCase):
+    """Workspaces are private, cleaned up and limited in number."""
+
+    def setUp(self):
+        workspace._slots = None
+        self.addCleanup(setattr, workspace, '_slots', None)
+
+
+    def test_workspaces_are_isolated_and_removed(self):
+        with workspace.pipeline_workspace() as first, workspace.pipeline_workspace() as second:
+            self.assertNotEqual(first, second)
+            self.assertTrue(first.is_dir())
+        self.assertFalse(first.exists())
+        self.assertFalse(second.exists())
+
+
+    @patch('quiz_app.api.utils.transcribe_audio', side_effect=RuntimeError("whisper failed"))
+    @patch('quiz_app.api.utils.download_audio')
+    def test_workspace_removed_on_failure(self, mock_download, mock_transcribe):
+        paths = []
+        mock_download.side_effect = lambda url, filename: (paths.append(filename), open(filename, 'wb').close())
+
+        with self.assertRaises(RuntimeError):
+            generate_quiz_json_from_url("https://www.youtube.com/watch?v=_dQYvRM9zNY")
+
+        self.assertEqual(len(paths), 1)
+        self.assertFalse(workspace.Path(paths[0]).parent.exists())
+
+
+    def test_concurrency_limit(self):
+        """A third run waits until one of the two slots is released."""
+        entered = threading.Event()
+
+        def third_run():
+            with workspace.pipeline_workspace():
+                entered.set()
+
+        with workspace.pipeline_workspace(), workspace.pipeline_workspace():
+            thread = threading.Thread(target=third_run)
+            thread.start()
+            self.assertFalse(entered.wait(0.2))
+        thread.join(timeout=5)
+        self.assertTrue(entered.is_set())
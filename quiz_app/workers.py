@@ -0,0 +1,18 @@
+"""Process entry point for background quiz workers.
+
+Worker processes are started with the ``spawn`` method so they do not
+inherit database connections or loaded models from the parent. This
+module therefore must not import models at import time; Django is set
+up inside the child before the job loop is imported.
+"""
+
+
+def worker_main(worker_name, poll_interval, once):
+    """Set up Django in a fresh process and run the job loop."""
+    import django
+
+    django.setup()
+
+    from quiz_app.api.jobs import run_worker
+
+    run_worker(worker_name, poll_interval=poll_interval, once=once)